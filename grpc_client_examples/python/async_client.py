@@ -0,0 +1,27 @@
+import asyncio
+
+from kedro_grpc_server.client import KedroClient
+
+
+async def run_client(target):
+    async with KedroClient(target) as client:
+        print(await client.list_pipelines())
+
+        # submit runs concurrently over a few shared connections
+        run_ids = await client.run_many(
+            [{"pipeline_name": "de", "params": {"seed": seed}} for seed in range(10)]
+        )
+        print(run_ids)
+
+        # follow one run, the stream resumes if the connection drops
+        async for status in client.status(run_ids[0]):
+            print(status.run_status, list(status.events))
+
+        # or wait for all of them
+        statuses = await asyncio.gather(*map(client.wait, run_ids))
+        print([status.run_status for status in statuses])
+
+
+if __name__ == "__main__":
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(run_client("localhost:50051"))
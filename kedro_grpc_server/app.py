@@ -4,12 +4,48 @@ from typing import Dict
 
 import click
 
-from kedro_grpc_server.grpc_server import grpc_serve
 from kedro_grpc_server.process_manager import ProcessManager
 
 HOST_HELP = """Host which the server will listen to. Defaults to 127.0.0.1."""
 PORT_HELP = """TCP port which the server will listen to. Defaults to 4141."""
 MAX_WORKERS_HELP = """Number of ThreadExecutors to handle RPCs."""
+CONFIG_POLL_INTERVAL_HELP = """Seconds between checks for changes of the project
+configuration, which is then reloaded in the background. 0 disables it."""
+RUN_STORE_HELP = """Path of the SQLite database storing the run history.
+Defaults to logs/runs.db in the project."""
+CACHED_DATASET_HELP = """Catalog entry to load once in the server and share with
+all runs, e.g. a large lookup table. Can be repeated."""
+DATASET_CACHE_SIZE_HELP = """Memory budget of the cached datasets in MB."""
+OUTPUT_RETENTION_HELP = """Seconds the outputs of a run are kept for GetOutputs."""
+PROCESSES_HELP = """Number of server processes sharing the port with SO_REUSEPORT,
+each with max_workers threads. Defaults to 1."""
+TRACE_OUTPUT_HELP = """File to append OTLP/JSON spans of RPCs, runs and nodes to,
+or URL of an OTLP/HTTP traces endpoint. Tracing is disabled if not set."""
+TRACE_SAMPLE_RATIO_HELP = """Share of the traces recorded, from 0 to 1. Traces started
+by clients sending a traceparent follow the client's decision."""
+COALESCE_WINDOW_HELP = """Seconds during which a Run request for the same pipeline,
+tags and parameters as an unfinished run returns that run instead of starting a new
+one. 0 disables it, only requests with the same idempotency key are coalesced."""
+RUN_MEMORY_LIMIT_HELP = """Maximum address space of every run in MB, enforced with
+RLIMIT_AS. Nodes allocating more fail with a MemoryError. 0 for no limit."""
+RUN_TIMEOUT_HELP = """Seconds every run may last before its process is terminated
+and the run marked TimedOut. Runs can set a lower timeout. 0 for no limit."""
+RUN_CPUS_HELP = """Number of cores every run is bound to with sched_setaffinity, and
+sizing the OpenMP and BLAS thread pools of the run. Concurrent runs are given
+disjoint cores while enough are free. Runs can request another number. 0 not to
+bind runs."""
+UDS_HELP = """Path of a Unix domain socket to listen on, alongside the TCP port,
+e.g. for sidecars on the same host. Clients connect to unix:PATH."""
+NO_TCP_HELP = """Only listen on the Unix domain socket set with --uds."""
+CHECKPOINT_DIR_HELP = """Directory the in-memory datasets of runs requesting
+checkpoints are pickled to, so that failed runs can be resumed. Defaults to
+logs/checkpoints in the project."""
+THREAD_PIPELINE_HELP = """Pipeline run on a thread pool of the server instead of a
+process per run, sparing small, I/O bound pipelines the cost of starting a process.
+Runs with a memory limit, a timeout or bound cores still run in a process. Can be
+repeated."""
+RUN_THREADS_HELP = """Number of threads running the runs of --thread_pipeline
+pipelines."""
 
 RUN_STATES = {}  # type: Dict[str, ProcessManager]
 
@@ -28,8 +64,80 @@ def server_commands():
 @click.option("--host", default="127.0.0.1", help=HOST_HELP)
 @click.option("--port", default=50051, type=int, help=PORT_HELP)
 @click.option("--max_workers", default=10, type=int, help=MAX_WORKERS_HELP)
-def grpc_start(host, port, max_workers, wait_term=True):
+@click.option(
+    "--config_poll_interval", default=2.0, type=float, help=CONFIG_POLL_INTERVAL_HELP
+)
+@click.option("--run_store", default=None, help=RUN_STORE_HELP)
+@click.option("--cached_dataset", multiple=True, help=CACHED_DATASET_HELP)
+@click.option(
+    "--dataset_cache_size", default=1024, type=int, help=DATASET_CACHE_SIZE_HELP
+)
+@click.option(
+    "--output_retention", default=3600, type=float, help=OUTPUT_RETENTION_HELP
+)
+@click.option("--processes", default=1, type=int, help=PROCESSES_HELP)
+@click.option("--trace_output", default=None, help=TRACE_OUTPUT_HELP)
+@click.option(
+    "--trace_sample_ratio", default=1.0, type=float, help=TRACE_SAMPLE_RATIO_HELP
+)
+@click.option("--coalesce_window", default=0.0, type=float, help=COALESCE_WINDOW_HELP)
+@click.option("--run_memory_limit", default=0, type=int, help=RUN_MEMORY_LIMIT_HELP)
+@click.option("--run_timeout", default=0.0, type=float, help=RUN_TIMEOUT_HELP)
+@click.option("--run_cpus", default=0, type=int, help=RUN_CPUS_HELP)
+@click.option("--uds", default=None, help=UDS_HELP)
+@click.option("--no_tcp", is_flag=True, help=NO_TCP_HELP)
+@click.option("--checkpoint_dir", default=None, help=CHECKPOINT_DIR_HELP)
+@click.option("--thread_pipeline", multiple=True, help=THREAD_PIPELINE_HELP)
+@click.option("--run_threads", default=4, type=int, help=RUN_THREADS_HELP)
+def grpc_start(  # pylint: disable=too-many-arguments
+    host,
+    port,
+    max_workers,
+    config_poll_interval,
+    run_store,
+    cached_dataset,
+    dataset_cache_size,
+    output_retention,
+    processes,
+    trace_output,
+    trace_sample_ratio,
+    coalesce_window,
+    run_memory_limit,
+    run_timeout,
+    run_cpus,
+    uds,
+    no_tcp,
+    checkpoint_dir,
+    thread_pipeline,
+    run_threads,
+    wait_term=True,
+):
     """Start Kedro gRPC Server"""
+    # deferred, so that other kedro commands don't import grpc and protobuf
+    from kedro_grpc_server.grpc_server import (  # pylint: disable=import-outside-toplevel
+        grpc_serve,
+    )
+
     grpc_serve(
-        host=host, port=port, max_workers=max_workers, wait_term=wait_term
+        host=host,
+        port=port,
+        max_workers=max_workers,
+        wait_term=wait_term,
+        config_poll_interval=config_poll_interval,
+        run_store_path=run_store,
+        cached_datasets=cached_dataset,
+        dataset_cache_size=dataset_cache_size,
+        output_retention=output_retention,
+        processes=processes,
+        trace_output=trace_output,
+        trace_sample_ratio=trace_sample_ratio,
+        coalesce_window=coalesce_window,
+        run_memory_limit=run_memory_limit,
+        run_timeout=run_timeout,
+        run_cpus=run_cpus,
+        tcp=not no_tcp,
+        uds=uds,
+        checkpoint_dir=checkpoint_dir,
+        run_threads=run_threads,
+        thread_pipelines=thread_pipeline,
     )  # pragma: no cover
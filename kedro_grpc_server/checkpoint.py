@@ -0,0 +1,154 @@
+"""Checkpoints of run datasets, and resuming failed runs: resume_plan"""
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Set
+from urllib.parse import quote
+
+from kedro.io import AbstractDataSet, DataSetError
+from kedro.pipeline import Pipeline
+
+try:
+    from kedro.framework.hooks import get_hook_manager, hook_impl
+except ImportError:  # pragma: no cover, kedro < 0.16 has no hooks
+    get_hook_manager = None
+
+    def hook_impl(func):  # pylint: disable=missing-function-docstring
+        return func
+
+
+def write_checkpoint(directory: str, name: str, data: Any) -> str:
+    """
+    Pickle the data of an in-memory dataset to local disk. The file is
+    written under a temporary name and renamed, so a checkpoint is never
+    read half written.
+    :param directory: Checkpoint directory of the run
+    :param name: Dataset name
+    :param data: Saved data
+    :return: Path of the checkpoint
+    """
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    path = os.path.join(directory, quote(name, safe="") + ".pkl")
+    with open(path + ".tmp", "wb") as file:
+        pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(path + ".tmp", path)
+    return path
+
+
+class CheckpointDataSet(AbstractDataSet):
+    """CheckpointDataSet loads the checkpoint of an in-memory dataset saved
+    by a previous run. Checkpoints are read only, they may be restored by
+    several resumed runs."""
+
+    def __init__(self, filepath: str):
+        """
+        Instantiates the dataset
+        :param filepath: Path of the checkpoint
+        """
+        self._filepath = filepath
+
+    def _load(self) -> Any:
+        with open(self._filepath, "rb") as file:
+            return pickle.load(file)
+
+    def _save(self, data: Any) -> None:
+        raise DataSetError(f"Checkpoint {self._filepath} is read only")
+
+    def _exists(self) -> bool:
+        return os.path.exists(self._filepath)
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(filepath=self._filepath)
+
+
+class CheckpointHooks:
+    """CheckpointHooks are Kedro hooks restoring, in a resumed run, the
+    in-memory datasets of the previous run from their checkpoints."""
+
+    def __init__(self, restore: Dict[str, str]):
+        """
+        Instantiates the hooks
+        :param restore: Checkpoint path of every restored dataset
+        """
+        self._restore = restore
+
+    def install(self):
+        """Register the hooks with Kedro, if it supports hooks"""
+        if get_hook_manager is not None:
+            get_hook_manager().register(self)
+
+    @hook_impl
+    def after_catalog_created(  # pylint: disable=missing-function-docstring
+        self, catalog
+    ):
+        for name, path in self._restore.items():
+            catalog.add(name, CheckpointDataSet(path), replace=True)
+
+
+ResumePlan = NamedTuple(
+    "ResumePlan",
+    [
+        ("pipeline", Pipeline),
+        ("skipped_nodes", List[str]),
+        ("restore", Dict[str, str]),
+        ("load_versions", Dict[str, str]),
+        ("datasets", List[Dict[str, str]]),
+    ],
+)
+
+
+def resume_plan(pipeline: Pipeline, datasets: Dict[str, Dict[str, str]]) -> ResumePlan:
+    """
+    Nodes left to run to finish a failed run. The datasets saved by the run
+    are available to the resumed run: persisted datasets are loaded from the
+    catalog, at the version saved by the run, and in-memory datasets from
+    their checkpoint. A node is only run again if one of its outputs isn't
+    available and is a free output of the pipeline or an input of a node run
+    again, or if it has no output at all, so a node whose outputs were saved
+    is never run twice.
+    :param pipeline: Pipeline of the failed run
+    :param datasets: ``version`` and ``checkpoint`` path, empty for
+        persisted datasets, of the datasets saved by the failed run
+    :return: The pipeline left to run, the names of the skipped nodes, the
+        checkpoints and versions of its inputs saved by the failed run, and
+        the saved datasets the resumed run inherits from the failed run
+    :raises ValueError: If every node of the pipeline can be skipped
+    """
+    available = {
+        name
+        for name, dataset in datasets.items()
+        if not dataset["checkpoint"] or os.path.exists(dataset["checkpoint"])
+    }
+    free_outputs = pipeline.outputs()
+    needed = set()  # type: Set[str]
+    nodes = []
+    for node in reversed(pipeline.nodes):  # consumers before producers
+        missing = [name for name in node.outputs if name not in available]
+        if not node.outputs or any(
+            name in needed or name in free_outputs for name in missing
+        ):
+            nodes.append(node)
+            needed.update(node.inputs)
+
+    if not nodes:
+        raise ValueError("No node left to run")
+    remaining = Pipeline(nodes)
+    inputs = remaining.inputs() & available
+    produced = remaining.all_outputs()
+    return ResumePlan(
+        pipeline=remaining,
+        skipped_nodes=[node.name for node in pipeline.nodes if node not in nodes],
+        restore={
+            name: datasets[name]["checkpoint"]
+            for name in inputs
+            if datasets[name]["checkpoint"]
+        },
+        load_versions={
+            name: datasets[name]["version"]
+            for name in inputs
+            if not datasets[name]["checkpoint"] and datasets[name]["version"]
+        },
+        datasets=[
+            dict(datasets[name], name=name) for name in sorted(available - produced)
+        ],
+    )
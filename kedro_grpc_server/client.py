@@ -0,0 +1,246 @@
+"""Asynchronous Python client of the Kedro gRPC Server: KedroClient"""
+import asyncio
+import itertools
+import logging
+import uuid
+from typing import Any, AsyncIterator, Dict, Iterable, List, Sequence, Tuple
+
+import grpc
+
+from kedro_grpc_server.kedro_pb2 import (  # type: ignore
+    PipelineParams,
+    ResumeParams,
+    RunId,
+    RunParams,
+    RunStatus,
+)
+from kedro_grpc_server.kedro_pb2_grpc import KedroStub  # type: ignore
+
+try:
+    from grpc import aio
+except ImportError:  # pragma: no cover, grpcio < 1.32
+    from grpc.experimental import aio
+
+RETRYABLE_CODES = (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED)
+
+
+class ChannelPool:
+    """ChannelPool keeps a fixed number of ``grpc.aio`` channels to the
+    server and hands them out in turn. Every channel is a single HTTP/2
+    connection multiplexing its calls, so a few channels are enough for
+    thousands of concurrent calls, without the cost of a connection per call
+    nor the stream limit of a single connection.
+    """
+
+    def __init__(
+        self, target: str, size: int = 4, options: Sequence[Tuple[str, Any]] = None
+    ):
+        """
+        Instantiates the pool, channels connect on their first call
+        :param target: Server address, e.g. ``localhost:50051``
+        :param size: Number of channels
+        :param options: gRPC channel options
+        """
+        self._channels = [
+            aio.insecure_channel(target, options=options) for _ in range(size)
+        ]
+        self._next = itertools.cycle(self._channels)
+
+    def get(self) -> Any:
+        """
+        Next channel of the pool
+        :return: A ``grpc.aio`` channel
+        """
+        return next(self._next)
+
+    async def close(self):
+        """Close every channel, cancelling their calls"""
+        await asyncio.gather(*(channel.close() for channel in self._channels))
+
+
+class KedroClient:
+    """KedroClient drives a Kedro gRPC Server from ``asyncio`` code. Calls
+    share a pool of channels, give up after ``timeout`` seconds and are
+    retried with exponential backoff when the server is unavailable. Runs are
+    submitted with an idempotency key, so that a retried ``Run`` never starts
+    a second run, and ``Status`` streams resume from the last received
+    sequence after a dropped connection.
+
+    ::
+
+        async with KedroClient("localhost:50051") as client:
+            run_ids = await client.run_many([{"pipeline_name": "de"}] * 100)
+            statuses = await asyncio.gather(*map(client.wait, run_ids))
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        target: str = "localhost:50051",
+        pool_size: int = 4,
+        timeout: float = 30.0,
+        max_retries: int = 5,
+        backoff: float = 0.5,
+        max_concurrency: int = 100,
+        options: Sequence[Tuple[str, Any]] = None,
+    ):
+        """
+        Instantiates the client
+        :param target: Server address
+        :param pool_size: Number of channels to the server
+        :param timeout: Deadline of unary calls in seconds
+        :param max_retries: Attempts of a call after its first failure
+        :param backoff: Seconds before the first retry, doubled every retry
+        :param max_concurrency: Maximum number of ``Run`` calls in flight in
+            ``run_many``
+        :param options: gRPC channel options
+        """
+        self._pool = ChannelPool(target, pool_size, options)
+        self._stubs = {}  # type: Dict[int, KedroStub]
+        self._timeout = timeout
+        self._max_retries = max_retries
+        self._backoff = backoff
+        self._max_concurrency = max_concurrency
+
+    async def __aenter__(self) -> "KedroClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the channels of the client"""
+        await self._pool.close()
+
+    def _stub(self) -> KedroStub:
+        channel = self._pool.get()
+        stub = self._stubs.get(id(channel))
+        if stub is None:
+            stub = self._stubs[id(channel)] = KedroStub(channel)
+        return stub
+
+    async def _retry_delay(self, attempt: int, exc: grpc.RpcError):
+        """Wait before retrying a failed call, or raise its error"""
+        if exc.code() not in RETRYABLE_CODES or attempt >= self._max_retries:
+            raise exc
+        delay = self._backoff * 2 ** attempt
+        logging.warning("Retrying in %.1fs after %s", delay, exc.code())
+        await asyncio.sleep(delay)
+
+    async def _call(self, method: str, request: Any) -> Any:
+        for attempt in itertools.count():
+            try:
+                return await getattr(self._stub(), method)(
+                    request, timeout=self._timeout
+                )
+            except grpc.RpcError as exc:
+                await self._retry_delay(attempt, exc)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def list_pipelines(self) -> List[str]:
+        """
+        List the pipelines of the project
+        :return: Pipeline names
+        """
+        response = await self._call("ListPipelines", PipelineParams())
+        return list(response.pipeline)
+
+    async def run(
+        self,
+        pipeline_name: str = "",
+        params: Dict[str, Any] = None,
+        idempotency_key: str = None,
+        **fields: Any,
+    ) -> str:
+        """
+        Start a run
+        :param pipeline_name: Pipeline to run, the default pipeline if empty
+        :param params: Parameter overrides of the run
+        :param idempotency_key: Key making retries of this call start a
+            single run, a random one by default
+        :param fields: Other ``RunParams`` fields, e.g. ``tags`` or ``runner``
+        :return: Run ID, of an identical pending run if the request was
+            coalesced
+        """
+        request = RunParams(
+            pipeline_name=pipeline_name,
+            idempotency_key=idempotency_key or str(uuid.uuid4()),
+            **fields,
+        )
+        if params:
+            request.params.update(params)  # pylint: disable=no-member
+        response = await self._call("Run", request)
+        return response.run_id
+
+    async def resume(self, run_id: str) -> str:
+        """
+        Resume a failed run, running again only the nodes whose outputs it
+        didn't save. Retries of this call are coalesced into the same run.
+        :param run_id: Run ID of the failed run
+        :return: Run ID of the resumed run
+        """
+        response = await self._call("Resume", ResumeParams(run_id=run_id))
+        return response.run_id
+
+    async def run_many(self, runs: Iterable[Dict[str, Any]]) -> List[str]:
+        """
+        Start many runs concurrently, at most ``max_concurrency`` calls at once
+        :param runs: Keyword arguments of ``run`` for each run
+        :return: Run IDs, in the order of ``runs``
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _run(kwargs: Dict[str, Any]) -> str:
+            async with semaphore:
+                return await self.run(**kwargs)
+
+        return list(await asyncio.gather(*(_run(kwargs) for kwargs in runs)))
+
+    async def status(
+        self,
+        run_id: str,
+        since_sequence: int = 0,
+        timeout: float = None,
+        **filters: Any,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream the status and events of a run until it finishes, reconnecting
+        and resuming from the last received sequence if the stream breaks
+        :param run_id: Run ID
+        :param since_sequence: Number of events already received
+        :param timeout: Seconds to follow the run for, until it finishes by
+            default
+        :param filters: Event filters of ``RunId``, e.g. ``min_level``
+        :return: Asynchronous iterator of ``RunStatus`` messages
+        :raises grpc.RpcError: ``DEADLINE_EXCEEDED`` if the run didn't finish
+            in time, or the error of the last attempt
+        """
+        loop = asyncio.get_event_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        attempt = 0
+        while True:
+            request = RunId(run_id=run_id, since_sequence=since_sequence, **filters)
+            remaining = None if deadline is None else deadline - loop.time()
+            try:
+                async for response in self._stub().Status(request, timeout=remaining):
+                    attempt = 0
+                    since_sequence = max(since_sequence, response.sequence)
+                    yield response
+                return
+            except grpc.RpcError as exc:
+                if deadline is not None and loop.time() >= deadline:
+                    raise
+                await self._retry_delay(attempt, exc)
+                attempt += 1
+
+    async def wait(self, run_id: str, **filters: Any) -> Any:
+        """
+        Wait for a run to finish
+        :param run_id: Run ID
+        :param filters: ``timeout`` and event filters of ``status``
+        :return: The last ``RunStatus`` of the run, with every received event and
+            node usage
+        """
+        result = RunStatus(run_id=run_id)
+        async for response in self.status(run_id, **filters):
+            result.MergeFrom(response)  # appends events and node usage
+        return result
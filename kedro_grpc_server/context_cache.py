@@ -0,0 +1,207 @@
+"""Server-wide cache of parsed Kedro project configuration: ConfigCache"""
+import logging
+import os
+import threading
+import time
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def merge_params(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep merge runtime parameter overrides over the project parameters.
+
+    Nested dictionaries are merged key by key, any other value is replaced.
+    ``google.protobuf.Struct`` only carries doubles, so an integral float
+    overriding an integer parameter is cast back to ``int``.
+
+    Args:
+        base: Parameters loaded from the project configuration.
+        overrides: Parameters sent by the client.
+
+    Returns:
+        A new dictionary, neither argument is modified.
+    """
+    merged = deepcopy(base)
+    for key, value in overrides.items():
+        current = merged.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            merged[key] = merge_params(current, value)
+        elif (
+            isinstance(current, int)
+            and not isinstance(current, bool)
+            and isinstance(value, float)
+            and value.is_integer()
+        ):
+            merged[key] = int(value)
+        else:
+            merged[key] = deepcopy(value)
+    return merged
+
+
+class ConfigCache:
+    """ConfigCache memoizes ``ConfigLoader.get`` results and the project
+    ``DataCatalog`` for the lifetime of the server. Every cached entry is
+    dropped as soon as a file under the project ``conf`` directory is added,
+    removed or modified.
+    """
+
+    def __init__(self, context: Any):
+        """
+        Instantiates the config cache
+        :param context: Project context to load configuration and catalog from
+        """
+        self._context = context
+        self._conf_root = Path(context.project_path) / context.CONF_ROOT
+        self._create_loader = context._get_config_loader
+        self._loader = None  # type: Any
+        self._configs = {}  # type: Dict[Tuple[str, ...], Any]
+        self._catalog = None  # type: Any
+        self._mtimes = None  # type: Any
+        self._listeners = []  # type: List[Callable[[], Any]]
+        self._pid = os.getpid()
+        self._rlock = threading.RLock()
+
+    @property
+    def lock(self) -> Any:
+        """
+        Lock guarding the cached entries. Hold it while forking a run process
+        so that the child never inherits a half-built cache. The lock is
+        re-created in the child since the thread owning it doesn't exist there.
+        """
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._rlock = threading.RLock()
+        return self._rlock
+
+    def install(self, context: Any):
+        """
+        Make ``context.config_loader`` return this cache, so that any
+        configuration read by the context, including the per run catalog and
+        parameters, is served from memory.
+        :param context: Project context to patch
+        """
+        context._get_config_loader = lambda: self  # pylint: disable=protected-access
+
+    def add_listener(self, callback: Callable[[], Any]):
+        """
+        Register a callback invoked whenever the configuration changed
+        :param callback: Callable without arguments
+        """
+        self._listeners.append(callback)
+
+    def refresh(self) -> bool:
+        """
+        Drop cached entries if the configuration changed on disk
+        :return: Whether the cache was invalidated
+        """
+        with self.lock:
+            return self._invalidate_if_changed()
+
+    def get(self, *patterns: str) -> Any:
+        """
+        Drop-in replacement for ``ConfigLoader.get``
+        :param patterns: Glob patterns of the config files to load
+        :return: A copy of the merged configuration
+        """
+        with self.lock:
+            self._invalidate_if_changed()
+            if patterns not in self._configs:
+                if self._loader is None:
+                    self._loader = self._create_loader()
+                self._configs[patterns] = self._loader.get(*patterns)
+            return deepcopy(self._configs[patterns])
+
+    @property
+    def catalog(self) -> Any:
+        """The project catalog, built once per configuration version"""
+        with self.lock:
+            self._invalidate_if_changed()
+            if self._catalog is None:
+                self._catalog = self._context.catalog
+            return self._catalog
+
+    def warm(self) -> bool:
+        """
+        Load the pipelines, parameters and catalog so that run processes
+        inherit a populated cache and already imported dataset classes.
+        Building the catalog also validates the catalog configuration.
+        Failures are only logged, the run will surface them again with the
+        full Kedro error.
+        :return: Whether the project configuration loaded successfully
+        """
+        start = time.time()
+        try:
+            self._context.pipelines  # pylint: disable=pointless-statement
+            self._context.params  # pylint: disable=pointless-statement
+            catalog = self.catalog
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.warning("Could not preload project configuration: %s", exc)
+            return False
+        logging.info(
+            "Loaded %d catalog entries in %.2fs",
+            len(catalog.list()),
+            time.time() - start,
+        )
+        return True
+
+    def __getattr__(self, name: str) -> Any:
+        # anything else, e.g. `conf_paths`, is answered by the real loader
+        if name.startswith("_"):
+            raise AttributeError(name)
+        with self.lock:
+            if self._loader is None:
+                self._loader = self._create_loader()
+            return getattr(self._loader, name)
+
+    def _invalidate_if_changed(self) -> bool:
+        mtimes = self._config_mtimes()
+        if mtimes == self._mtimes:
+            return False
+        self._loader = None
+        self._configs = {}
+        self._catalog = None
+        if self._mtimes is not None:
+            logging.info("Project configuration changed, reloading")
+            for callback in self._listeners:
+                callback()
+        self._mtimes = mtimes
+        return True
+
+    def _config_mtimes(self) -> Tuple[Tuple[str, int], ...]:
+        mtimes = []
+        for root, _, files in os.walk(str(self._conf_root)):
+            for file_name in files:
+                path = os.path.join(root, file_name)
+                try:
+                    mtimes.append((path, os.stat(path).st_mtime_ns))
+                except FileNotFoundError:  # pragma: no cover
+                    continue
+        return tuple(sorted(mtimes))
+
+
+class ConfigWatcher(threading.Thread):
+    """ConfigWatcher polls the project configuration in the background and
+    rebuilds the ``ConfigCache`` as soon as a change is detected, so that
+    runs started afterwards don't pay for reloading it.
+    """
+
+    def __init__(self, cache: ConfigCache, interval: float = 2.0):
+        """
+        Instantiates the config watcher
+        :param cache: Config cache to keep warm
+        :param interval: Seconds between two checks of the config files
+        """
+        super().__init__(name="kedro-config-watcher", daemon=True)
+        self._cache = cache
+        self._interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self._interval):
+            if self._cache.refresh():
+                self._cache.warm()
+
+    def stop(self):
+        """Stop watching the configuration"""
+        self._stopped.set()
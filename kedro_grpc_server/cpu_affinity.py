@@ -0,0 +1,141 @@
+"""Partitioning of the cores between concurrent runs: CpuAllocator"""
+import logging
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:  # pragma: no cover, optional
+    threadpool_limits = None
+
+# thread pool sizes of OpenMP, BLAS libraries and numexpr
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+def available_cpus() -> List[int]:
+    """
+    Cores the current process may run on
+    :return: Sorted core IDs
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))  # pragma: no cover, not Linux
+
+
+def format_cpus(cpus: Sequence[int]) -> str:
+    """
+    Format a CPU set as ``taskset`` does
+    :param cpus: Sorted core IDs
+    :return: E.g. ``0-3,8``
+    """
+    ranges = []  # type: List[List[int]]
+    for cpu in cpus:
+        if ranges and cpu == ranges[-1][1] + 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(
+        str(first) if first == last else f"{first}-{last}" for first, last in ranges
+    )
+
+
+def pin_process(cpus: Sequence[int]):
+    """
+    Bind the current process to a CPU set, and size the thread pools of
+    numerical libraries to it. Called in the run process, so the children
+    it starts, e.g. the process pool of ``ParallelRunner``, inherit both.
+    Thread pools of libraries already loaded by the server are resized
+    with ``threadpoolctl``, if installed.
+    :param cpus: Core IDs
+    """
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+    threads = str(len(cpus))
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = threads
+    if threadpool_limits is not None:
+        threadpool_limits(limits=len(cpus))
+
+
+class CpuAllocator:
+    """CpuAllocator partitions the cores of the server between concurrent
+    runs, so that runs using ``ParallelRunner`` or multithreaded libraries
+    don't oversubscribe the cores and evict each other's caches. Every run
+    is assigned a disjoint set of free cores, adjacent ones if possible to
+    share caches, which it gives back when it finishes.
+
+    Once every core is assigned, new runs are given the least used cores,
+    so they share cores with as few runs as possible instead of waiting.
+    """
+
+    def __init__(self, cpus: Iterable[int] = None):
+        """
+        Instantiates the allocator
+        :param cpus: Cores to partition, the cores of the server by default
+        """
+        self._usage = {
+            cpu: 0 for cpu in sorted(available_cpus() if cpus is None else cpus)
+        }  # type: Dict[int, int]
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Number of cores partitioned"""
+        return len(self._usage)
+
+    @property
+    def free(self) -> List[int]:
+        """Cores assigned to no run"""
+        with self._lock:
+            return [cpu for cpu, runs in self._usage.items() if not runs]
+
+    def acquire(self, count: int) -> List[int]:
+        """
+        Assign cores to a run
+        :param count: Number of cores, at most all the cores
+        :return: Sorted core IDs
+        """
+        count = min(max(count, 1), self.size)
+        with self._lock:
+            free = [cpu for cpu, runs in self._usage.items() if not runs]
+            cpus = _adjacent(free, count)
+            if cpus is None:
+                logging.warning(
+                    "Only %d free cores for a run requesting %d, sharing cores",
+                    len(free),
+                    count,
+                )
+                cpus = sorted(
+                    sorted(self._usage, key=lambda cpu: self._usage[cpu])[:count]
+                )
+            for cpu in cpus:
+                self._usage[cpu] += 1
+        return cpus
+
+    def release(self, cpus: Iterable[int]):
+        """
+        Give back the cores of a finished run
+        :param cpus: Core IDs returned by ``acquire``
+        """
+        with self._lock:
+            for cpu in cpus:
+                self._usage[cpu] = max(self._usage[cpu] - 1, 0)
+
+
+def _adjacent(free: List[int], count: int) -> Optional[List[int]]:
+    """First ``count`` consecutive free cores, else the first free ones,
+    None if fewer are free"""
+    if len(free) < count:
+        return None
+    for start in range(len(free) - count + 1):
+        if free[start + count - 1] - free[start] == count - 1:
+            return free[start : start + count]
+    return free[:count]
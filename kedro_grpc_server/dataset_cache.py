@@ -0,0 +1,155 @@
+"""Server-side cache of heavy reference datasets shared by runs: DatasetCache"""
+import logging
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Tuple
+
+from kedro.io import MemoryDataSet
+
+
+def _size_of(data: Any) -> int:
+    """Estimate the memory held by a dataset"""
+    memory_usage = getattr(data, "memory_usage", None)
+    if callable(memory_usage):  # pandas DataFrame or Series
+        usage = memory_usage(deep=True)
+        return int(getattr(usage, "sum", lambda: usage)())
+    nbytes = getattr(data, "nbytes", None)
+    if isinstance(nbytes, int):  # numpy array
+        return nbytes
+    return len(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class DatasetCache:
+    """DatasetCache loads catalog entries marked as cacheable once, in the
+    server process, and hands them to runs as ``MemoryDataSet``s. Run
+    processes are forked from the server, so they attach to the cached data
+    through copy-on-write pages: nothing is read from disk or copied, and the
+    physical memory is shared by all concurrent runs. A node mutating its
+    input only ever copies the pages it touches, in its own process.
+
+    The cache is bounded by ``max_bytes`` and evicts the least recently used
+    datasets first.
+    """
+
+    def __init__(self, dataset_names: Iterable[str] = (), max_bytes: int = 2 ** 30):
+        """
+        Instantiates the dataset cache
+        :param dataset_names: Catalog entries to cache
+        :param max_bytes: Memory budget of the cache
+        """
+        self._dataset_names = list(dataset_names)
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()  # type: OrderedDict[str, Tuple[Any, int]]
+        self._nbytes = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def dataset_names(self):
+        """Names of the cacheable catalog entries"""
+        return list(self._dataset_names)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the datasets were loaded since the cache was invalidated"""
+        return self._loaded
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory held by the cached datasets"""
+        return self._nbytes
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def get(self, name: str) -> Any:
+        """
+        Cached data of a dataset
+        :param name: Catalog entry name
+        :return: The cached data, None if the dataset isn't cached
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                return None
+            self._entries.move_to_end(name)
+            return entry[0]
+
+    def load(self, catalog: Any):
+        """
+        Load the cacheable datasets missing from the cache. Datasets failing
+        to load are skipped, the runs will load them as usual.
+        :param catalog: Catalog to load the datasets from
+        """
+        for name in self._dataset_names:
+            with self._lock:
+                if name in self._entries:
+                    self._entries.move_to_end(name)
+                    continue
+            try:
+                data = catalog.load(name)
+            except Exception as exc:  # pylint: disable=broad-except
+                logging.warning("Could not cache dataset `%s`: %s", name, exc)
+                continue
+            self.put(name, data)
+        self._loaded = True
+
+    def put(self, name: str, data: Any):
+        """
+        Add a dataset, evicting the least recently used ones to make room
+        :param name: Catalog entry name
+        :param data: Loaded data
+        """
+        size = _size_of(data)
+        if size > self._max_bytes:
+            logging.warning(
+                "Dataset `%s` (%d bytes) exceeds the dataset cache size", name, size
+            )
+            return
+        with self._lock:
+            self._pop(name)
+            while self._entries and self._nbytes + size > self._max_bytes:
+                evicted = next(iter(self._entries))
+                logging.info("Evicting dataset `%s` from the dataset cache", evicted)
+                self._pop(evicted)
+            self._entries[name] = (data, size)
+            self._nbytes += size
+
+    def invalidate(self):
+        """Drop every cached dataset, e.g. when the catalog changed"""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self._loaded = False
+
+    def install(self, context: Any):
+        """
+        Make the catalogs created by ``context`` serve the datasets cached at
+        this point from memory. Meant to be called on the context of a run
+        right before its process is started.
+        :param context: Run context to patch
+        """
+        with self._lock:
+            cached = {name: data for name, (data, _) in self._entries.items()}
+            for name in cached:
+                self._entries.move_to_end(name)
+        if not cached:
+            return
+
+        get_catalog = context._get_catalog  # pylint: disable=protected-access
+
+        def _get_catalog(*args, **kwargs):
+            catalog = get_catalog(*args, **kwargs)
+            for name, data in cached.items():
+                catalog.add(
+                    name, MemoryDataSet(data=data, copy_mode="assign"), replace=True
+                )
+            return catalog
+
+        context._get_catalog = _get_catalog  # pylint: disable=protected-access
+
+    def _pop(self, name: str):
+        entry = self._entries.pop(name, None)
+        if entry is not None:
+            self._nbytes -= entry[1]
@@ -0,0 +1,264 @@
+"""Events of the datasets loaded and saved by a run: DatasetEventHooks"""
+import logging
+import pickle
+import sys
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Collection, Dict
+
+from kedro.io import AbstractVersionedDataSet, MemoryDataSet
+
+from kedro_grpc_server.checkpoint import write_checkpoint
+from kedro_grpc_server.result_channel import ResultChannel
+
+try:
+    from kedro.framework.hooks import get_hook_manager, hook_impl
+except ImportError:  # pragma: no cover, kedro < 0.16 has no hooks
+    get_hook_manager = None
+
+    def hook_impl(func):  # pylint: disable=missing-function-docstring
+        return func
+
+
+def data_size(data: Any) -> int:
+    """
+    Approximate size of a dataset in memory, without serializing it
+    :param data: Saved data
+    :return: Size in bytes
+    """
+    nbytes = getattr(data, "nbytes", None)  # numpy arrays
+    if isinstance(nbytes, int):
+        return nbytes
+    memory_usage = getattr(data, "memory_usage", None)  # pandas objects
+    if callable(memory_usage):
+        try:
+            return int(memory_usage(deep=True).sum())
+        except (TypeError, ValueError):  # pragma: no cover
+            pass
+    if isinstance(data, (bytes, bytearray, str)):
+        return len(data)
+    return sys.getsizeof(data)
+
+
+def data_rows(data: Any) -> int:
+    """
+    Number of rows of a dataset, read from its shape
+    :param data: Loaded or saved data
+    :return: Rows of data frames and arrays, 0 for other data
+    """
+    shape = getattr(data, "shape", None)
+    if isinstance(shape, tuple) and shape and isinstance(shape[0], int):
+        return shape[0]
+    return 0
+
+
+def _has_dataset_hooks() -> bool:
+    """Whether Kedro calls the dataset hooks, 0.17 onwards"""
+    if get_hook_manager is None:
+        return False
+    hook = getattr(get_hook_manager().hook, "after_dataset_saved", None)
+    return hook is not None and hook.has_spec()
+
+
+class DatasetEventHooks:
+    """DatasetEventHooks are Kedro hooks sending, from the run process, an
+    event for every dataset saved by a node, with its name, its save version
+    if the dataset is versioned, and its size. Datasets the client asked to
+    fetch are also written to the result channel as soon as they are saved,
+    so they can be fetched with ``GetOutputs`` while the downstream nodes are
+    still running.
+
+    Events tell whether the dataset is persisted by the catalog. In-memory
+    datasets are pickled to the checkpoint directory of the run, if given,
+    so that a failed run can be resumed without running their nodes again.
+
+    Every load and save by the catalog is also timed, and exported as
+    ``{"io": event}`` with its duration, and the size and rows of the data.
+    Sizes are measured once the dataset was loaded or saved, so they don't
+    count in the duration.
+
+    With Kedro versions calling no dataset hooks, or when the hooks are
+    called directly instead of being installed, loads and saves are
+    intercepted by wrapping ``DataCatalog.load`` and ``DataCatalog.save``
+    when the catalog is created, and in the shallow copies runners make of
+    it.
+    """
+
+    def __init__(
+        self,
+        export: Callable[[Dict[str, Any]], None],
+        run_id: str,
+        result_channel: ResultChannel = None,
+        fetch_datasets: Collection[str] = (),
+        checkpoint_dir: str = None,
+    ):
+        """
+        Instantiates the hooks
+        :param export: Called with the descriptor of every fetched dataset,
+            then with ``{"dataset": event}`` for every saved dataset, and
+            with ``{"io": event}`` for every load and save
+        :param run_id: Run ID
+        :param result_channel: Channel handing the fetched datasets to the
+            server
+        :param fetch_datasets: Datasets to write to the result channel
+        :param checkpoint_dir: Directory to checkpoint the in-memory datasets
+            to, None not to checkpoint them
+        """
+        self._export = export
+        self._run_id = run_id
+        self._result_channel = result_channel
+        self._fetch_datasets = set(fetch_datasets)
+        self._checkpoint_dir = checkpoint_dir or ""
+        self._catalog = None  # type: Any
+        self._save_version = ""
+        self._registered = False
+        # start times of the loads and saves in progress, by thread
+        self._io_starts = {}  # type: Dict[Any, float]
+
+    def install(self):
+        """Register the hooks with Kedro, if it supports hooks"""
+        if get_hook_manager is not None:
+            get_hook_manager().register(self)
+            self._registered = True
+
+    @hook_impl
+    def after_catalog_created(  # pylint: disable=missing-function-docstring
+        self, catalog, save_version
+    ):
+        self._catalog = catalog
+        self._save_version = save_version or ""
+        if not (self._registered and _has_dataset_hooks()):
+            self._wrap_catalog(catalog)
+
+    @hook_impl
+    def before_dataset_loaded(  # pylint: disable=missing-function-docstring
+        self, dataset_name
+    ):
+        self._start_io(dataset_name, "load")
+
+    @hook_impl
+    def after_dataset_loaded(  # pylint: disable=missing-function-docstring
+        self, dataset_name, data
+    ):
+        self._end_io(dataset_name, "load", data)
+
+    @hook_impl
+    def before_dataset_saved(  # pylint: disable=missing-function-docstring
+        self, dataset_name
+    ):
+        self._start_io(dataset_name, "save")
+
+    @hook_impl
+    def after_dataset_saved(  # pylint: disable=missing-function-docstring
+        self, dataset_name, data
+    ):
+        size = self._end_io(dataset_name, "save", data)
+        persisted = self._persisted(dataset_name)
+        event = dict(
+            name=dataset_name,
+            version=self._version(dataset_name),
+            size=data_size(data) if size is None else size,
+            fetchable=False,
+            persisted=persisted,
+            checkpoint="",
+        )
+        if not persisted and self._checkpoint_dir:
+            event["checkpoint"] = self._checkpoint(dataset_name, data)
+        if dataset_name in self._fetch_datasets and self._result_channel is not None:
+            descriptor = self._result_channel.write(self._run_id, dataset_name, data)
+            self._export(descriptor)
+            event.update(size=descriptor["size"], fetchable=True)
+        self._export({"dataset": event})
+
+    def _start_io(self, dataset_name: str, operation: str):
+        key = (threading.get_ident(), operation, dataset_name)
+        self._io_starts[key] = time.perf_counter()
+
+    def _end_io(self, dataset_name: str, operation: str, data: Any) -> Any:
+        """
+        Export the duration of a load or save, if its start was recorded
+        :param dataset_name: Dataset name
+        :param operation: ``load`` or ``save``
+        :param data: Loaded or saved data
+        :return: Size of the data, None if the start wasn't recorded
+        """
+        key = (threading.get_ident(), operation, dataset_name)
+        start = self._io_starts.pop(key, None)
+        if start is None:
+            return None
+        duration = time.perf_counter() - start
+        size = data_size(data)
+        self._export(
+            {
+                "io": dict(
+                    name=dataset_name,
+                    operation=operation,
+                    duration=duration,
+                    size=size,
+                    rows=data_rows(data),
+                )
+            }
+        )
+        return size
+
+    def _wrap_catalog(self, catalog: Any):
+        """Intercept the loads and saves of a catalog, and of its shallow
+        copies, which runners load the inputs and save the outputs of the
+        nodes with"""
+        catalog.load = self._wrapped_load(catalog.load)
+        catalog.save = self._wrapped_save(catalog.save)
+        shallow_copy = getattr(catalog, "shallow_copy", None)
+        if shallow_copy is None:  # pragma: no cover
+            return
+
+        @wraps(shallow_copy)
+        def _shallow_copy(*args: Any, **kwargs: Any):
+            copy = shallow_copy(*args, **kwargs)
+            self._wrap_catalog(copy)
+            return copy
+
+        catalog.shallow_copy = _shallow_copy
+
+    def _wrapped_load(self, load: Callable[..., Any]):
+        @wraps(load)
+        def _load(name: str, *args: Any, **kwargs: Any):
+            self.before_dataset_loaded(dataset_name=name)
+            data = load(name, *args, **kwargs)
+            self.after_dataset_loaded(dataset_name=name, data=data)
+            return data
+
+        return _load
+
+    def _wrapped_save(self, save: Callable[[str, Any], None]):
+        @wraps(save)
+        def _save(name: str, data: Any):
+            self.before_dataset_saved(dataset_name=name)
+            save(name, data)
+            self.after_dataset_saved(dataset_name=name, data=data)
+
+        return _save
+
+    def _persisted(self, dataset_name: str) -> bool:
+        """Whether the catalog persists the dataset, which it doesn't for
+        datasets it doesn't declare"""
+        # pylint: disable=protected-access
+        data_set = getattr(self._catalog, "_data_sets", {}).get(dataset_name)
+        return data_set is not None and not isinstance(data_set, MemoryDataSet)
+
+    def _checkpoint(self, dataset_name: str, data: Any) -> str:
+        """Path of the checkpoint of an in-memory dataset, empty if it can't
+        be pickled"""
+        try:
+            return write_checkpoint(self._checkpoint_dir, dataset_name, data)
+        except (OSError, pickle.PicklingError, AttributeError, TypeError) as exc:
+            logging.warning("Dataset %s wasn't checkpointed: %s", dataset_name, exc)
+            return ""
+
+    def _version(self, dataset_name: str) -> str:
+        """Save version of a versioned dataset, empty for other datasets"""
+        # pylint: disable=protected-access
+        data_set = getattr(self._catalog, "_data_sets", {}).get(dataset_name)
+        if isinstance(data_set, AbstractVersionedDataSet) and data_set._version:
+            return data_set.resolve_save_version() or self._save_version
+        return ""
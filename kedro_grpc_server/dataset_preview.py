@@ -0,0 +1,238 @@
+"""Previews of catalog datasets served by the server: DatasetPreviewer"""
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import PurePosixPath
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from kedro.io import AbstractVersionedDataSet
+
+# load arguments taking the row limit and the columns of a preview, by type
+# of dataset, lower cased and without its ``DataSet`` suffix. The query of
+# SQL query datasets is wrapped in a ``LIMIT`` query, and SQL table datasets
+# are previewed with a ``SELECT`` query of their own, see ``load_preview``
+PUSHDOWN_ARGS = {
+    "csv": ("nrows", "usecols"),
+    "excel": ("nrows", "usecols"),
+    "parquet": (None, "columns"),
+    "sqlquery": ("sql", None),
+}  # type: Dict[str, Tuple[Optional[str], Optional[str]]]
+# ISO format of naive dates, which ``to_json`` of pandas 1.x marks as UTC
+_NAIVE_ISO_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+
+def _dataset_kind(dataset: Any) -> str:
+    name = type(dataset).__name__.lower()
+    return name[: -len("dataset")] if name.endswith("dataset") else name
+
+
+def load_preview(
+    dataset: Any, limit: int, columns: Sequence[str] = ()
+) -> Tuple[Any, List[str]]:
+    """
+    Load the first rows of a dataset, passing the row limit and the columns
+    to the loader of the datasets supporting them, e.g. ``nrows`` and
+    ``usecols`` of ``pandas.read_csv``, so only the previewed data is read
+    :param dataset: Catalog dataset
+    :param limit: Maximum number of rows
+    :param columns: Columns to load, all of them if empty
+    :return: The loaded data, and the preview arguments pushed down into the
+        loader, ``limit`` and ``columns``
+    """
+    kind = _dataset_kind(dataset)
+    if kind == "sqltable":
+        return _load_table_preview(dataset, limit, columns)
+    limit_arg, columns_arg = PUSHDOWN_ARGS.get(kind, (None, None))
+    load_args = dict(getattr(dataset, "_load_args", None) or {})
+    pushdown = []
+    if limit_arg == "sql":
+        load_args["sql"] = _limit_query(load_args["sql"], limit)
+        load_args.pop("chunksize", None)  # the preview is a single frame
+        pushdown.append("limit")
+    elif limit_arg:
+        load_args[limit_arg] = limit
+        pushdown.append("limit")
+    if columns and columns_arg:
+        load_args[columns_arg] = list(columns)
+        pushdown.append("columns")
+    if pushdown:
+        # a copy, the catalog dataset is shared with other previews
+        dataset = copy.copy(dataset)
+        dataset._load_args = load_args  # pylint: disable=protected-access
+
+    return dataset.load(), pushdown
+
+
+def _limit_query(sql: str, limit: int) -> str:
+    """Wrap a query so that the database only returns its first rows"""
+    return f"SELECT * FROM ({sql.strip().rstrip(';')}) AS preview LIMIT {int(limit)}"
+
+
+def _load_table_preview(
+    dataset: Any, limit: int, columns: Sequence[str] = ()
+) -> Tuple[Any, List[str]]:
+    """
+    Load the first rows of a SQL table dataset with a ``SELECT ... LIMIT``
+    query, rather than ``pandas.read_sql_table`` which reads the whole table
+    :param dataset: SQL table dataset
+    :param limit: Maximum number of rows
+    :param columns: Columns to load, all of them if empty
+    :return: The loaded data, and the preview arguments pushed down into the
+        query, ``limit`` and ``columns``
+    """
+    # pylint: disable=import-outside-toplevel
+    import pandas as pd
+    from sqlalchemy import sql
+
+    load_args = dict(dataset._load_args)  # pylint: disable=protected-access
+    table = sql.table(load_args.pop("table_name"), schema=load_args.pop("schema", None))
+    # ``read_sql_query`` takes no columns, and the preview is a single frame
+    for arg in ("columns", "chunksize"):
+        load_args.pop(arg, None)
+    selected = [sql.column(column) for column in columns]
+    query = sql.select(selected or [sql.literal_column("*")]).select_from(table)
+    pushdown = ["limit", "columns"] if columns else ["limit"]
+    return pd.read_sql_query(query.limit(limit), **load_args), pushdown
+
+
+def to_frame(data: Any, limit: int, columns: Sequence[str] = ()) -> Any:
+    """
+    Turn the data of a dataset into a preview ``DataFrame``
+    :param data: DataFrame, Series, array or list of records
+    :param limit: Maximum number of rows
+    :param columns: Columns to keep, all of them if empty
+    :return: A ``pandas.DataFrame`` of at most ``limit`` rows
+    :raises TypeError: If the data isn't tabular
+    """
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    if data is None:
+        data = pd.DataFrame()
+    if isinstance(data, pd.Series):
+        data = data.to_frame()
+    elif isinstance(data, pd.DataFrame):
+        pass
+    elif isinstance(data, (list, tuple)) or getattr(data, "ndim", 0) in (1, 2):
+        data = pd.DataFrame(data[:limit])
+    else:
+        raise TypeError(f"{type(data).__name__} data can't be previewed")
+    frame = data.head(limit)
+    if columns:
+        frame = frame[list(columns)]
+    return frame
+
+
+def frame_records(frame: Any) -> List[Dict[str, Any]]:
+    """
+    Rows of a preview as JSON compatible records
+    :param frame: Preview ``DataFrame``
+    :return: A dict per row, with dates in ISO format
+    """
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    frame = frame.copy()
+    frame.columns = [str(column) for column in frame.columns]
+    for column in frame.columns:
+        # naive dates stay naive, dates with a time zone are written in UTC
+        if pd.api.types.is_datetime64_dtype(frame[column]):
+            frame[column] = frame[column].dt.strftime(_NAIVE_ISO_FORMAT).str[:-3]
+    return json.loads(frame.to_json(orient="records", date_format="iso"))
+
+
+def storage_metadata(dataset: Any) -> Dict[str, Any]:
+    """
+    Size and versions of a file based dataset, listed without loading it
+    :param dataset: Catalog dataset
+    :return: ``size`` in bytes of the file loaded by the dataset, 0 if
+        unknown, and ``versions``, most recent first, of versioned datasets
+    """
+    # pylint: disable=protected-access
+    filepath = getattr(dataset, "_filepath", None)
+    metadata = dict(size=0, versions=[])  # type: Dict[str, Any]
+    if filepath is None:
+        return metadata
+    filepath = PurePosixPath(filepath)
+    try:
+        if isinstance(dataset, AbstractVersionedDataSet) and dataset._version:
+            pattern = str(filepath / "*" / filepath.name)
+            metadata["versions"] = sorted(
+                (
+                    PurePosixPath(path).parent.name
+                    for path in dataset._glob_function(pattern)
+                ),
+                reverse=True,
+            )
+            filepath = PurePosixPath(dataset._get_load_path())
+        fs = getattr(dataset, "_fs", None)
+        metadata["size"] = (
+            fs.size(str(filepath)) if fs is not None else os.path.getsize(filepath)
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        logging.debug("Could not read the metadata of %s: %s", filepath, exc)
+    return metadata
+
+
+class DatasetPreviewer:
+    """DatasetPreviewer serves previews of the catalog datasets from the
+    server process: the first rows and the schema of a dataset, loaded
+    without starting a run. The row limit and the column projection are
+    pushed down into the loader of CSV, Excel, Parquet and SQL datasets, so
+    large datasets are not read in full, and datasets held by the
+    ``DatasetCache`` are previewed from memory.
+
+    The storage metadata of datasets, size and versions, is cached for
+    ``metadata_ttl`` seconds, or until the configuration changes.
+    """
+
+    def __init__(self, metadata_ttl: float = 60.0):
+        """
+        Instantiates the previewer
+        :param metadata_ttl: Seconds the metadata of a dataset is cached for
+        """
+        self._metadata_ttl = metadata_ttl
+        self._metadata = {}  # type: Dict[str, Tuple[float, Dict[str, Any]]]
+        self._lock = threading.Lock()
+
+    def metadata(self, name: str, dataset: Any) -> Dict[str, Any]:
+        """
+        Cached storage metadata of a dataset
+        :param name: Catalog entry name
+        :param dataset: Catalog dataset
+        :return: ``type``, ``size`` and ``versions`` of the dataset
+        """
+        now = time.time()
+        with self._lock:
+            cached = self._metadata.get(name)
+        if cached is not None and now - cached[0] < self._metadata_ttl:
+            return cached[1]
+        metadata = dict(storage_metadata(dataset), type=type(dataset).__name__)
+        with self._lock:
+            self._metadata[name] = (now, metadata)
+        return metadata
+
+    def invalidate(self):
+        """Drop the cached metadata, e.g. when the catalog changed"""
+        with self._lock:
+            self._metadata.clear()
+
+    def preview(  # pylint: disable=no-self-use
+        self, dataset: Any, limit: int, columns: Sequence[str] = (), data: Any = None
+    ) -> Tuple[Any, List[str]]:
+        """
+        Preview a dataset
+        :param dataset: Catalog dataset
+        :param limit: Maximum number of rows
+        :param columns: Columns to preview, all of them if empty
+        :param data: Data of the dataset if already in memory, loaded from
+            the dataset otherwise
+        :return: The preview ``DataFrame``, and the preview arguments pushed
+            down into the loader
+        :raises TypeError: If the data isn't tabular
+        """
+        pushdown = []  # type: List[str]
+        if data is None:
+            data, pushdown = load_preview(dataset, limit, columns)
+        return to_frame(data, limit, columns), pushdown
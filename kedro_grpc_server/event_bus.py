@@ -0,0 +1,153 @@
+"""In-process publish/subscribe fan-out of run events: EventBus"""
+import logging
+import threading
+from queue import Empty, Full, Queue
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+_CLOSED = object()
+
+
+class Subscription:
+    """Subscription is a filtered, bounded queue of run events handed out by
+    ``EventBus.subscribe``. Iterating it blocks until the next event and stops
+    once the subscription is closed.
+    """
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        run_ids: Iterable[str] = None,
+        pipeline_names: Iterable[str] = None,
+        run_statuses: Iterable[str] = None,
+        include_events: bool = False,
+        maxsize: int = 1000,
+    ):
+        """
+        Instantiates the subscription
+        :param bus: Event bus the subscription is registered with
+        :param run_ids: Only these runs, all if empty
+        :param pipeline_names: Only runs of these pipelines, all if empty
+        :param run_statuses: Only runs in these states, all if empty
+        :param include_events: Also receive logged events, not only state
+            transitions
+        :param maxsize: Events buffered before new ones are dropped
+        """
+        self._bus = bus
+        self._run_ids = frozenset(run_ids or ())
+        self._pipeline_names = frozenset(pipeline_names or ())
+        self._run_statuses = frozenset(run_statuses or ())
+        self._include_events = include_events
+        self._queue = Queue(maxsize=maxsize)  # type: Queue
+        self.dropped = 0
+
+    def matches(self, event: Dict[str, Any]) -> bool:
+        """
+        Check an event against the subscription filter
+        :param event: Run event
+        :return: Whether the event should be delivered
+        """
+        if event["events"] and not self._include_events:
+            return False
+        if self._run_ids and event["run_id"] not in self._run_ids:
+            return False
+        if self._pipeline_names and event["pipeline_name"] not in self._pipeline_names:
+            return False
+        if self._run_statuses and event["run_status"] not in self._run_statuses:
+            return False
+        return True
+
+    def put(self, event: Dict[str, Any]):
+        """
+        Deliver an event without ever blocking the publisher
+        :param event: Run event
+        """
+        try:
+            self._queue.put_nowait(event)
+        except Full:
+            if not self.dropped:
+                logging.warning("Slow run event subscriber, dropping events")
+            self.dropped += 1
+
+    def get(self, timeout: float = None) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the next event
+        :param timeout: Seconds to wait, forever if None
+        :return: The event, or None on timeout or once closed
+        """
+        try:
+            event = self._queue.get(timeout=timeout)
+        except Empty:
+            return None
+        if event is _CLOSED:
+            self._queue.put_nowait(_CLOSED)
+            return None
+        return event
+
+    def close(self, *_):
+        """Stop iteration and unsubscribe from the bus"""
+        self._bus.unsubscribe(self)
+        try:
+            self._queue.put_nowait(_CLOSED)
+        except Full:
+            self._queue.get_nowait()
+            self._queue.put_nowait(_CLOSED)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        while True:
+            event = self._queue.get()
+            if event is _CLOSED:
+                return
+            yield event
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class EventBus:
+    """EventBus fans run events out to any number of subscribers. Filters are
+    evaluated on publish, so subscribers are only woken up for events they
+    asked for and an idle subscriber costs one set lookup per event.
+    """
+
+    def __init__(self):
+        self._subscriptions = []  # type: List[Subscription]
+        self._lock = threading.Lock()
+
+    def subscribe(self, **filters: Any) -> Subscription:
+        """
+        Register a new subscriber
+        :param filters: Keyword arguments of ``Subscription``
+        :return: The subscription, to be closed by the subscriber
+        """
+        subscription = Subscription(self, **filters)
+        with self._lock:
+            self._subscriptions = self._subscriptions + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """
+        Remove a subscriber, no-op if it is already gone
+        :param subscription: Subscription returned by ``subscribe``
+        """
+        with self._lock:
+            self._subscriptions = [
+                sub for sub in self._subscriptions if sub is not subscription
+            ]
+
+    def publish(self, event: Dict[str, Any]):
+        """
+        Deliver an event to all matching subscribers
+        :param event: Dict with ``run_id``, ``pipeline_name``, ``run_status``,
+            ``events`` and ``exit_code`` keys. State transitions are published
+            with an empty ``events`` list.
+        """
+        # copy-on-write list, publishing never waits for (un)subscribers
+        for subscription in self._subscriptions:
+            if subscription.matches(event):
+                subscription.put(event)
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
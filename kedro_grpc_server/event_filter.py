@@ -0,0 +1,226 @@
+"""Tagged run events and their server-side filtering: LogEvent, EventFilter"""
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+STREAMS = ("stdout", "stderr", "structured")
+
+# level of records formatted by `logging`, e.g. `... - kedro.io - INFO - ...`
+# or `ERROR:root:...`
+_LEVEL_RE = re.compile(r"(?:^|\s-\s)(DEBUG|INFO|WARNING|ERROR|CRITICAL)(?:\s-\s|:)")
+_NODE_START_RE = re.compile(r"Running node: (.+?)\s*$")
+_NODE_END_RE = re.compile(r"Completed \d+ out of \d+ tasks")
+# carriage return which isn't the end of a CRLF line break
+_PROGRESS_RE = re.compile(r"\r(?!\n)")
+
+
+class LogEvent(str):
+    """LogEvent is a line written by a run, tagged with the stream it was
+    written to, its log level and the node being run at that time. It is a
+    ``str``, so it can be used anywhere a plain event is expected.
+    """
+
+    stream = "stdout"  # type: str
+    level = logging.INFO  # type: int
+    node = ""  # type: str
+    structured = False  # type: bool
+    progress = False  # type: bool
+
+    def __new__(
+        cls,
+        text: str,
+        stream: str = "stdout",
+        level: int = logging.INFO,
+        node: str = "",
+        structured: bool = False,
+        progress: bool = False,
+    ) -> "LogEvent":
+        event = super().__new__(cls, text)  # type: ignore
+        event.stream = stream
+        event.level = level
+        event.node = node
+        event.structured = structured
+        event.progress = progress
+        return event
+
+    @classmethod
+    def from_write(
+        cls, text: str, stream: str, current_node: Dict[str, str]
+    ) -> "LogEvent":
+        """
+        Tag a chunk written to stdout or stderr. Called in the run process.
+        A chunk with a bare carriage return is a progress bar update, of which
+        only the last segment is kept; CRLF line breaks aren't progress. Lines
+        without a log level are ERROR on stderr, unless they are progress bar
+        updates, and INFO otherwise.
+        :param text: Written text
+        :param stream: ``stdout`` or ``stderr``
+        :param current_node: ``name`` of the node being run, followed from
+            the node logs of Kedro. Shared by the writes of a run.
+        :return: The tagged event
+        """
+        progress = bool(_PROGRESS_RE.search(text))
+        if progress:
+            segments = _PROGRESS_RE.split(text)
+            segments = [seg for seg in segments if seg.strip()]
+            text = segments[-1] if segments else text
+
+        match = _LEVEL_RE.search(text)
+        if match:
+            level = logging.getLevelName(match.group(1))
+        elif stream == "stderr" and not progress:
+            level = logging.ERROR
+        else:
+            level = logging.INFO
+
+        node_start = _NODE_START_RE.search(text)
+        if node_start:
+            current_node["name"] = node_start.group(1)
+        event = cls(
+            text,
+            stream=stream,
+            level=level,
+            node=current_node["name"],
+            structured=bool(match),
+            progress=progress,
+        )
+        if _NODE_END_RE.search(text):
+            current_node["name"] = ""
+        return event
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form of the event, see ``from_dict``"""
+        return dict(
+            text=str(self),
+            stream=self.stream,
+            level=self.level,
+            node=self.node,
+            structured=self.structured,
+            progress=self.progress,
+        )
+
+    @classmethod
+    def from_dict(cls, event: Dict[str, Any]) -> "LogEvent":
+        """
+        Rebuild an event serialized with ``to_dict``
+        :param event: Serialized event
+        :return: The event
+        """
+        return cls(**event)
+
+    def __reduce__(self):
+        return LogEvent.from_dict, (self.to_dict(),)
+
+
+def _matches_node(node: str, names: Iterable[str]) -> bool:
+    # Kedro logs nodes as `name: func(inputs) -> outputs` or `func(...) -> ...`
+    return any(
+        node == name or node.startswith(name + ":") or node.startswith(name + "(")
+        for name in names
+    )
+
+
+class EventFilter:
+    """EventFilter selects the run events sent to a ``Status`` client by log
+    level, stream, node and regular expression, and collapses consecutive
+    progress bar updates into the last one. Filtering happens on the server,
+    before serialization, so dropped events cost no bandwidth.
+
+    Plain ``str`` events, such as the run start and completion markers, are
+    INFO events of no particular stream or node: only the level and pattern
+    filters apply to them.
+    """
+
+    def __init__(
+        self,
+        min_level: str = "",
+        streams: Sequence[str] = (),
+        nodes: Sequence[str] = (),
+        pattern: str = "",
+    ):
+        """
+        Instantiates the event filter
+        :param min_level: Name of the minimum log level, all levels if empty
+        :param streams: Streams among ``STREAMS`` to keep, all if empty. Log
+            records are ``structured`` whichever stream they were written to.
+        :param nodes: Only events logged while these nodes were running
+        :param pattern: Regular expression events must contain
+        :raises ValueError: If the level, a stream or the pattern is invalid
+        """
+        self._min_level = logging.NOTSET
+        if min_level:
+            self._min_level = logging.getLevelName(min_level.upper())
+            if not isinstance(self._min_level, int):
+                raise ValueError(f"Invalid log level: {min_level}")
+        unknown = set(streams) - set(STREAMS)
+        if unknown:
+            raise ValueError(f"Invalid streams: {sorted(unknown)}")
+        self._streams = frozenset(streams)
+        self._nodes = tuple(nodes)
+        try:
+            self._pattern = re.compile(pattern) if pattern else None
+        except re.error as exc:
+            raise ValueError(f"Invalid pattern: {exc}")
+
+    @classmethod
+    def from_request(cls, request: Any) -> "EventFilter":
+        """
+        Build the filter of a ``Status`` request
+        :param request: ``RunId`` message
+        :return: The event filter
+        :raises ValueError: If a filter is invalid
+        """
+        return cls(
+            min_level=request.min_level,
+            streams=list(request.streams),
+            nodes=list(request.nodes),
+            pattern=request.pattern,
+        )
+
+    def matches(self, event: str) -> bool:
+        """
+        Check an event against the filter
+        :param event: Run event
+        :return: Whether the event should be sent
+        """
+        if isinstance(event, LogEvent):
+            if event.level < self._min_level:
+                return False
+            if self._streams and not self._matches_stream(event):
+                return False
+            if self._nodes and not _matches_node(event.node, self._nodes):
+                return False
+        elif logging.INFO < self._min_level:
+            return False
+        if self._pattern is not None and not self._pattern.search(event):
+            return False
+        return True
+
+    def _matches_stream(self, event: LogEvent) -> bool:
+        if event.stream in self._streams:
+            return True
+        return event.structured and "structured" in self._streams
+
+    def apply(self, events: Iterable[str]) -> List[str]:
+        """
+        Filter events and collapse consecutive progress updates
+        :param events: Run events
+        :return: The events to send
+        """
+        selected = []  # type: List[str]
+        # previous selected event, if it is a progress update
+        previous = None  # type: Optional[LogEvent]
+        for event in events:
+            if not self.matches(event):
+                continue
+            progress = event if isinstance(event, LogEvent) and event.progress else None
+            if (
+                progress is not None
+                and previous is not None
+                and previous.stream == progress.stream
+            ):
+                selected[-1] = event
+            else:
+                selected.append(event)
+            previous = progress
+        return selected
@@ -1,26 +1,75 @@
 """Kedro gRPC Server"""
+import hashlib
+import inspect
+import json
 import logging
+import os
+import threading
 import time
+import uuid
 from concurrent import futures
-from copy import deepcopy
-from typing import Any
+from copy import copy
+from multiprocessing import Process
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import grpc
+from google.protobuf.json_format import MessageToDict, ParseDict
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
 from kedro.framework.cli import get_project_context
+from kedro.runner import SequentialRunner
+from kedro.utils import load_obj
 
+from kedro_grpc_server.checkpoint import resume_plan
+from kedro_grpc_server.context_cache import ConfigCache, ConfigWatcher
+from kedro_grpc_server.cpu_affinity import CpuAllocator
+from kedro_grpc_server.dataset_cache import DatasetCache
+from kedro_grpc_server.dataset_preview import DatasetPreviewer, frame_records
+from kedro_grpc_server.event_bus import EventBus
+from kedro_grpc_server.event_filter import EventFilter
+from kedro_grpc_server.in_process import InProcessChannel
 from kedro_grpc_server.kedro_pb2 import (  # type: ignore
+    DESCRIPTOR,
+    DatasetIO,
+    DatasetPreview,
+    DatasetStatsList,
+    OutputChunk,
     PipelineSummary,
+    ResourceUsage,
+    RunEvent,
+    RunList,
+    RunParams,
     RunStatus,
     RunSummary,
+    SavedDataset,
+    SessionResponse,
 )
 from kedro_grpc_server.kedro_pb2_grpc import (  # type: ignore
     KedroServicer,
     add_KedroServicer_to_server,
 )
+from kedro_grpc_server.pipeline_index import PipelineIndex, split_tags
 from kedro_grpc_server.process_manager import ProcessManager
+from kedro_grpc_server.resource_runner import ResourceRunner
+from kedro_grpc_server.result_channel import ResultChannel
+from kedro_grpc_server.run_store import RunStore
+from kedro_grpc_server.session import SessionWorker
+from kedro_grpc_server.spans import BatchSpanExporter, Tracer, current_span
+from kedro_grpc_server.startup import StartupTimer, prime_workers
+from kedro_grpc_server.thread_manager import ThreadManager
+from kedro_grpc_server.tracing import TracingInterceptor
 
 
 RUN_STATES = {}
+# output descriptors of the finished runs evicted from RUN_STATES
+RUN_OUTPUTS = {}  # type: Dict[str, Dict[str, Dict[str, Any]]]
+MAX_PAGE_SIZE = 1000
+STATUS_POLL_INTERVAL = 1.0
+STORE_POLL_INTERVAL = 0.5
+OUTPUT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_PREVIEW_ROWS = 10
+MAX_PREVIEW_ROWS = 1000
+SERVICE_NAME = DESCRIPTOR.services_by_name["Kedro"].full_name
 
 
 class KedroServer(KedroServicer):
@@ -28,43 +77,310 @@ class KedroServer(KedroServicer):
     KedroServer is an implementation of KedroServicer
     """
 
-    def __init__(self, context):
+    def __init__(
+        self,
+        context,
+        run_store: RunStore = None,
+        dataset_cache: DatasetCache = None,
+        result_channel: ResultChannel = None,
+        tracer: Tracer = None,
+        coalesce_window: float = 0.0,
+        memory_limit: int = 0,
+        run_timeout: float = 0.0,
+        run_cpus: int = 0,
+        cpu_allocator: CpuAllocator = None,
+        checkpoint_dir: str = None,
+        run_threads: int = 0,
+        thread_pipelines: Iterable[str] = (),
+    ):
         self.app_context = context
+        self.config_cache = ConfigCache(context)
+        self.config_cache.install(context)
+        self.event_bus = EventBus()
+        self.run_store = run_store or RunStore()
+        self.dataset_cache = dataset_cache or DatasetCache()
+        self.config_cache.add_listener(self.dataset_cache.invalidate)
+        self.dataset_previewer = DatasetPreviewer()
+        self.config_cache.add_listener(self.dataset_previewer.invalidate)
+        self.result_channel = result_channel or ResultChannel()
+        self.tracer = tracer or Tracer()
+        self.coalesce_window = coalesce_window
+        self.memory_limit = memory_limit
+        self.run_timeout = run_timeout
+        self.run_cpus = run_cpus
+        self.cpu_allocator = cpu_allocator or CpuAllocator()
+        self.checkpoint_dir = checkpoint_dir
+        self.thread_pipelines = frozenset(thread_pipelines)
+        self.run_executor = None  # type: Optional[futures.ThreadPoolExecutor]
+        if run_threads and self.thread_pipelines:
+            self.run_executor = futures.ThreadPoolExecutor(
+                run_threads, thread_name_prefix="kedro-run"
+            )
+        self.pipeline_index = PipelineIndex(context)
 
     def ListPipelines(self, request, context):
         response = PipelineSummary()
-        pipeline_names = self.app_context.pipelines.keys()
+        pipeline_names = self.pipeline_index.pipeline_names
         response.pipeline.extend(pipeline_names)  # pylint: disable=no-member
         return response
 
     def Run(self, request, context):
-        run_args = dict(pipeline_name=request.pipeline_name, tags=request.tags,)
-
-        context = deepcopy(self.app_context)
-        # run_id, run_states = start_run_process(
-        #     context=context, run_args=run_args, extra_params={}
-        # )
-        #
-        # RUN_STATES[run_id] = run_states
-        proc_manager = ProcessManager(
-            context=context, run_args=run_args, extra_params={}
+        return self._start_run(request, context)
+
+    def Resume(self, request, context):
+        run = self.run_store.get(request.run_id)
+        if run is None:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(f"Run {request.run_id} doesn't exist")
+            return RunSummary()
+        stored_request = self.run_store.get_request(request.run_id)
+        reason = None
+        if run["end_time"] is None:
+            reason = "is still running"
+        elif run["exit_code"] == 0:
+            reason = "succeeded"
+        elif stored_request is None:
+            reason = "has no recorded request"
+        if reason:
+            context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+            context.set_details(f"Run {request.run_id} {reason}")
+            return RunSummary()
+        return self._start_run(
+            ParseDict(stored_request, RunParams()), context, request.run_id
         )
+
+    def _start_run(self, request: Any, context: Any, resumed_run_id: str = ""):
+        """
+        Start a run, or resume a failed one
+        :param request: Run request
+        :param context: RPC context
+        :param resumed_run_id: Failed run resumed with the same request, only
+            its nodes whose outputs weren't saved are run
+        :return: The run summary
+        """
+        run_args = dict(pipeline_name=request.pipeline_name)
+        extra_params = MessageToDict(request.params)
+        cpus = min(max(request.cpus, 0) or self.run_cpus, self.cpu_allocator.size)
+        if request.runner:
+            try:
+                run_args["runner"] = _load_runner(request.runner, cpus)
+            except (AttributeError, ImportError, TypeError, ValueError) as exc:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(f"Invalid runner {request.runner}: {exc}")
+                return RunSummary()
+        try:
+            pipeline = self.pipeline_index.select(
+                request.pipeline_name, split_tags(request.tags), request.namespaces
+            )
+        except ValueError as exc:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(exc))
+            return RunSummary()
+        plan = None
+        if resumed_run_id:
+            try:
+                plan = resume_plan(
+                    pipeline, self.run_store.get_datasets(resumed_run_id)
+                )
+            except ValueError as exc:
+                context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+                context.set_details(f"Run {resumed_run_id} can't be resumed: {exc}")
+                return RunSummary()
+            pipeline = plan.pipeline
+            if plan.load_versions:
+                run_args["load_versions"] = plan.load_versions
+        if _deadline_exceeded(context):  # queued until nobody waits for it
+            return RunSummary()
+
+        run_id = str(uuid.uuid4())
+        if resumed_run_id:
+            # a failed run is resumed once at a time, whatever the window
+            keys = {
+                f"resume:{resumed_run_id}": None
+            }  # type: Dict[str, Optional[float]]
+        else:
+            keys = _run_keys(request, extra_params, self.coalesce_window)
+        claimed_run_id = self.run_store.claim_run(run_id, keys) if keys else run_id
+        if claimed_run_id != run_id:
+            logging.info("Coalesced run request into unfinished run %s", claimed_run_id)
+            response = RunSummary()
+            response.run_id = claimed_run_id
+            response.success = f"Run {claimed_run_id} already in progress"
+            response.coalesced = True
+            return response
+
+        try:
+            # the keys are released unless the run starts, or they would
+            # coalesce the retries of the request into a run which never ran
+            proc_manager = self._dispatch_run(
+                request, context, run_id, run_args, extra_params, pipeline, plan, cpus
+            )
+        except Exception:
+            self.run_store.release_keys(claimed_run_id)
+            raise
+        if proc_manager is None:
+            self.run_store.release_keys(claimed_run_id)
+            return RunSummary()
         run_id = proc_manager.run_id
-        proc_manager.start()
 
+        _evict_finished_runs()
         RUN_STATES[run_id] = proc_manager
+        self.run_store.record_request(
+            run_id, MessageToDict(request, preserving_proto_field_name=True)
+        )
 
         response = RunSummary()
         response.run_id = run_id
         response.success = f"Run {run_id} dispatched"
+        if plan:
+            # the resumed run loads the datasets saved by the failed run
+            self.run_store.record_datasets(run_id, plan.datasets)
+            response.success += f", resuming run {resumed_run_id}"
+            response.skipped_nodes.extend(  # pylint: disable=no-member
+                plan.skipped_nodes
+            )
         return response
 
+    def _dispatch_run(  # pylint: disable=too-many-arguments
+        self,
+        request: Any,
+        context: Any,
+        run_id: str,
+        run_args: Dict[str, Any],
+        extra_params: Dict[str, Any],
+        pipeline: Any,
+        plan: Any,
+        cpus: int,
+    ) -> Any:
+        """
+        Prepare the context of a run and start its manager
+        :param request: Run request
+        :param context: RPC context
+        :param run_id: Run ID of the new run
+        :param run_args: Arguments of the run
+        :param extra_params: Parameter overrides of the run
+        :param pipeline: Pipeline to run
+        :param plan: Resume plan of a resumed run, None otherwise
+        :param cpus: Number of cores the run is bound to
+        :return: The started manager, None if the client deadline passed
+        """
+        rpc_span = current_span()
+        with self.tracer.span("kedro.prepare_run", rpc_span):
+            run_context = self._prepare_context()
+            self.pipeline_index.install(run_context, pipeline)
+        if _deadline_exceeded(context):
+            return None
+        memory_limit = _lowest_limit(request.memory_limit * 2 ** 20, self.memory_limit)
+        timeout = _lowest_limit(request.timeout, self.run_timeout)
+        manager_class, manager_args = ProcessManager, {}  # type: Any, Dict[str, Any]
+        if self._runs_in_thread(request, run_args, memory_limit, timeout, cpus):
+            manager_class = ThreadManager
+            manager_args = dict(executor=self.run_executor)
+        with self.tracer.span("kedro.dispatch", rpc_span) as dispatch_span:
+            # only sampled traces are continued by the run process
+            trace_parent = dispatch_span.traceparent if dispatch_span.sampled else None
+            proc_manager = manager_class(
+                context=run_context,
+                run_id=run_id,
+                run_args=run_args,
+                extra_params=extra_params,
+                event_bus=self.event_bus,
+                run_store=self.run_store,
+                result_channel=self.result_channel,
+                tracer=self.tracer,
+                trace_parent=trace_parent,
+                memory_limit=memory_limit,
+                trace_malloc=request.trace_malloc,
+                fetch_datasets=list(request.fetch_datasets),
+                timeout=timeout,
+                cpus=cpus,
+                cpu_allocator=self.cpu_allocator,
+                checkpoint_dir=self._run_checkpoint_dir(request, run_id),
+                restore=plan.restore if plan else None,
+                **manager_args,
+            )
+            with self.config_cache.lock:
+                proc_manager.start()
+        return proc_manager
+
+    def _runs_in_thread(  # pylint: disable=too-many-arguments
+        self,
+        request: Any,
+        run_args: Dict[str, Any],
+        memory_limit: float,
+        timeout: float,
+        cpus: int,
+    ) -> bool:
+        """Whether a run is run on the thread pool of the server: runs of the
+        thread pipelines which needn't be isolated from the server, and run
+        their nodes in the run thread, so that their node hooks are called"""
+        runner = run_args.get("runner")
+        return (
+            self.run_executor is not None
+            and (request.pipeline_name or "__default__") in self.thread_pipelines
+            and not (memory_limit or timeout or cpus or request.trace_malloc)
+            and (runner is None or isinstance(runner, SequentialRunner))
+        )
+
+    def _run_checkpoint_dir(self, request: Any, run_id: str) -> Optional[str]:
+        """Directory the in-memory datasets of a run are checkpointed to, if
+        the request asked for checkpoints"""
+        if not request.checkpoint:
+            return None
+        checkpoint_dir = self.checkpoint_dir or str(
+            Path(self.app_context.project_path) / "logs" / "checkpoints"
+        )
+        return str(Path(checkpoint_dir) / run_id)
+
+    def _prepare_context(self) -> Any:
+        """Copy of the project context for a new run process, serving the
+        cached datasets. The copy is shallow: runs only ever replace
+        attributes of their context, e.g. its parameters or catalog factory,
+        and deep copying would copy every object held by the context."""
+        self.result_channel.expire()
+        if self.dataset_cache.dataset_names:
+            # checking the catalog drops the cached datasets if it changed
+            catalog = self.config_cache.catalog
+            if not self.dataset_cache.loaded:
+                self.dataset_cache.load(catalog)
+        context = copy(self.app_context)
+        self.dataset_cache.install(context)
+        return context
+
     def Status(self, request, context):
-        """Get run status and logged events"""
+        """Get run status and logged events. Every response only carries the
+        events logged since the previous one, starting at `since_sequence`,
+        and matching the level, stream, node and pattern filters."""
         run_id = request.run_id
+        sequence = max(request.since_sequence, 0)
         response = RunStatus()
+        try:
+            event_filter = EventFilter.from_request(request)
+        except ValueError as exc:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(exc))
+            return
+        stored_run = self.run_store.get(run_id)
 
-        if run_id not in RUN_STATES:
+        if stored_run and stored_run["end_time"] is not None:
+            events = self.run_store.get_events(run_id)
+            response.events.extend(  # pylint: disable=no-member
+                event_filter.apply(events[sequence:])
+            )
+            response.sequence = len(events)
+            response.run_status = stored_run["state"]
+            response.exit_code = str(stored_run["exit_code"])
+            response.success = "Status check was performed successfully"
+            response.run_id = run_id
+            _set_usage(response, **self.run_store.get_usage(run_id))
+            response.dataset_io.extend(  # pylint: disable=no-member
+                DatasetIO(**io) for io in self.run_store.get_dataset_io(run_id)
+            )
+            yield response
+        elif run_id not in RUN_STATES and stored_run:
+            # started by another server process sharing the run store
+            yield from self._tail_stored_run(run_id, sequence, event_filter, context)
+        elif run_id not in RUN_STATES:
             response.events.extend([])  # pylint: disable=no-member
             response.run_status = "Error"
             response.exit_code = ""
@@ -72,24 +388,412 @@ class KedroServer(KedroServicer):
             response.run_id = run_id
             yield response
         else:
-            has_events = True
-
             process_info = RUN_STATES[run_id]  # type: ProcessManager
+            subscription = self.event_bus.subscribe(
+                run_ids=[run_id], include_events=True
+            )
+            context.add_callback(subscription.close)
+            last_status = None
+            usage_sent = 0
+            datasets_sent = 0
+            io_sent = 0
 
-            while has_events:
-                proc_status = process_info.status()
-                run_status = proc_status.get("run_status")
+            with subscription:
+                while True:
+                    # check liveness first, so the last events are not missed
+                    has_events = bool(process_info.proc.is_alive())
+                    proc_status = process_info.status()
+                    events = proc_status.get("events")
+                    run_status = proc_status.get("run_status")
+
+                    new_events = event_filter.apply(events[sequence:])
+                    new_usage = process_info.node_usage[usage_sent:]
+                    new_datasets = process_info.saved_datasets[datasets_sent:]
+                    new_io = process_info.dataset_io[io_sent:]
+                    changed = new_events or new_usage or new_datasets or new_io
+                    if changed or run_status != last_status:
+                        response = RunStatus()
+                        response.run_id = run_id
+                        response.events.extend(new_events)  # pylint: disable=no-member
+                        response.sequence = len(events)
+                        response.success = "Status check was performed successfully"
+                        response.run_status = run_status
+                        response.exit_code = str(process_info.proc.exitcode)
+                        _set_usage(response, process_info.run_usage, new_usage)
+                        response.saved_datasets.extend(  # pylint: disable=no-member
+                            SavedDataset(**dataset) for dataset in new_datasets
+                        )
+                        response.dataset_io.extend(  # pylint: disable=no-member
+                            DatasetIO(**io) for io in new_io
+                        )
+                        last_status = run_status
+                        usage_sent += len(new_usage)
+                        datasets_sent += len(new_datasets)
+                        io_sent += len(new_io)
+                        yield response
+                    sequence = max(sequence, len(events))
+
+                    if not has_events or not context.is_active():
+                        break
+                    # woken up by the next event of the run, or polls anyway
+                    subscription.get(timeout=STATUS_POLL_INTERVAL)
+
+    def _tail_stored_run(
+        self, run_id: str, sequence: int, event_filter: EventFilter, context
+    ):
+        """Stream the events of a run from the run store until it finishes"""
+        last_status = None
+        while context.is_active():
+            stored_run = self.run_store.get(run_id)
+            if stored_run is None:  # pragma: no cover, runs are never deleted
+                break
+            events = self.run_store.get_events(run_id)
+            new_events = event_filter.apply(events[sequence:])
+            if new_events or stored_run["state"] != last_status:
+                response = RunStatus()
                 response.run_id = run_id
-                response.events.extend(  # pylint: disable=no-member
-                    proc_status.get("events")
-                )
+                response.events.extend(new_events)  # pylint: disable=no-member
+                response.sequence = len(events)
                 response.success = "Status check was performed successfully"
-                response.run_status = run_status
-                response.exit_code = str(process_info.proc.exitcode)
-
+                response.run_status = stored_run["state"]
+                response.exit_code = str(stored_run["exit_code"])
+                if stored_run["end_time"] is not None:
+                    _set_usage(response, **self.run_store.get_usage(run_id))
+                    response.dataset_io.extend(  # pylint: disable=no-member
+                        DatasetIO(**io) for io in self.run_store.get_dataset_io(run_id)
+                    )
+                last_status = stored_run["state"]
                 yield response
-                has_events = bool(process_info.proc.is_alive())
-                time.sleep(1)
+            sequence = max(sequence, len(events))
+            if stored_run["end_time"] is not None:
+                break
+            time.sleep(STORE_POLL_INTERVAL)
+
+    def WatchRuns(self, request, context):
+        """Stream state transitions, and optionally events, of all runs"""
+        subscription = self.event_bus.subscribe(
+            pipeline_names=request.pipeline_names,
+            run_statuses=request.run_statuses,
+            include_events=request.include_events,
+        )
+        context.add_callback(subscription.close)
+        with subscription:
+            for event in subscription:
+                yield RunEvent(**event)
+
+    def ListRuns(self, request, context):
+        """List stored runs, most recently started first"""
+        response = RunList()
+        page_size = min(request.page_size, MAX_PAGE_SIZE)
+        if page_size <= 0:
+            page_size = 50
+        try:
+            runs, next_cursor = self.run_store.list_runs(
+                pipeline=request.pipeline_name,
+                state=request.run_status,
+                limit=page_size,
+                cursor=request.cursor,
+            )
+        except ValueError as exc:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(exc))
+            return response
+
+        for run in runs:
+            record = response.runs.add()  # pylint: disable=no-member
+            record.run_id = run["run_id"]
+            record.pipeline_name = run["pipeline"]
+            record.run_status = run["state"]
+            record.start_time = run["start_time"]
+            record.end_time = run["end_time"] or 0
+            if run["exit_code"] is not None:
+                record.exit_code = str(run["exit_code"])
+        response.next_cursor = next_cursor
+        return response
+
+    def GetOutputs(self, request, context):
+        """Stream the outputs of a finished run, in chunks"""
+        run_info = RUN_STATES.get(request.run_id)
+        if run_info is not None:
+            run_info.status()  # collect the descriptors sent so far
+            outputs = run_info.outputs
+        else:
+            outputs = RUN_OUTPUTS.get(request.run_id)
+        if outputs is None:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(f"Run ID {request.run_id} doesn't exist")
+            return
+        names = list(request.names) or list(outputs)
+        missing = [name for name in names if name not in outputs]
+        if missing:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(f"Run {request.run_id} has no outputs {missing}")
+            return
+
+        for name in names:
+            yield from _output_chunks(outputs[name])
+
+    def Session(self, request_iterator, context):
+        """Run the pipelines sent over the stream one after the other, in a
+        worker process kept warm for the whole session"""
+        with self.tracer.span("kedro.prepare_run", current_span()):
+            worker = SessionWorker(
+                self._prepare_context(),
+                self.result_channel,
+                run_store=self.run_store,
+                event_bus=self.event_bus,
+                pipeline_index=self.pipeline_index,
+            )
+            with self.config_cache.lock:
+                worker.start()
+        context.add_callback(worker.stop)
+        try:
+            for request in request_iterator:
+                yield from _session_run(worker, request, self.pipeline_index)
+        finally:
+            worker.stop()
+
+    def PreviewDataset(self, request, context):
+        """Preview the schema and first rows of a catalog dataset, loaded by
+        the server from its cached catalog, without starting a run"""
+        limit = min(request.limit or DEFAULT_PREVIEW_ROWS, MAX_PREVIEW_ROWS)
+        try:
+            catalog = self.config_cache.catalog
+            dataset = catalog._data_sets.get(  # pylint: disable=protected-access
+                request.name
+            )
+            if dataset is None:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                context.set_details(f"Dataset {request.name} doesn't exist")
+                return DatasetPreview()
+            data = self.dataset_cache.get(request.name)
+            frame, pushdown = self.dataset_previewer.preview(
+                dataset, limit, request.columns, data=data
+            )
+        except (KeyError, TypeError) as exc:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(f"Can't preview dataset {request.name}: {exc}")
+            return DatasetPreview()
+        except Exception as exc:  # pylint: disable=broad-except
+            context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+            context.set_details(f"Could not preview dataset {request.name}: {exc}")
+            return DatasetPreview()
+
+        metadata = self.dataset_previewer.metadata(request.name, dataset)
+        response = DatasetPreview(
+            name=request.name,
+            dataset_type=metadata["type"],
+            pushdown=pushdown,
+            cached=data is not None,
+            size=metadata["size"],
+            versions=metadata["versions"],
+        )
+        for column, dtype in frame.dtypes.items():
+            response.schema.add(  # pylint: disable=no-member
+                name=str(column), dtype=str(dtype)
+            )
+        for record in frame_records(frame):
+            response.rows.add().update(record)  # pylint: disable=no-member
+        return response
+
+    def DatasetStats(self, request, context):
+        """Aggregate the loads and saves of every dataset across stored runs"""
+        response = DatasetStatsList()
+        for stats in self.run_store.dataset_io_stats(
+            names=list(request.names),
+            pipeline=request.pipeline_name,
+            since=request.since,
+        ):
+            total_duration = stats["total_duration"]
+            response.stats.add(  # pylint: disable=no-member
+                mean_duration=total_duration / stats["count"],
+                throughput=stats["total_size"] / total_duration
+                if total_duration > 0
+                else 0,
+                **stats,
+            )
+        return response
+
+
+def _session_run(
+    worker: SessionWorker, request: Any, pipeline_index: PipelineIndex
+) -> Iterable[Any]:
+    """
+    Run a pipeline in a session worker
+    :param worker: Worker of the session
+    :param request: ``SessionRequest`` message
+    :param pipeline_index: Index validating the pipeline selection of the run
+    :return: ``SessionResponse`` messages acknowledging the run with its ID,
+        then carrying its events and its output chunks, the last one carrying
+        its exit code
+    """
+    run = request.run
+    runner = None
+    if run.runner:
+        try:
+            runner = _load_runner(run.runner)
+        except (AttributeError, ImportError, TypeError, ValueError) as exc:
+            yield SessionResponse(
+                request_id=request.request_id,
+                run_status="Error",
+                error=f"Invalid runner {run.runner}: {exc}",
+            )
+            return
+    tags = split_tags(run.tags)
+    try:
+        pipeline_index.select(run.pipeline_name, tags, run.namespaces)
+    except ValueError as exc:
+        yield SessionResponse(
+            request_id=request.request_id, run_status="Error", error=str(exc)
+        )
+        return
+
+    run_id = str(uuid.uuid4())
+    yield SessionResponse(
+        request_id=request.request_id, run_id=run_id, run_status="Pending"
+    )
+    results = worker.run(
+        run_id,
+        pipeline_name=run.pipeline_name,
+        tags=tags,
+        namespaces=list(run.namespaces),
+        extra_params=MessageToDict(run.params),
+        runner=runner,
+    )
+    for item in results:
+        if not isinstance(item, dict):
+            yield SessionResponse(
+                request_id=request.request_id,
+                run_id=run_id,
+                run_status="Pending",
+                events=[item],
+            )
+            continue
+        for descriptor in item["outputs"]:
+            for chunk in _output_chunks(descriptor):
+                yield SessionResponse(
+                    request_id=request.request_id,
+                    run_id=run_id,
+                    run_status="Completed",
+                    outputs=[chunk],
+                )
+        yield SessionResponse(
+            request_id=request.request_id,
+            run_id=run_id,
+            run_status="Completed",
+            exit_code="1" if item["error"] else "0",
+            error=item["error"],
+        )
+
+
+def _output_chunks(descriptor: Dict[str, Any]) -> Iterable[Any]:
+    """
+    Read a run output from shared memory, in chunks
+    :param descriptor: Descriptor of the output written by the run
+    :return: ``OutputChunk`` messages of at most ``OUTPUT_CHUNK_SIZE`` bytes,
+        a single empty chunk for an empty output
+    """
+    segment = ResultChannel.open(descriptor)
+    for offset in range(0, max(len(segment), 1), OUTPUT_CHUNK_SIZE):
+        yield OutputChunk(
+            name=descriptor["output"],
+            format=descriptor["format"],
+            offset=offset,
+            size=len(segment),
+            data=segment[offset : offset + OUTPUT_CHUNK_SIZE].tobytes(),
+        )
+
+
+def _evict_finished_runs():
+    """Drop the managers of the runs recorded as ended, whose status is served
+    by the run store. The descriptors of their outputs are kept in
+    ``RUN_OUTPUTS`` until the result channel expires the segments."""
+    for run_id, manager in list(RUN_STATES.items()):
+        if manager.run_finished and RUN_STATES.pop(run_id, None) is not None:
+            if manager.outputs:
+                RUN_OUTPUTS[run_id] = manager.outputs
+    for run_id, outputs in list(RUN_OUTPUTS.items()):
+        if not all(os.path.exists(output["path"]) for output in outputs.values()):
+            RUN_OUTPUTS.pop(run_id, None)
+
+
+def _set_usage(
+    response: Any, run: Optional[Dict[str, Any]], nodes: List[Dict[str, Any]]
+):
+    """
+    Add resource usage to a ``RunStatus`` message
+    :param response: Message to fill
+    :param run: Usage of the whole run, None until it finished
+    :param nodes: Usage of the nodes finished since the previous message
+    """
+    for usage in nodes:
+        response.node_usage.add(**usage)  # pylint: disable=no-member
+    if run is not None:
+        response.run_usage.CopyFrom(ResourceUsage(**run))  # pylint: disable=no-member
+
+
+def _lowest_limit(*limits: float) -> float:
+    """The lowest of the limits set, 0 if none is"""
+    return min((limit for limit in limits if limit > 0), default=0)
+
+
+def _deadline_exceeded(context: Any) -> bool:
+    """
+    Check the client deadline of an RPC, failing the RPC if it passed
+    :param context: gRPC servicer context
+    :return: Whether the deadline passed
+    """
+    remaining = context.time_remaining()
+    if remaining is None or remaining > 0:
+        return False
+    logging.info("Dropped a run request whose deadline passed before it started")
+    context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+    context.set_details("Deadline exceeded before the run started")
+    return True
+
+
+def _load_runner(name: str, cpus: int = 0) -> Any:
+    """
+    Instantiate the runner of a run
+    :param name: ``ResourceRunner``, the name of a runner of ``kedro.runner``,
+        e.g. ``ParallelRunner``, or the import path of a runner class
+    :param cpus: Number of cores the run is bound to, 0 if it isn't
+    :return: The runner, with a worker per core of the run for runners
+        taking ``max_workers``
+    """
+    if name == ResourceRunner.__name__:
+        return ResourceRunner()
+    runner_class = load_obj(name, "kedro.runner")
+    if cpus and "max_workers" in inspect.signature(runner_class).parameters:
+        return runner_class(max_workers=cpus)
+    return runner_class()
+
+
+def _run_keys(
+    request: Any, extra_params: Dict[str, Any], coalesce_window: float
+) -> Dict[str, Optional[float]]:
+    """
+    Keys claimed by a run, so that identical requests are coalesced into it
+    :param request: ``RunParams`` message
+    :param extra_params: Parameter overrides of the run
+    :param coalesce_window: Seconds identical runs are coalesced for, 0 to
+        only coalesce runs with the same idempotency key
+    :return: Seconds each key is claimed for, None for the whole run
+    """
+    keys = {}  # type: Dict[str, Optional[float]]
+    if request.idempotency_key:
+        keys[f"key:{request.idempotency_key}"] = None
+    if coalesce_window > 0:
+        run = [
+            request.pipeline_name or "__default__",
+            split_tags(request.tags),
+            sorted(request.namespaces),
+            extra_params,
+            sorted(request.fetch_datasets),
+        ]
+        digest = hashlib.sha256(json.dumps(run, sort_keys=True).encode()).hexdigest()
+        keys[f"run:{digest}"] = coalesce_window
+    return keys
 
 
 class KedroGrpcServerException(Exception):
@@ -101,12 +805,226 @@ class KedroGrpcServerException(Exception):
     pass
 
 
-def grpc_serve(
+def _set_serving_status(health_servicer: Any, status: Any):
+    for service in ("", SERVICE_NAME):
+        health_servicer.set(service, status)
+
+
+def _load_project(
+    servicer: KedroServer, timer: StartupTimer, cached_datasets: Iterable[str]
+):
+    """Load the project configuration, cached datasets and pipelines of a
+    servicer"""
+    with timer.phase("config"):
+        warm = servicer.config_cache.warm()
+    if warm and cached_datasets:
+        with timer.phase("datasets"):
+            servicer.dataset_cache.load(servicer.config_cache.catalog)
+    with timer.phase("pipelines"):
+        try:
+            servicer.pipeline_index.build()
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.warning("Could not index the project pipelines: %s", exc)
+
+
+def _warm_up(  # pylint: disable=too-many-arguments
+    servicer: KedroServer,
+    health_servicer: Any,
+    executor: futures.ThreadPoolExecutor,
+    max_workers: int,
+    timer: StartupTimer,
+    cached_datasets: Iterable[str],
+    config_poll_interval: float,
+):
+    """
+    Load the project configuration, cached datasets and pipelines and start
+    the worker threads while the server already accepts connections, then
+    report the server as serving. Configuration and pipeline errors are only
+    logged, runs surface them with the full Kedro error.
+    """
+    _load_project(servicer, timer, cached_datasets)
+    with timer.phase("workers"):
+        prime_workers(executor, max_workers)
+    if config_poll_interval:
+        ConfigWatcher(servicer.config_cache, config_poll_interval).start()
+
+    _set_serving_status(health_servicer, health_pb2.HealthCheckResponse.SERVING)
+    timer.report()
+
+
+def _build_servicer(  # pylint: disable=too-many-arguments
+    context: Any,
+    run_store: RunStore,
+    cached_datasets: Iterable[str],
+    dataset_cache_size: int,
+    output_retention: float,
+    trace_output: Optional[str],
+    trace_sample_ratio: float,
+    coalesce_window: float,
+    run_memory_limit: int,
+    run_timeout: float,
+    run_cpus: int,
+    checkpoint_dir: str,
+    run_threads: int = 0,
+    thread_pipelines: Iterable[str] = (),
+) -> KedroServer:
+    """Build the servicer of a server, or of in-process calls"""
+    dataset_cache = DatasetCache(cached_datasets, dataset_cache_size * 2 ** 20)
+    tracer = Tracer()
+    if trace_output:
+        tracer = Tracer(BatchSpanExporter(trace_output), trace_sample_ratio)
+    return KedroServer(
+        context,
+        run_store=run_store,
+        dataset_cache=dataset_cache,
+        result_channel=ResultChannel(retention=output_retention),
+        tracer=tracer,
+        coalesce_window=coalesce_window,
+        memory_limit=run_memory_limit * 2 ** 20,
+        run_timeout=run_timeout,
+        run_cpus=run_cpus,
+        checkpoint_dir=checkpoint_dir,
+        run_threads=run_threads,
+        thread_pipelines=thread_pipelines,
+    )
+
+
+def _listen_addresses(host: str, port: int, tcp: bool, uds: Optional[str]) -> List[str]:
+    """
+    Addresses a server binds
+    :param host: TCP host
+    :param port: TCP port
+    :param tcp: Whether the server listens on TCP
+    :param uds: Path of the Unix domain socket to listen on, if any
+    :return: gRPC addresses, ``host:port`` and ``unix:path``
+    :raises ValueError: If the server would listen on nothing
+    """
+    addresses = [f"{host}:{port}"] if tcp else []
+    if uds:
+        addresses.append(f"unix:{Path(uds).resolve()}")
+    if not addresses:
+        raise ValueError("The server must listen on TCP or a Unix domain socket")
+    return addresses
+
+
+def _start_server(  # pylint: disable=too-many-arguments
+    context: Any,
+    run_store: RunStore,
+    timer: StartupTimer,
+    host: str,
+    port: int,
+    max_workers: int,
+    config_poll_interval: float,
+    cached_datasets: Iterable[str],
+    dataset_cache_size: int,
+    output_retention: float,
+    trace_output: str,
+    trace_sample_ratio: float,
+    coalesce_window: float,
+    run_memory_limit: int,
+    run_timeout: float,
+    run_cpus: int,
+    checkpoint_dir: str,
+    run_threads: int = 0,
+    thread_pipelines: Iterable[str] = (),
+    tcp: bool = True,
+    uds: str = None,
+    options: List[Tuple[str, Any]] = None,
+) -> grpc.Server:
+    """Build and start a server, warming it up in the background"""
+    servicer = _build_servicer(
+        context,
+        run_store,
+        cached_datasets,
+        dataset_cache_size,
+        output_retention,
+        trace_output,
+        trace_sample_ratio,
+        coalesce_window,
+        run_memory_limit,
+        run_timeout,
+        run_cpus,
+        checkpoint_dir,
+        run_threads,
+        thread_pipelines,
+    )
+    health_servicer = health.HealthServicer()
+    _set_serving_status(health_servicer, health_pb2.HealthCheckResponse.NOT_SERVING)
+
+    with timer.phase("bind"):
+        executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+        server = grpc.server(
+            executor,
+            interceptors=[TracingInterceptor(servicer.tracer)],
+            options=options,
+        )
+        add_KedroServicer_to_server(servicer, server)
+        health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
+        addresses = _listen_addresses(host, port, tcp, uds)
+        for address in addresses:
+            if not server.add_insecure_port(address):
+                raise KedroGrpcServerException(f"Could not bind {address}")
+        server.start()
+    logging.info("Kedro gRPC Server started on %s", ", ".join(addresses))
+
+    threading.Thread(
+        target=_warm_up,
+        args=(
+            servicer,
+            health_servicer,
+            executor,
+            max_workers,
+            timer,
+            cached_datasets,
+            config_poll_interval,
+        ),
+        name="kedro-warm-up",
+        daemon=True,
+    ).start()
+    return server
+
+
+def _serve_process(run_store_path: str, **kwargs: Any):
+    """
+    Entry point of a front-end process started by ``grpc_serve``. Every
+    process binds the same port with ``SO_REUSEPORT``, so the kernel spreads
+    connections across them, and shares run state through the run store.
+    :param run_store_path: Path of the SQLite run store
+    :param kwargs: Keyword arguments of ``_start_server``
+    """
+    run_store = RunStore(run_store_path, share_live_events=True)
+    server = _start_server(
+        run_store=run_store,
+        timer=StartupTimer(),
+        options=[("grpc.so_reuseport", 1)],
+        **kwargs,
+    )
+    server.wait_for_termination()
+
+
+def grpc_serve(  # pylint: disable=too-many-arguments
     context: Any = None,
     host: str = "[::]",
     port: int = 50051,
     max_workers: int = 10,
     wait_term: bool = True,
+    config_poll_interval: float = 2.0,
+    run_store_path: str = None,
+    cached_datasets: Iterable[str] = (),
+    dataset_cache_size: int = 1024,
+    output_retention: float = 3600,
+    processes: int = 1,
+    trace_output: str = None,
+    trace_sample_ratio: float = 1.0,
+    coalesce_window: float = 0.0,
+    run_memory_limit: int = 0,
+    run_timeout: float = 0.0,
+    run_cpus: int = 0,
+    tcp: bool = True,
+    uds: str = None,
+    checkpoint_dir: str = None,
+    run_threads: int = 4,
+    thread_pipelines: Iterable[str] = (),
 ):
     """
     Start the Kedro gRPC server
@@ -116,19 +1034,188 @@ def grpc_serve(
     :param port: Port to run the gRPC server on
     :param max_workers: Max number of workers
     :param wait_term: Wait for termination
+    :param config_poll_interval: Seconds between checks for config changes,
+        0 disables reloading configuration in the background
+    :param run_store_path: Path of the SQLite run store, defaults to
+        ``logs/runs.db`` in the project
+    :param cached_datasets: Catalog entries loaded once and shared by all runs
+    :param dataset_cache_size: Memory budget of the dataset cache in MB
+    :param output_retention: Seconds the outputs of a run are kept for
+    :param processes: Number of server processes sharing the port, each
+        with ``max_workers`` threads
+    :param trace_output: OTLP/JSON lines file, or URL of an OTLP/HTTP traces
+        endpoint, to export spans of RPCs and runs to. Tracing is disabled
+        if not set.
+    :param trace_sample_ratio: Share of the traces recorded, from 0 to 1
+    :param coalesce_window: Seconds during which a request for the same
+        pipeline, tags and parameters as an unfinished run returns that run
+        instead of starting a new one, 0 disables it
+    :param run_memory_limit: Maximum address space of every run in MB, 0 for
+        no limit
+    :param run_timeout: Seconds every run may last before it is terminated,
+        0 for no limit
+    :param run_cpus: Number of cores every run is bound to, disjoint from
+        the cores of other runs while enough are free, 0 not to bind runs
+    :param tcp: Whether the server listens on ``host:port``
+    :param uds: Path of a Unix domain socket to listen on, alongside TCP or
+        instead of it, e.g. for clients running on the same host. Only
+        supported with a single process.
+    :param checkpoint_dir: Directory the in-memory datasets of runs asking
+        for checkpoints are saved to, defaults to ``logs/checkpoints`` in the
+        project
+    :param run_threads: Number of threads running the runs of
+        ``thread_pipelines``
+    :param thread_pipelines: Pipelines run on a thread pool of the server
+        instead of a process per run, unless a run needs a memory limit, a
+        timeout, bound cores or tracemalloc
+
+    The server accepts connections as soon as the project context is built,
+    and the ``grpc.health.v1.Health`` service reports it NOT_SERVING until
+    the project configuration and the worker threads are loaded.
 
+    :return: The started server, or the server processes if ``processes`` is
+        more than 1, if not waiting for their termination
     :raises KedroGrpcServerException: Failing to start gRPC Server
     """
+    timer = StartupTimer()
     try:
-        if not context:
-            context = get_project_context()
-        server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
-        add_KedroServicer_to_server(KedroServer(context), server)
-        server.add_insecure_port(f"{host}:{port}")
-        server.start()
-        logging.info("Kedro gRPC Server started on %s", port)
-        if wait_term:  # pragma: no cover
-            server.wait_for_termination()
+        with timer.phase("context"):
+            if not context:
+                context = get_project_context()
+        run_store_path = run_store_path or str(
+            Path(context.project_path) / "logs" / "runs.db"
+        )
+        checkpoint_dir = checkpoint_dir or str(
+            Path(context.project_path) / "logs" / "checkpoints"
+        )
+        with timer.phase("run store"):
+            run_store = RunStore(run_store_path)
+            run_store.interrupt_unfinished()
+        server_args = dict(
+            context=context,
+            host=host,
+            port=port,
+            max_workers=max_workers,
+            config_poll_interval=config_poll_interval,
+            cached_datasets=cached_datasets,
+            dataset_cache_size=dataset_cache_size,
+            output_retention=output_retention,
+            trace_output=trace_output,
+            trace_sample_ratio=trace_sample_ratio,
+            coalesce_window=coalesce_window,
+            run_memory_limit=run_memory_limit,
+            run_timeout=run_timeout,
+            run_cpus=run_cpus,
+            checkpoint_dir=checkpoint_dir,
+            run_threads=run_threads,
+            thread_pipelines=thread_pipelines,
+            tcp=tcp,
+            uds=uds,
+        )
+
+        if processes <= 1:
+            server = _start_server(run_store=run_store, timer=timer, **server_args)
+            if wait_term:  # pragma: no cover
+                server.wait_for_termination()
+            return server
+
+        if uds:
+            # processes can't share a socket path as they share a port
+            raise ValueError("A Unix domain socket requires a single process")
+        # grpc must not be running when forking, each process starts its own
+        run_store.close()
+        workers = [
+            Process(
+                target=_serve_process,
+                args=(run_store_path,),
+                kwargs=server_args,
+                name=f"kedro-grpc-server-{index}",
+            )
+            for index in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+        logging.info("Started %d Kedro gRPC Server processes", processes)
+    except Exception as exc:
+        logging.error(exc)
+        raise KedroGrpcServerException("Failed to start Kedro gRPC Server")
+
+    if wait_term:  # pragma: no cover
+        try:
+            for worker in workers:
+                worker.join()
+        finally:
+            for worker in workers:
+                worker.terminate()
+    return workers
+
+
+def serve_in_process(  # pylint: disable=too-many-arguments
+    context: Any = None,
+    config_poll_interval: float = 2.0,
+    run_store_path: str = None,
+    cached_datasets: Iterable[str] = (),
+    dataset_cache_size: int = 1024,
+    output_retention: float = 3600,
+    trace_output: str = None,
+    trace_sample_ratio: float = 1.0,
+    coalesce_window: float = 0.0,
+    run_memory_limit: int = 0,
+    run_timeout: float = 0.0,
+    run_cpus: int = 0,
+    checkpoint_dir: str = None,
+    run_threads: int = 4,
+    thread_pipelines: Iterable[str] = (),
+) -> InProcessChannel:
+    """
+    Serve the Kedro project to the calling process, for Python applications
+    embedding the server. Stubs built on the returned channel call the
+    servicer directly, without serializing messages nor going through the
+    network stack, and behave as stubs of a remote server otherwise:
+
+    ::
+
+        stub = KedroStub(serve_in_process(context))
+        run_id = stub.Run(RunParams(pipeline_name="de")).run_id
+
+    The project configuration, cached datasets and pipelines are loaded
+    before returning. Arguments are the ones of ``grpc_serve``.
+
+    :return: The channel of the in-process server
+    :raises KedroGrpcServerException: Failing to load the project
+    """
+    timer = StartupTimer()
+    try:
+        with timer.phase("context"):
+            if not context:
+                context = get_project_context()
+        with timer.phase("run store"):
+            run_store = RunStore(
+                run_store_path or str(Path(context.project_path) / "logs" / "runs.db")
+            )
+            run_store.interrupt_unfinished()
+        servicer = _build_servicer(
+            context,
+            run_store,
+            cached_datasets,
+            dataset_cache_size,
+            output_retention,
+            trace_output,
+            trace_sample_ratio,
+            coalesce_window,
+            run_memory_limit,
+            run_timeout,
+            run_cpus,
+            checkpoint_dir or str(Path(context.project_path) / "logs" / "checkpoints"),
+            run_threads,
+            thread_pipelines,
+        )
     except Exception as exc:
         logging.error(exc)
         raise KedroGrpcServerException("Failed to start Kedro gRPC Server")
+
+    _load_project(servicer, timer, cached_datasets)
+    if config_poll_interval:
+        ConfigWatcher(servicer.config_cache, config_poll_interval).start()
+    timer.report()
+    return InProcessChannel(servicer)
@@ -0,0 +1,266 @@
+"""Direct calls to a servicer in the calling process: InProcessChannel"""
+import logging
+import time
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+import grpc
+
+
+class InProcessRpcError(grpc.RpcError):
+    """InProcessRpcError is raised by in-process calls ending with a status
+    other than OK, like the ``grpc.RpcError`` of a network call"""
+
+    def __init__(self, code: grpc.StatusCode, details: str):
+        super().__init__(f"{code.name}: {details}")
+        self._code = code
+        self._details = details
+
+    def code(self) -> grpc.StatusCode:
+        """Status code of the call"""
+        return self._code
+
+    def details(self) -> str:
+        """Status details of the call"""
+        return self._details
+
+    def trailing_metadata(self) -> Tuple:  # pylint: disable=no-self-use
+        """No metadata is sent in-process"""
+        return ()
+
+
+class _DirectContext:
+    """Servicer context of an in-process call"""
+
+    # pylint: disable=missing-function-docstring
+
+    def __init__(self, timeout: float = None, metadata: Sequence = None):
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+        self._metadata = tuple(metadata or ())
+        self._code = grpc.StatusCode.OK
+        self._details = ""
+        self._active = True
+        self._callbacks = []  # type: List[Callable[[], None]]
+
+    def invocation_metadata(self) -> Tuple:
+        return self._metadata
+
+    def peer(self) -> str:  # pylint: disable=no-self-use
+        return "in-process"
+
+    def time_remaining(self) -> Optional[float]:
+        if self._deadline is None:
+            return None
+        return max(self._deadline - time.monotonic(), 0.0)
+
+    def is_active(self) -> bool:
+        return self._active and self.time_remaining() != 0.0
+
+    def add_callback(self, callback: Callable[[], None]) -> bool:
+        self._callbacks.append(callback)
+        return True
+
+    def set_code(self, code: grpc.StatusCode):
+        self._code = code
+
+    def set_details(self, details: str):
+        self._details = details
+
+    def set_trailing_metadata(self, metadata):
+        pass
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+    def details(self) -> str:
+        return self._details
+
+    def abort(self, code: grpc.StatusCode, details: str):
+        self._code, self._details = code, details
+        raise InProcessRpcError(code, details)
+
+    def cancel(self):
+        """Cancel the call, as a client cancelling a stream"""
+        if self._active:
+            self._code = grpc.StatusCode.CANCELLED
+            self._details = "Locally cancelled by application!"
+        self.finish()
+
+    def finish(self):
+        """End the call, calling the termination callbacks once"""
+        self._active = False
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def raise_for_status(self):
+        """Raise the error of a call which set a status or ran past its
+        deadline"""
+        if self._code is grpc.StatusCode.OK and self.time_remaining() == 0.0:
+            self._code, self._details = (
+                grpc.StatusCode.DEADLINE_EXCEEDED,
+                "Deadline Exceeded",
+            )
+        if self._code is not grpc.StatusCode.OK:
+            raise InProcessRpcError(self._code, self._details)
+
+
+def _application_error(exc: Exception) -> InProcessRpcError:
+    logging.exception("Exception calling application: %s", exc)
+    return InProcessRpcError(
+        grpc.StatusCode.UNKNOWN, f"Exception calling application: {exc}"
+    )
+
+
+class _ResponseStream:
+    """Responses of a server streaming in-process call"""
+
+    # pylint: disable=missing-function-docstring
+
+    def __init__(self, responses: Iterator, context: _DirectContext):
+        self._responses = responses
+        self._context = context
+
+    def __iter__(self) -> "_ResponseStream":
+        return self
+
+    def __next__(self) -> Any:
+        if self._context.time_remaining() == 0.0:
+            self._close()
+            self._context.raise_for_status()
+        try:
+            return next(self._responses)
+        except StopIteration:
+            self._context.finish()
+            self._context.raise_for_status()
+            raise
+        except grpc.RpcError:
+            self._context.finish()
+            raise
+        except Exception as exc:
+            self._context.finish()
+            raise _application_error(exc)
+
+    def _close(self):
+        close = getattr(self._responses, "close", None)
+        if close is not None:
+            close()
+        self._context.finish()
+
+    def cancel(self):
+        """Stop the stream, closing the servicer generator"""
+        self._context.cancel()
+        self._close()
+
+    def code(self) -> grpc.StatusCode:
+        return self._context.code()
+
+    def details(self) -> str:
+        return self._context.details()
+
+    def is_active(self) -> bool:
+        return self._context.is_active()
+
+
+class _MultiCallable:
+    """Stub method calling a servicer method directly"""
+
+    def __init__(self, handler: Callable, stream_response: bool):
+        self._handler = handler
+        self._stream_response = stream_response
+
+    def __call__(  # pylint: disable=unused-argument
+        self, request: Any, timeout: float = None, metadata: Sequence = None, **kwargs
+    ) -> Any:
+        context = _DirectContext(timeout, metadata)
+        if self._stream_response:
+            return _ResponseStream(iter(self._call(request, context)), context)
+        response = self._call(request, context)
+        context.finish()
+        context.raise_for_status()
+        return response
+
+    def with_call(  # pylint: disable=unused-argument
+        self, request: Any, timeout: float = None, metadata: Sequence = None, **kwargs
+    ) -> Tuple[Any, Any]:
+        """
+        Call the method, also returning the call
+        :return: The response, and the call with its ``code`` and ``details``
+        """
+        context = _DirectContext(timeout, metadata)
+        response = self._call(request, context)
+        context.finish()
+        context.raise_for_status()
+        return response, context
+
+    def _call(self, request: Any, context: _DirectContext) -> Any:
+        try:
+            return self._handler(request, context)
+        except grpc.RpcError:
+            context.finish()
+            raise
+        except Exception as exc:
+            context.finish()
+            raise _application_error(exc)
+
+
+class InProcessChannel:
+    """InProcessChannel lets the generated stubs call a servicer living in
+    the same process. Every stub call is a direct call of the servicer
+    method: requests and responses are passed as message objects, never
+    serialized, and no connection, HTTP/2 framing nor thread hop is
+    involved. Calls behave as network calls otherwise, with deadlines,
+    metadata and statuses raised as ``grpc.RpcError``, so code written
+    against a remote server works unchanged.
+
+    Server interceptors are not applied to in-process calls.
+
+    ::
+
+        stub = KedroStub(InProcessChannel(servicer))
+        stub.ListPipelines(PipelineParams())
+    """
+
+    def __init__(self, servicer: Any):
+        """
+        Instantiates the channel
+        :param servicer: Servicer the calls are made to
+        """
+        self.servicer = servicer
+
+    def _handler(self, method: str) -> Callable:
+        handler = getattr(self.servicer, method.rpartition("/")[2], None)
+        if handler is not None:
+            return handler
+
+        def _unimplemented(request, context):  # pylint: disable=unused-argument
+            context.abort(grpc.StatusCode.UNIMPLEMENTED, f"Method {method} not found")
+
+        return _unimplemented
+
+    # pylint: disable=unused-argument,missing-function-docstring
+    def unary_unary(self, method: str, *args, **kwargs) -> _MultiCallable:
+        return _MultiCallable(self._handler(method), stream_response=False)
+
+    def unary_stream(self, method: str, *args, **kwargs) -> _MultiCallable:
+        return _MultiCallable(self._handler(method), stream_response=True)
+
+    def stream_unary(self, method: str, *args, **kwargs) -> _MultiCallable:
+        return _MultiCallable(self._handler(method), stream_response=False)
+
+    def stream_stream(self, method: str, *args, **kwargs) -> _MultiCallable:
+        return _MultiCallable(self._handler(method), stream_response=True)
+
+    def subscribe(self, callback: Callable, try_to_connect: bool = False):
+        callback(grpc.ChannelConnectivity.READY)
+
+    def unsubscribe(self, callback: Callable):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self) -> "InProcessChannel":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -11,6 +11,7 @@ from google.protobuf import symbol_database as _symbol_database
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
 
 
 DESCRIPTOR = _descriptor.FileDescriptor(
@@ -19,8 +20,9 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   syntax='proto3',
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\x1dkedro_grpc_server/kedro.proto\x12\x05kedro\"-\n\nRunSummary\x12\x0e\n\x06run_id\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\t\"0\n\tRunParams\x12\x15\n\rpipeline_name\x18\x01 \x01(\t\x12\x0c\n\x04tags\x18\x02 \x01(\t\"#\n\x0fPipelineSummary\x12\x10\n\x08pipeline\x18\x01 \x03(\t\"\x10\n\x0ePipelineParams\"\x17\n\x05RunId\x12\x0e\n\x06run_id\x18\x01 \x01(\t\"c\n\tRunStatus\x12\x0e\n\x06\x65vents\x18\x01 \x03(\t\x12\x11\n\texit_code\x18\x02 \x01(\t\x12\x0e\n\x06run_id\x18\x03 \x01(\t\x12\x0f\n\x07success\x18\x04 \x01(\t\x12\x12\n\nrun_status\x18\x05 \x01(\t2\xa1\x01\n\x05Kedro\x12>\n\rListPipelines\x12\x15.kedro.PipelineParams\x1a\x16.kedro.PipelineSummary\x12*\n\x03Run\x12\x10.kedro.RunParams\x1a\x11.kedro.RunSummary\x12,\n\x06Status\x12\x0c.kedro.RunId\x1a\x10.kedro.RunStatus\"\x00\x30\x01\x62\x06proto3'
-)
+  serialized_pb=b'\n\x1dkedro_grpc_server/kedro.proto\x12\x05kedro\x1a\x1cgoogle/protobuf/struct.proto\"W\n\nRunSummary\x12\x0e\n\x06run_id\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\t\x12\x11\n\tcoalesced\x18\x03 \x01(\x08\x12\x15\n\rskipped_nodes\x18\x04 \x03(\t\"\x8d\x02\n\tRunParams\x12\x15\n\rpipeline_name\x18\x01 \x01(\t\x12\x0c\n\x04tags\x18\x02 \x03(\t\x12\'\n\x06params\x18\x03 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x17\n\x0fidempotency_key\x18\x04 \x01(\t\x12\x0e\n\x06runner\x18\x05 \x01(\t\x12\x14\n\x0cmemory_limit\x18\x06 \x01(\x03\x12\x14\n\x0ctrace_malloc\x18\x07 \x01(\x08\x12\x16\n\x0e\x66\x65tch_datasets\x18\x08 \x03(\t\x12\x12\n\nnamespaces\x18\t \x03(\t\x12\x0f\n\x07timeout\x18\n \x01(\x01\x12\x0c\n\x04\x63pus\x18\x0b \x01(\x05\x12\x12\n\ncheckpoint\x18\x0c \x01(\x08\"\x1e\n\x0cResumeParams\x12\x0e\n\x06run_id\x18\x01 \x01(\t\"#\n\x0fPipelineSummary\x12\x10\n\x08pipeline\x18\x01 \x03(\t\"\x10\n\x0ePipelineParams\"s\n\x05RunId\x12\x0e\n\x06run_id\x18\x01 \x01(\t\x12\x16\n\x0esince_sequence\x18\x02 \x01(\x03\x12\x11\n\tmin_level\x18\x03 \x01(\t\x12\x0f\n\x07streams\x18\x04 \x03(\t\x12\r\n\x05nodes\x18\x05 \x03(\t\x12\x0f\n\x07pattern\x18\x06 \x01(\t\"\x9b\x02\n\tRunStatus\x12\x0e\n\x06\x65vents\x18\x01 \x03(\t\x12\x11\n\texit_code\x18\x02 \x01(\t\x12\x0e\n\x06run_id\x18\x03 \x01(\t\x12\x0f\n\x07success\x18\x04 \x01(\t\x12\x12\n\nrun_status\x18\x05 \x01(\t\x12\x10\n\x08sequence\x18\x06 \x01(\x03\x12(\n\nnode_usage\x18\x07 \x03(\x0b\x32\x14.kedro.ResourceUsage\x12\'\n\trun_usage\x18\x08 \x01(\x0b\x32\x14.kedro.ResourceUsage\x12+\n\x0esaved_datasets\x18\t \x03(\x0b\x32\x13.kedro.SavedDataset\x12$\n\ndataset_io\x18\n \x03(\x0b\x32\x10.kedro.DatasetIO\"u\n\x0cSavedDataset\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\x12\x0c\n\x04size\x18\x03 \x01(\x03\x12\x11\n\tfetchable\x18\x04 \x01(\x08\x12\x11\n\tpersisted\x18\x05 \x01(\x08\x12\x12\n\ncheckpoint\x18\x06 \x01(\t\"Z\n\tDatasetIO\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\toperation\x18\x02 \x01(\t\x12\x10\n\x08\x64uration\x18\x03 \x01(\x01\x12\x0c\n\x04size\x18\x04 \x01(\x03\x12\x0c\n\x04rows\x18\x05 \x01(\x03\"m\n\rResourceUsage\x12\x0c\n\x04node\x18\x01 \x01(\t\x12\x11\n\twall_time\x18\x02 \x01(\x01\x12\x10\n\x08\x63pu_time\x18\x03 \x01(\x01\x12\x0f\n\x07max_rss\x18\x04 \x01(\x03\x12\x18\n\x10tracemalloc_peak\x18\x05 \x01(\x03\"S\n\x0bWatchParams\x12\x16\n\x0epipeline_names\x18\x01 \x03(\t\x12\x14\n\x0crun_statuses\x18\x02 \x03(\t\x12\x16\n\x0einclude_events\x18\x03 \x01(\x08\"h\n\x08RunEvent\x12\x0e\n\x06run_id\x18\x01 \x01(\t\x12\x15\n\rpipeline_name\x18\x02 \x01(\t\x12\x12\n\nrun_status\x18\x03 \x01(\t\x12\x0e\n\x06\x65vents\x18\x04 \x03(\t\x12\x11\n\texit_code\x18\x05 \x01(\t\"^\n\x0eListRunsParams\x12\x15\n\rpipeline_name\x18\x01 \x01(\t\x12\x12\n\nrun_status\x18\x02 \x01(\t\x12\x11\n\tpage_size\x18\x03 \x01(\x05\x12\x0e\n\x06\x63ursor\x18\x04 \x01(\t\"\x7f\n\tRunRecord\x12\x0e\n\x06run_id\x18\x01 \x01(\t\x12\x15\n\rpipeline_name\x18\x02 \x01(\t\x12\x12\n\nrun_status\x18\x03 \x01(\t\x12\x12\n\nstart_time\x18\x04 \x01(\x01\x12\x10\n\x08\x65nd_time\x18\x05 \x01(\x01\x12\x11\n\texit_code\x18\x06 \x01(\t\">\n\x07RunList\x12\x1e\n\x04runs\x18\x01 \x03(\x0b\x32\x10.kedro.RunRecord\x12\x13\n\x0bnext_cursor\x18\x02 \x01(\t\"-\n\x0cOutputParams\x12\x0e\n\x06run_id\x18\x01 \x01(\t\x12\r\n\x05names\x18\x02 \x03(\t\"W\n\x0bOutputChunk\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06\x66ormat\x18\x02 \x01(\t\x12\x0e\n\x06offset\x18\x03 \x01(\x03\x12\x0c\n\x04size\x18\x04 \x01(\x03\x12\x0c\n\x04\x64\x61ta\x18\x05 \x01(\x0c\"C\n\x0eSessionRequest\x12\x12\n\nrequest_id\x18\x01 \x01(\t\x12\x1d\n\x03run\x18\x02 \x01(\x0b\x32\x10.kedro.RunParams\"\xa0\x01\n\x0fSessionResponse\x12\x12\n\nrequest_id\x18\x01 \x01(\t\x12\x0e\n\x06run_id\x18\x02 \x01(\t\x12\x12\n\nrun_status\x18\x03 \x01(\t\x12\x0e\n\x06\x65vents\x18\x04 \x03(\t\x12\x11\n\texit_code\x18\x05 \x01(\t\x12\r\n\x05\x65rror\x18\x06 \x01(\t\x12#\n\x07outputs\x18\x07 \x03(\x0b\x32\x12.kedro.OutputChunk\"=\n\rPreviewParams\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x03\x12\x0f\n\x07\x63olumns\x18\x03 \x03(\t\"\xbc\x01\n\x0e\x44\x61tasetPreview\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x14\n\x0c\x64\x61taset_type\x18\x02 \x01(\t\x12\x1d\n\x06schema\x18\x03 \x03(\x0b\x32\r.kedro.Column\x12%\n\x04rows\x18\x04 \x03(\x0b\x32\x17.google.protobuf.Struct\x12\x10\n\x08pushdown\x18\x05 \x03(\t\x12\x0e\n\x06\x63\x61\x63hed\x18\x06 \x01(\x08\x12\x0c\n\x04size\x18\x07 \x01(\x03\x12\x10\n\x08versions\x18\x08 \x03(\t\"%\n\x06\x43olumn\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x64type\x18\x02 \x01(\t\"I\n\x12\x44\x61tasetStatsParams\x12\r\n\x05names\x18\x01 \x03(\t\x12\x15\n\rpipeline_name\x18\x02 \x01(\t\x12\r\n\x05since\x18\x03 \x01(\x01\"\xcf\x01\n\x0e\x44\x61tasetIOStats\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\toperation\x18\x02 \x01(\t\x12\x0c\n\x04runs\x18\x03 \x01(\x03\x12\r\n\x05\x63ount\x18\x04 \x01(\x03\x12\x16\n\x0etotal_duration\x18\x05 \x01(\x01\x12\x15\n\rmean_duration\x18\x06 \x01(\x01\x12\x14\n\x0cmax_duration\x18\x07 \x01(\x01\x12\x12\n\ntotal_size\x18\x08 \x01(\x03\x12\x12\n\ntotal_rows\x18\t \x01(\x03\x12\x12\n\nthroughput\x18\n \x01(\x01\"8\n\x10\x44\x61tasetStatsList\x12$\n\x05stats\x18\x01 \x03(\x0b\x32\x15.kedro.DatasetIOStats2\xba\x04\n\x05Kedro\x12>\n\rListPipelines\x12\x15.kedro.PipelineParams\x1a\x16.kedro.PipelineSummary\x12*\n\x03Run\x12\x10.kedro.RunParams\x1a\x11.kedro.RunSummary\x12,\n\x06Status\x12\x0c.kedro.RunId\x1a\x10.kedro.RunStatus\"\x00\x30\x01\x12\x34\n\tWatchRuns\x12\x12.kedro.WatchParams\x1a\x0f.kedro.RunEvent\"\x00\x30\x01\x12\x31\n\x08ListRuns\x12\x15.kedro.ListRunsParams\x1a\x0e.kedro.RunList\x12\x39\n\nGetOutputs\x12\x13.kedro.OutputParams\x1a\x12.kedro.OutputChunk\"\x00\x30\x01\x12>\n\x07Session\x12\x15.kedro.SessionRequest\x1a\x16.kedro.SessionResponse\"\x00(\x01\x30\x01\x12=\n\x0ePreviewDataset\x12\x14.kedro.PreviewParams\x1a\x15.kedro.DatasetPreview\x12\x30\n\x06Resume\x12\x13.kedro.ResumeParams\x1a\x11.kedro.RunSummary\x12\x42\n\x0c\x44\x61tasetStats\x12\x19.kedro.DatasetStatsParams\x1a\x17.kedro.DatasetStatsListb\x06proto3'
+  ,
+  dependencies=[google_dot_protobuf_dot_struct__pb2.DESCRIPTOR,])
 
 
 
@@ -34,19 +36,1057 @@ _RUNSUMMARY = _descriptor.Descriptor(
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='run_id', full_name='kedro.RunSummary.run_id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
+      name='run_id', full_name='kedro.RunSummary.run_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='success', full_name='kedro.RunSummary.success', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='coalesced', full_name='kedro.RunSummary.coalesced', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='skipped_nodes', full_name='kedro.RunSummary.skipped_nodes', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=70,
+  serialized_end=157,
+)
+
+
+_RUNPARAMS = _descriptor.Descriptor(
+  name='RunParams',
+  full_name='kedro.RunParams',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='pipeline_name', full_name='kedro.RunParams.pipeline_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='tags', full_name='kedro.RunParams.tags', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='params', full_name='kedro.RunParams.params', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='idempotency_key', full_name='kedro.RunParams.idempotency_key', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='runner', full_name='kedro.RunParams.runner', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='memory_limit', full_name='kedro.RunParams.memory_limit', index=5,
+      number=6, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='trace_malloc', full_name='kedro.RunParams.trace_malloc', index=6,
+      number=7, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='fetch_datasets', full_name='kedro.RunParams.fetch_datasets', index=7,
+      number=8, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='namespaces', full_name='kedro.RunParams.namespaces', index=8,
+      number=9, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='timeout', full_name='kedro.RunParams.timeout', index=9,
+      number=10, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='cpus', full_name='kedro.RunParams.cpus', index=10,
+      number=11, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='checkpoint', full_name='kedro.RunParams.checkpoint', index=11,
+      number=12, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=160,
+  serialized_end=429,
+)
+
+
+_RESUMEPARAMS = _descriptor.Descriptor(
+  name='ResumeParams',
+  full_name='kedro.ResumeParams',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='run_id', full_name='kedro.ResumeParams.run_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=431,
+  serialized_end=461,
+)
+
+
+_PIPELINESUMMARY = _descriptor.Descriptor(
+  name='PipelineSummary',
+  full_name='kedro.PipelineSummary',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='pipeline', full_name='kedro.PipelineSummary.pipeline', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=463,
+  serialized_end=498,
+)
+
+
+_PIPELINEPARAMS = _descriptor.Descriptor(
+  name='PipelineParams',
+  full_name='kedro.PipelineParams',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=500,
+  serialized_end=516,
+)
+
+
+_RUNID = _descriptor.Descriptor(
+  name='RunId',
+  full_name='kedro.RunId',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='run_id', full_name='kedro.RunId.run_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='since_sequence', full_name='kedro.RunId.since_sequence', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='min_level', full_name='kedro.RunId.min_level', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='streams', full_name='kedro.RunId.streams', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='nodes', full_name='kedro.RunId.nodes', index=4,
+      number=5, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pattern', full_name='kedro.RunId.pattern', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=518,
+  serialized_end=633,
+)
+
+
+_RUNSTATUS = _descriptor.Descriptor(
+  name='RunStatus',
+  full_name='kedro.RunStatus',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='events', full_name='kedro.RunStatus.events', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='exit_code', full_name='kedro.RunStatus.exit_code', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='run_id', full_name='kedro.RunStatus.run_id', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='success', full_name='kedro.RunStatus.success', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='run_status', full_name='kedro.RunStatus.run_status', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='sequence', full_name='kedro.RunStatus.sequence', index=5,
+      number=6, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='node_usage', full_name='kedro.RunStatus.node_usage', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='run_usage', full_name='kedro.RunStatus.run_usage', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='saved_datasets', full_name='kedro.RunStatus.saved_datasets', index=8,
+      number=9, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='dataset_io', full_name='kedro.RunStatus.dataset_io', index=9,
+      number=10, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=636,
+  serialized_end=919,
+)
+
+
+_SAVEDDATASET = _descriptor.Descriptor(
+  name='SavedDataset',
+  full_name='kedro.SavedDataset',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='kedro.SavedDataset.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='version', full_name='kedro.SavedDataset.version', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='size', full_name='kedro.SavedDataset.size', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='fetchable', full_name='kedro.SavedDataset.fetchable', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='persisted', full_name='kedro.SavedDataset.persisted', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='checkpoint', full_name='kedro.SavedDataset.checkpoint', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=921,
+  serialized_end=1038,
+)
+
+
+_DATASETIO = _descriptor.Descriptor(
+  name='DatasetIO',
+  full_name='kedro.DatasetIO',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='kedro.DatasetIO.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='operation', full_name='kedro.DatasetIO.operation', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='duration', full_name='kedro.DatasetIO.duration', index=2,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='size', full_name='kedro.DatasetIO.size', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rows', full_name='kedro.DatasetIO.rows', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1040,
+  serialized_end=1130,
+)
+
+
+_RESOURCEUSAGE = _descriptor.Descriptor(
+  name='ResourceUsage',
+  full_name='kedro.ResourceUsage',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='node', full_name='kedro.ResourceUsage.node', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='wall_time', full_name='kedro.ResourceUsage.wall_time', index=1,
+      number=2, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='cpu_time', full_name='kedro.ResourceUsage.cpu_time', index=2,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_rss', full_name='kedro.ResourceUsage.max_rss', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='tracemalloc_peak', full_name='kedro.ResourceUsage.tracemalloc_peak', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1132,
+  serialized_end=1241,
+)
+
+
+_WATCHPARAMS = _descriptor.Descriptor(
+  name='WatchParams',
+  full_name='kedro.WatchParams',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='pipeline_names', full_name='kedro.WatchParams.pipeline_names', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='run_statuses', full_name='kedro.WatchParams.run_statuses', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='include_events', full_name='kedro.WatchParams.include_events', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1243,
+  serialized_end=1326,
+)
+
+
+_RUNEVENT = _descriptor.Descriptor(
+  name='RunEvent',
+  full_name='kedro.RunEvent',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='run_id', full_name='kedro.RunEvent.run_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pipeline_name', full_name='kedro.RunEvent.pipeline_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='run_status', full_name='kedro.RunEvent.run_status', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='events', full_name='kedro.RunEvent.events', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='exit_code', full_name='kedro.RunEvent.exit_code', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1328,
+  serialized_end=1432,
+)
+
+
+_LISTRUNSPARAMS = _descriptor.Descriptor(
+  name='ListRunsParams',
+  full_name='kedro.ListRunsParams',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='pipeline_name', full_name='kedro.ListRunsParams.pipeline_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='run_status', full_name='kedro.ListRunsParams.run_status', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='page_size', full_name='kedro.ListRunsParams.page_size', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='cursor', full_name='kedro.ListRunsParams.cursor', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1434,
+  serialized_end=1528,
+)
+
+
+_RUNRECORD = _descriptor.Descriptor(
+  name='RunRecord',
+  full_name='kedro.RunRecord',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='run_id', full_name='kedro.RunRecord.run_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pipeline_name', full_name='kedro.RunRecord.pipeline_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='run_status', full_name='kedro.RunRecord.run_status', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='start_time', full_name='kedro.RunRecord.start_time', index=3,
+      number=4, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='end_time', full_name='kedro.RunRecord.end_time', index=4,
+      number=5, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='exit_code', full_name='kedro.RunRecord.exit_code', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1530,
+  serialized_end=1657,
+)
+
+
+_RUNLIST = _descriptor.Descriptor(
+  name='RunList',
+  full_name='kedro.RunList',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='runs', full_name='kedro.RunList.runs', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='next_cursor', full_name='kedro.RunList.next_cursor', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1659,
+  serialized_end=1721,
+)
+
+
+_OUTPUTPARAMS = _descriptor.Descriptor(
+  name='OutputParams',
+  full_name='kedro.OutputParams',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='run_id', full_name='kedro.OutputParams.run_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='names', full_name='kedro.OutputParams.names', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1723,
+  serialized_end=1768,
+)
+
+
+_OUTPUTCHUNK = _descriptor.Descriptor(
+  name='OutputChunk',
+  full_name='kedro.OutputChunk',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='kedro.OutputChunk.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='format', full_name='kedro.OutputChunk.format', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='kedro.OutputChunk.offset', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='size', full_name='kedro.OutputChunk.size', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='kedro.OutputChunk.data', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1770,
+  serialized_end=1857,
+)
+
+
+_SESSIONREQUEST = _descriptor.Descriptor(
+  name='SessionRequest',
+  full_name='kedro.SessionRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='request_id', full_name='kedro.SessionRequest.request_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='run', full_name='kedro.SessionRequest.run', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1859,
+  serialized_end=1926,
+)
+
+
+_SESSIONRESPONSE = _descriptor.Descriptor(
+  name='SessionResponse',
+  full_name='kedro.SessionResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='request_id', full_name='kedro.SessionResponse.request_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='run_id', full_name='kedro.SessionResponse.run_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='run_status', full_name='kedro.SessionResponse.run_status', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='events', full_name='kedro.SessionResponse.events', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='exit_code', full_name='kedro.SessionResponse.exit_code', index=4,
+      number=5, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='success', full_name='kedro.RunSummary.success', index=1,
-      number=2, type=9, cpp_type=9, label=1,
+      name='error', full_name='kedro.SessionResponse.error', index=5,
+      number=6, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='outputs', full_name='kedro.SessionResponse.outputs', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -59,30 +1099,37 @@ _RUNSUMMARY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=40,
-  serialized_end=85,
+  serialized_start=1929,
+  serialized_end=2089,
 )
 
 
-_RUNPARAMS = _descriptor.Descriptor(
-  name='RunParams',
-  full_name='kedro.RunParams',
+_PREVIEWPARAMS = _descriptor.Descriptor(
+  name='PreviewParams',
+  full_name='kedro.PreviewParams',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='pipeline_name', full_name='kedro.RunParams.pipeline_name', index=0,
+      name='name', full_name='kedro.PreviewParams.name', index=0,
       number=1, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='tags', full_name='kedro.RunParams.tags', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
+      name='limit', full_name='kedro.PreviewParams.limit', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='columns', full_name='kedro.PreviewParams.columns', index=2,
+      number=3, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
@@ -98,22 +1145,71 @@ _RUNPARAMS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=87,
-  serialized_end=135,
+  serialized_start=2091,
+  serialized_end=2152,
 )
 
 
-_PIPELINESUMMARY = _descriptor.Descriptor(
-  name='PipelineSummary',
-  full_name='kedro.PipelineSummary',
+_DATASETPREVIEW = _descriptor.Descriptor(
+  name='DatasetPreview',
+  full_name='kedro.DatasetPreview',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='pipeline', full_name='kedro.PipelineSummary.pipeline', index=0,
-      number=1, type=9, cpp_type=9, label=3,
+      name='name', full_name='kedro.DatasetPreview.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='dataset_type', full_name='kedro.DatasetPreview.dataset_type', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='schema', full_name='kedro.DatasetPreview.schema', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rows', full_name='kedro.DatasetPreview.rows', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pushdown', full_name='kedro.DatasetPreview.pushdown', index=4,
+      number=5, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='cached', full_name='kedro.DatasetPreview.cached', index=5,
+      number=6, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='size', full_name='kedro.DatasetPreview.size', index=6,
+      number=7, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='versions', full_name='kedro.DatasetPreview.versions', index=7,
+      number=8, type=9, cpp_type=9, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
@@ -130,19 +1226,33 @@ _PIPELINESUMMARY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=137,
-  serialized_end=172,
+  serialized_start=2155,
+  serialized_end=2343,
 )
 
 
-_PIPELINEPARAMS = _descriptor.Descriptor(
-  name='PipelineParams',
-  full_name='kedro.PipelineParams',
+_COLUMN = _descriptor.Descriptor(
+  name='Column',
+  full_name='kedro.Column',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='kedro.Column.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='dtype', full_name='kedro.Column.dtype', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -155,26 +1265,40 @@ _PIPELINEPARAMS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=174,
-  serialized_end=190,
+  serialized_start=2345,
+  serialized_end=2382,
 )
 
 
-_RUNID = _descriptor.Descriptor(
-  name='RunId',
-  full_name='kedro.RunId',
+_DATASETSTATSPARAMS = _descriptor.Descriptor(
+  name='DatasetStatsParams',
+  full_name='kedro.DatasetStatsParams',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='run_id', full_name='kedro.RunId.run_id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
+      name='names', full_name='kedro.DatasetStatsParams.names', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pipeline_name', full_name='kedro.DatasetStatsParams.pipeline_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='since', full_name='kedro.DatasetStatsParams.since', index=2,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -187,51 +1311,118 @@ _RUNID = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=192,
-  serialized_end=215,
+  serialized_start=2384,
+  serialized_end=2457,
 )
 
 
-_RUNSTATUS = _descriptor.Descriptor(
-  name='RunStatus',
-  full_name='kedro.RunStatus',
+_DATASETIOSTATS = _descriptor.Descriptor(
+  name='DatasetIOStats',
+  full_name='kedro.DatasetIOStats',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='events', full_name='kedro.RunStatus.events', index=0,
-      number=1, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
+      name='name', full_name='kedro.DatasetIOStats.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='exit_code', full_name='kedro.RunStatus.exit_code', index=1,
+      name='operation', full_name='kedro.DatasetIOStats.operation', index=1,
       number=2, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='run_id', full_name='kedro.RunStatus.run_id', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
+      name='runs', full_name='kedro.DatasetIOStats.runs', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='success', full_name='kedro.RunStatus.success', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
+      name='count', full_name='kedro.DatasetIOStats.count', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='run_status', full_name='kedro.RunStatus.run_status', index=4,
-      number=5, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
+      name='total_duration', full_name='kedro.DatasetIOStats.total_duration', index=4,
+      number=5, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='mean_duration', full_name='kedro.DatasetIOStats.mean_duration', index=5,
+      number=6, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_duration', full_name='kedro.DatasetIOStats.max_duration', index=6,
+      number=7, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='total_size', full_name='kedro.DatasetIOStats.total_size', index=7,
+      number=8, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='total_rows', full_name='kedro.DatasetIOStats.total_rows', index=8,
+      number=9, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='throughput', full_name='kedro.DatasetIOStats.throughput', index=9,
+      number=10, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2460,
+  serialized_end=2667,
+)
+
+
+_DATASETSTATSLIST = _descriptor.Descriptor(
+  name='DatasetStatsList',
+  full_name='kedro.DatasetStatsList',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='stats', full_name='kedro.DatasetStatsList.stats', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
@@ -247,16 +1438,46 @@ _RUNSTATUS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=217,
-  serialized_end=316,
+  serialized_start=2669,
+  serialized_end=2725,
 )
 
+_RUNPARAMS.fields_by_name['params'].message_type = google_dot_protobuf_dot_struct__pb2._STRUCT
+_RUNSTATUS.fields_by_name['node_usage'].message_type = _RESOURCEUSAGE
+_RUNSTATUS.fields_by_name['run_usage'].message_type = _RESOURCEUSAGE
+_RUNSTATUS.fields_by_name['saved_datasets'].message_type = _SAVEDDATASET
+_RUNSTATUS.fields_by_name['dataset_io'].message_type = _DATASETIO
+_RUNLIST.fields_by_name['runs'].message_type = _RUNRECORD
+_SESSIONREQUEST.fields_by_name['run'].message_type = _RUNPARAMS
+_SESSIONRESPONSE.fields_by_name['outputs'].message_type = _OUTPUTCHUNK
+_DATASETPREVIEW.fields_by_name['schema'].message_type = _COLUMN
+_DATASETPREVIEW.fields_by_name['rows'].message_type = google_dot_protobuf_dot_struct__pb2._STRUCT
+_DATASETSTATSLIST.fields_by_name['stats'].message_type = _DATASETIOSTATS
 DESCRIPTOR.message_types_by_name['RunSummary'] = _RUNSUMMARY
 DESCRIPTOR.message_types_by_name['RunParams'] = _RUNPARAMS
+DESCRIPTOR.message_types_by_name['ResumeParams'] = _RESUMEPARAMS
 DESCRIPTOR.message_types_by_name['PipelineSummary'] = _PIPELINESUMMARY
 DESCRIPTOR.message_types_by_name['PipelineParams'] = _PIPELINEPARAMS
 DESCRIPTOR.message_types_by_name['RunId'] = _RUNID
 DESCRIPTOR.message_types_by_name['RunStatus'] = _RUNSTATUS
+DESCRIPTOR.message_types_by_name['SavedDataset'] = _SAVEDDATASET
+DESCRIPTOR.message_types_by_name['DatasetIO'] = _DATASETIO
+DESCRIPTOR.message_types_by_name['ResourceUsage'] = _RESOURCEUSAGE
+DESCRIPTOR.message_types_by_name['WatchParams'] = _WATCHPARAMS
+DESCRIPTOR.message_types_by_name['RunEvent'] = _RUNEVENT
+DESCRIPTOR.message_types_by_name['ListRunsParams'] = _LISTRUNSPARAMS
+DESCRIPTOR.message_types_by_name['RunRecord'] = _RUNRECORD
+DESCRIPTOR.message_types_by_name['RunList'] = _RUNLIST
+DESCRIPTOR.message_types_by_name['OutputParams'] = _OUTPUTPARAMS
+DESCRIPTOR.message_types_by_name['OutputChunk'] = _OUTPUTCHUNK
+DESCRIPTOR.message_types_by_name['SessionRequest'] = _SESSIONREQUEST
+DESCRIPTOR.message_types_by_name['SessionResponse'] = _SESSIONRESPONSE
+DESCRIPTOR.message_types_by_name['PreviewParams'] = _PREVIEWPARAMS
+DESCRIPTOR.message_types_by_name['DatasetPreview'] = _DATASETPREVIEW
+DESCRIPTOR.message_types_by_name['Column'] = _COLUMN
+DESCRIPTOR.message_types_by_name['DatasetStatsParams'] = _DATASETSTATSPARAMS
+DESCRIPTOR.message_types_by_name['DatasetIOStats'] = _DATASETIOSTATS
+DESCRIPTOR.message_types_by_name['DatasetStatsList'] = _DATASETSTATSLIST
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 RunSummary = _reflection.GeneratedProtocolMessageType('RunSummary', (_message.Message,), {
@@ -273,6 +1494,13 @@ RunParams = _reflection.GeneratedProtocolMessageType('RunParams', (_message.Mess
   })
 _sym_db.RegisterMessage(RunParams)
 
+ResumeParams = _reflection.GeneratedProtocolMessageType('ResumeParams', (_message.Message,), {
+  'DESCRIPTOR' : _RESUMEPARAMS,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.ResumeParams)
+  })
+_sym_db.RegisterMessage(ResumeParams)
+
 PipelineSummary = _reflection.GeneratedProtocolMessageType('PipelineSummary', (_message.Message,), {
   'DESCRIPTOR' : _PIPELINESUMMARY,
   '__module__' : 'kedro_grpc_server.kedro_pb2'
@@ -301,6 +1529,132 @@ RunStatus = _reflection.GeneratedProtocolMessageType('RunStatus', (_message.Mess
   })
 _sym_db.RegisterMessage(RunStatus)
 
+SavedDataset = _reflection.GeneratedProtocolMessageType('SavedDataset', (_message.Message,), {
+  'DESCRIPTOR' : _SAVEDDATASET,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.SavedDataset)
+  })
+_sym_db.RegisterMessage(SavedDataset)
+
+DatasetIO = _reflection.GeneratedProtocolMessageType('DatasetIO', (_message.Message,), {
+  'DESCRIPTOR' : _DATASETIO,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.DatasetIO)
+  })
+_sym_db.RegisterMessage(DatasetIO)
+
+ResourceUsage = _reflection.GeneratedProtocolMessageType('ResourceUsage', (_message.Message,), {
+  'DESCRIPTOR' : _RESOURCEUSAGE,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.ResourceUsage)
+  })
+_sym_db.RegisterMessage(ResourceUsage)
+
+WatchParams = _reflection.GeneratedProtocolMessageType('WatchParams', (_message.Message,), {
+  'DESCRIPTOR' : _WATCHPARAMS,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.WatchParams)
+  })
+_sym_db.RegisterMessage(WatchParams)
+
+RunEvent = _reflection.GeneratedProtocolMessageType('RunEvent', (_message.Message,), {
+  'DESCRIPTOR' : _RUNEVENT,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.RunEvent)
+  })
+_sym_db.RegisterMessage(RunEvent)
+
+ListRunsParams = _reflection.GeneratedProtocolMessageType('ListRunsParams', (_message.Message,), {
+  'DESCRIPTOR' : _LISTRUNSPARAMS,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.ListRunsParams)
+  })
+_sym_db.RegisterMessage(ListRunsParams)
+
+RunRecord = _reflection.GeneratedProtocolMessageType('RunRecord', (_message.Message,), {
+  'DESCRIPTOR' : _RUNRECORD,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.RunRecord)
+  })
+_sym_db.RegisterMessage(RunRecord)
+
+RunList = _reflection.GeneratedProtocolMessageType('RunList', (_message.Message,), {
+  'DESCRIPTOR' : _RUNLIST,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.RunList)
+  })
+_sym_db.RegisterMessage(RunList)
+
+OutputParams = _reflection.GeneratedProtocolMessageType('OutputParams', (_message.Message,), {
+  'DESCRIPTOR' : _OUTPUTPARAMS,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.OutputParams)
+  })
+_sym_db.RegisterMessage(OutputParams)
+
+OutputChunk = _reflection.GeneratedProtocolMessageType('OutputChunk', (_message.Message,), {
+  'DESCRIPTOR' : _OUTPUTCHUNK,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.OutputChunk)
+  })
+_sym_db.RegisterMessage(OutputChunk)
+
+SessionRequest = _reflection.GeneratedProtocolMessageType('SessionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONREQUEST,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.SessionRequest)
+  })
+_sym_db.RegisterMessage(SessionRequest)
+
+SessionResponse = _reflection.GeneratedProtocolMessageType('SessionResponse', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONRESPONSE,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.SessionResponse)
+  })
+_sym_db.RegisterMessage(SessionResponse)
+
+PreviewParams = _reflection.GeneratedProtocolMessageType('PreviewParams', (_message.Message,), {
+  'DESCRIPTOR' : _PREVIEWPARAMS,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.PreviewParams)
+  })
+_sym_db.RegisterMessage(PreviewParams)
+
+DatasetPreview = _reflection.GeneratedProtocolMessageType('DatasetPreview', (_message.Message,), {
+  'DESCRIPTOR' : _DATASETPREVIEW,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.DatasetPreview)
+  })
+_sym_db.RegisterMessage(DatasetPreview)
+
+Column = _reflection.GeneratedProtocolMessageType('Column', (_message.Message,), {
+  'DESCRIPTOR' : _COLUMN,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.Column)
+  })
+_sym_db.RegisterMessage(Column)
+
+DatasetStatsParams = _reflection.GeneratedProtocolMessageType('DatasetStatsParams', (_message.Message,), {
+  'DESCRIPTOR' : _DATASETSTATSPARAMS,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.DatasetStatsParams)
+  })
+_sym_db.RegisterMessage(DatasetStatsParams)
+
+DatasetIOStats = _reflection.GeneratedProtocolMessageType('DatasetIOStats', (_message.Message,), {
+  'DESCRIPTOR' : _DATASETIOSTATS,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.DatasetIOStats)
+  })
+_sym_db.RegisterMessage(DatasetIOStats)
+
+DatasetStatsList = _reflection.GeneratedProtocolMessageType('DatasetStatsList', (_message.Message,), {
+  'DESCRIPTOR' : _DATASETSTATSLIST,
+  '__module__' : 'kedro_grpc_server.kedro_pb2'
+  # @@protoc_insertion_point(class_scope:kedro.DatasetStatsList)
+  })
+_sym_db.RegisterMessage(DatasetStatsList)
+
 
 
 _KEDRO = _descriptor.ServiceDescriptor(
@@ -310,8 +1664,8 @@ _KEDRO = _descriptor.ServiceDescriptor(
   index=0,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=319,
-  serialized_end=480,
+  serialized_start=2728,
+  serialized_end=3298,
   methods=[
   _descriptor.MethodDescriptor(
     name='ListPipelines',
@@ -343,6 +1697,76 @@ _KEDRO = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='WatchRuns',
+    full_name='kedro.Kedro.WatchRuns',
+    index=3,
+    containing_service=None,
+    input_type=_WATCHPARAMS,
+    output_type=_RUNEVENT,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='ListRuns',
+    full_name='kedro.Kedro.ListRuns',
+    index=4,
+    containing_service=None,
+    input_type=_LISTRUNSPARAMS,
+    output_type=_RUNLIST,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetOutputs',
+    full_name='kedro.Kedro.GetOutputs',
+    index=5,
+    containing_service=None,
+    input_type=_OUTPUTPARAMS,
+    output_type=_OUTPUTCHUNK,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='Session',
+    full_name='kedro.Kedro.Session',
+    index=6,
+    containing_service=None,
+    input_type=_SESSIONREQUEST,
+    output_type=_SESSIONRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='PreviewDataset',
+    full_name='kedro.Kedro.PreviewDataset',
+    index=7,
+    containing_service=None,
+    input_type=_PREVIEWPARAMS,
+    output_type=_DATASETPREVIEW,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='Resume',
+    full_name='kedro.Kedro.Resume',
+    index=8,
+    containing_service=None,
+    input_type=_RESUMEPARAMS,
+    output_type=_RUNSUMMARY,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='DatasetStats',
+    full_name='kedro.Kedro.DatasetStats',
+    index=9,
+    containing_service=None,
+    input_type=_DATASETSTATSPARAMS,
+    output_type=_DATASETSTATSLIST,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_KEDRO)
 
@@ -29,6 +29,41 @@ class KedroStub(object):
                 request_serializer=kedro__grpc__server_dot_kedro__pb2.RunId.SerializeToString,
                 response_deserializer=kedro__grpc__server_dot_kedro__pb2.RunStatus.FromString,
                 )
+        self.WatchRuns = channel.unary_stream(
+                '/kedro.Kedro/WatchRuns',
+                request_serializer=kedro__grpc__server_dot_kedro__pb2.WatchParams.SerializeToString,
+                response_deserializer=kedro__grpc__server_dot_kedro__pb2.RunEvent.FromString,
+                )
+        self.ListRuns = channel.unary_unary(
+                '/kedro.Kedro/ListRuns',
+                request_serializer=kedro__grpc__server_dot_kedro__pb2.ListRunsParams.SerializeToString,
+                response_deserializer=kedro__grpc__server_dot_kedro__pb2.RunList.FromString,
+                )
+        self.GetOutputs = channel.unary_stream(
+                '/kedro.Kedro/GetOutputs',
+                request_serializer=kedro__grpc__server_dot_kedro__pb2.OutputParams.SerializeToString,
+                response_deserializer=kedro__grpc__server_dot_kedro__pb2.OutputChunk.FromString,
+                )
+        self.Session = channel.stream_stream(
+                '/kedro.Kedro/Session',
+                request_serializer=kedro__grpc__server_dot_kedro__pb2.SessionRequest.SerializeToString,
+                response_deserializer=kedro__grpc__server_dot_kedro__pb2.SessionResponse.FromString,
+                )
+        self.PreviewDataset = channel.unary_unary(
+                '/kedro.Kedro/PreviewDataset',
+                request_serializer=kedro__grpc__server_dot_kedro__pb2.PreviewParams.SerializeToString,
+                response_deserializer=kedro__grpc__server_dot_kedro__pb2.DatasetPreview.FromString,
+                )
+        self.Resume = channel.unary_unary(
+                '/kedro.Kedro/Resume',
+                request_serializer=kedro__grpc__server_dot_kedro__pb2.ResumeParams.SerializeToString,
+                response_deserializer=kedro__grpc__server_dot_kedro__pb2.RunSummary.FromString,
+                )
+        self.DatasetStats = channel.unary_unary(
+                '/kedro.Kedro/DatasetStats',
+                request_serializer=kedro__grpc__server_dot_kedro__pb2.DatasetStatsParams.SerializeToString,
+                response_deserializer=kedro__grpc__server_dot_kedro__pb2.DatasetStatsList.FromString,
+                )
 
 
 class KedroServicer(object):
@@ -52,6 +87,48 @@ class KedroServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WatchRuns(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListRuns(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetOutputs(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Session(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PreviewDataset(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Resume(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DatasetStats(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_KedroServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -70,6 +147,41 @@ def add_KedroServicer_to_server(servicer, server):
                     request_deserializer=kedro__grpc__server_dot_kedro__pb2.RunId.FromString,
                     response_serializer=kedro__grpc__server_dot_kedro__pb2.RunStatus.SerializeToString,
             ),
+            'WatchRuns': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchRuns,
+                    request_deserializer=kedro__grpc__server_dot_kedro__pb2.WatchParams.FromString,
+                    response_serializer=kedro__grpc__server_dot_kedro__pb2.RunEvent.SerializeToString,
+            ),
+            'ListRuns': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListRuns,
+                    request_deserializer=kedro__grpc__server_dot_kedro__pb2.ListRunsParams.FromString,
+                    response_serializer=kedro__grpc__server_dot_kedro__pb2.RunList.SerializeToString,
+            ),
+            'GetOutputs': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetOutputs,
+                    request_deserializer=kedro__grpc__server_dot_kedro__pb2.OutputParams.FromString,
+                    response_serializer=kedro__grpc__server_dot_kedro__pb2.OutputChunk.SerializeToString,
+            ),
+            'Session': grpc.stream_stream_rpc_method_handler(
+                    servicer.Session,
+                    request_deserializer=kedro__grpc__server_dot_kedro__pb2.SessionRequest.FromString,
+                    response_serializer=kedro__grpc__server_dot_kedro__pb2.SessionResponse.SerializeToString,
+            ),
+            'PreviewDataset': grpc.unary_unary_rpc_method_handler(
+                    servicer.PreviewDataset,
+                    request_deserializer=kedro__grpc__server_dot_kedro__pb2.PreviewParams.FromString,
+                    response_serializer=kedro__grpc__server_dot_kedro__pb2.DatasetPreview.SerializeToString,
+            ),
+            'Resume': grpc.unary_unary_rpc_method_handler(
+                    servicer.Resume,
+                    request_deserializer=kedro__grpc__server_dot_kedro__pb2.ResumeParams.FromString,
+                    response_serializer=kedro__grpc__server_dot_kedro__pb2.RunSummary.SerializeToString,
+            ),
+            'DatasetStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.DatasetStats,
+                    request_deserializer=kedro__grpc__server_dot_kedro__pb2.DatasetStatsParams.FromString,
+                    response_serializer=kedro__grpc__server_dot_kedro__pb2.DatasetStatsList.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'kedro.Kedro', rpc_method_handlers)
@@ -127,3 +239,115 @@ class Kedro(object):
             kedro__grpc__server_dot_kedro__pb2.RunStatus.FromString,
             options, channel_credentials,
             call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def WatchRuns(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/kedro.Kedro/WatchRuns',
+            kedro__grpc__server_dot_kedro__pb2.WatchParams.SerializeToString,
+            kedro__grpc__server_dot_kedro__pb2.RunEvent.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ListRuns(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/kedro.Kedro/ListRuns',
+            kedro__grpc__server_dot_kedro__pb2.ListRunsParams.SerializeToString,
+            kedro__grpc__server_dot_kedro__pb2.RunList.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetOutputs(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/kedro.Kedro/GetOutputs',
+            kedro__grpc__server_dot_kedro__pb2.OutputParams.SerializeToString,
+            kedro__grpc__server_dot_kedro__pb2.OutputChunk.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Session(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/kedro.Kedro/Session',
+            kedro__grpc__server_dot_kedro__pb2.SessionRequest.SerializeToString,
+            kedro__grpc__server_dot_kedro__pb2.SessionResponse.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def PreviewDataset(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/kedro.Kedro/PreviewDataset',
+            kedro__grpc__server_dot_kedro__pb2.PreviewParams.SerializeToString,
+            kedro__grpc__server_dot_kedro__pb2.DatasetPreview.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Resume(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/kedro.Kedro/Resume',
+            kedro__grpc__server_dot_kedro__pb2.ResumeParams.SerializeToString,
+            kedro__grpc__server_dot_kedro__pb2.RunSummary.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def DatasetStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/kedro.Kedro/DatasetStats',
+            kedro__grpc__server_dot_kedro__pb2.DatasetStatsParams.SerializeToString,
+            kedro__grpc__server_dot_kedro__pb2.DatasetStatsList.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
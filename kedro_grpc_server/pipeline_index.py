@@ -0,0 +1,164 @@
+"""Index of the project pipelines by tag and namespace: PipelineIndex"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+
+_Selector = Tuple[str, FrozenSet[str], FrozenSet[str]]
+
+
+def split_tags(values: Iterable[str]) -> List[str]:
+    """
+    Tags of a run, accepting comma separated tags as sent by older clients
+    :param values: Tags of ``RunParams``
+    :return: Tags, without duplicates nor empty ones
+    """
+    tags = (tag.strip() for value in values for tag in value.split(","))
+    return sorted({tag for tag in tags if tag})
+
+
+def node_namespaces(node: Node) -> List[str]:
+    """
+    Namespaces a node belongs to, from the outermost to its own
+    :param node: Pipeline node
+    :return: E.g. ``["data", "data.clean"]`` for a node in ``data.clean``
+    """
+    namespace = getattr(node, "namespace", None)
+    if namespace is None:  # kedro < 0.17, only namespaced by explicit names
+        name = node._name or ""  # pylint: disable=protected-access
+        namespace = name.rpartition(".")[0]
+    parts = namespace.split(".") if namespace else []
+    return [".".join(parts[: index + 1]) for index in range(len(parts))]
+
+
+class _Index:  # pylint: disable=too-few-public-methods
+    """Nodes of a pipeline by tag and namespace"""
+
+    def __init__(self, pipeline: Pipeline):
+        tags = {}  # type: Dict[str, set]
+        namespaces = {}  # type: Dict[str, set]
+        for node in pipeline.nodes:
+            for tag in node.tags:
+                tags.setdefault(tag, set()).add(node)
+            for namespace in node_namespaces(node):
+                namespaces.setdefault(namespace, set()).add(node)
+        self.pipeline = pipeline
+        self.tags = {tag: frozenset(nodes) for tag, nodes in tags.items()}
+        self.namespaces = {ns: frozenset(nodes) for ns, nodes in namespaces.items()}
+
+
+def _lookup(
+    index: Dict[str, FrozenSet[Node]], keys: FrozenSet[str], kind: str
+) -> FrozenSet[Node]:
+    unknown = sorted(keys - index.keys())
+    if unknown:
+        raise ValueError(f"Unknown {kind}: {', '.join(unknown)}")
+    return frozenset().union(*(index[key] for key in keys))
+
+
+class PipelineIndex:
+    """PipelineIndex keeps the pipelines of the project, built once, with the
+    nodes of each of them by tag and by namespace. Selecting the sub-pipeline
+    of a run, and validating its tags and namespaces, only costs set lookups,
+    and the filtered ``Pipeline``s are memoized per selector, the least
+    recently used ones being dropped past ``max_selections``.
+
+    Runs are handed their selected pipeline with ``install``, so the run
+    process doesn't build the project pipelines nor filter them again.
+    """
+
+    def __init__(self, context: Any, max_selections: int = 256):
+        """
+        Instantiates the index, built on first use or by ``build``
+        :param context: Project context
+        :param max_selections: Number of filtered pipelines kept
+        """
+        self._context = context
+        self._max_selections = max_selections
+        self._indexes = None  # type: Optional[Dict[str, _Index]]
+        self._selections = OrderedDict()  # type: OrderedDict[_Selector, Pipeline]
+        self._lock = threading.Lock()
+
+    @property
+    def pipeline_names(self) -> List[str]:
+        """Names of the project pipelines"""
+        return list(self._get_indexes())
+
+    def build(self) -> Dict[str, _Index]:
+        """Build the project pipelines and index them, dropping memoized
+        selections
+        :return: The index of every pipeline
+        """
+        indexes = {
+            name: _Index(pipeline) for name, pipeline in self._context.pipelines.items()
+        }
+        with self._lock:
+            self._indexes = indexes
+            self._selections.clear()
+        return indexes
+
+    def _get_indexes(self) -> Dict[str, _Index]:
+        indexes = self._indexes
+        if indexes is None:
+            indexes = self.build()
+        return indexes
+
+    def select(
+        self,
+        pipeline_name: str = "",
+        tags: Iterable[str] = (),
+        namespaces: Iterable[str] = (),
+    ) -> Pipeline:
+        """
+        Sub-pipeline of the nodes with any of the tags, if given, and in any
+        of the namespaces, if given
+        :param pipeline_name: Pipeline name, the default pipeline if empty
+        :param tags: Tags of the nodes to run
+        :param namespaces: Namespaces of the nodes to run
+        :return: The selected pipeline
+        :raises ValueError: If the pipeline, a tag or a namespace doesn't
+            exist, or if no node is selected
+        """
+        pipeline_name = pipeline_name or "__default__"
+        tags, namespaces = frozenset(tags), frozenset(namespaces)
+        selector = (pipeline_name, tags, namespaces)
+        with self._lock:
+            if selector in self._selections:
+                self._selections.move_to_end(selector)
+                return self._selections[selector]
+
+        index = self._get_indexes().get(pipeline_name)
+        if index is None:
+            raise ValueError(f"Unknown pipeline: {pipeline_name}")
+        pipeline = index.pipeline
+        if tags or namespaces:
+            nodes = set(pipeline.nodes)
+            if tags:
+                nodes &= _lookup(index.tags, tags, "tags")
+            if namespaces:
+                nodes &= _lookup(index.namespaces, namespaces, "namespaces")
+            if not nodes:
+                raise ValueError(
+                    f"No node of pipeline {pipeline_name} matches the selection"
+                )
+            pipeline = Pipeline(nodes)
+
+        with self._lock:
+            self._selections[selector] = pipeline
+            while len(self._selections) > self._max_selections:
+                self._selections.popitem(last=False)
+        return pipeline
+
+    @staticmethod
+    def install(context: Any, pipeline: Pipeline):
+        """
+        Make ``context`` run ``pipeline``, whatever the pipeline name of the
+        run. Meant to be called on the context of a run right before its
+        process is started.
+        :param context: Run context to patch
+        :param pipeline: Selected pipeline of the run
+        """
+        # pylint: disable=protected-access
+        context._get_pipeline = lambda name=None: pipeline
@@ -1,11 +1,34 @@
 """Kedro run manager implementation: ProcessManager"""
 import abc
+import os
+import shutil
+import signal
 import sys
+import threading
+import time
+import tracemalloc
 import uuid
 from functools import wraps
 from multiprocessing import Process, Queue
 from queue import Empty
-from typing import Any, AnyStr, Callable, Dict, List, Union
+from typing import Any, AnyStr, Callable, Dict, Iterable, List, Optional, Union
+
+from kedro_grpc_server.checkpoint import CheckpointHooks
+from kedro_grpc_server.context_cache import merge_params
+from kedro_grpc_server.cpu_affinity import CpuAllocator, format_cpus, pin_process
+from kedro_grpc_server.dataset_events import DatasetEventHooks
+from kedro_grpc_server.event_bus import EventBus
+from kedro_grpc_server.event_filter import LogEvent
+from kedro_grpc_server.resource_usage import (
+    ResourceUsageHooks,
+    run_usage,
+    set_memory_limit,
+)
+from kedro_grpc_server.result_channel import ResultChannel
+from kedro_grpc_server.run_store import RunStore
+from kedro_grpc_server.spans import RunTracingHooks, Tracer
+
+TERMINATE_GRACE_PERIOD = 5.0
 
 
 def _get_new_events(events_queue: Queue):
@@ -17,18 +40,22 @@ def _get_new_events(events_queue: Queue):
 
 
 def _wrapped_write(
-    queue: Queue, real_write: Callable[[AnyStr], int]
+    queue: Queue, real_write: Callable[[AnyStr], int], current_node: Dict[str, str]
 ) -> Callable[[AnyStr], int]:
-    """Forward messages sent to `real_write` to a multiprocessing queue.
+    """Forward messages sent to `real_write` to a multiprocessing queue,
+    tagged with their stream, log level and node.
 
     Args:
         queue: Multiprocessing queue to forward the messages to.
         real_write: Write callable the message was addressed to. It's signature
             must be identical to `sys.stdout.write`.
+        current_node: Node being run, shared by the wrapped writes of a run.
 
     Returns:
         Wrapped write function.
     """
+    is_stderr = getattr(real_write, "__self__", None) is sys.stderr
+    stream = "stderr" if is_stderr else "stdout"
 
     # the signature of `_wrapped` is deliberately kept as close
     # to sys.stdout.write as possible
@@ -36,7 +63,7 @@ def _wrapped_write(
     def _wrapped(s: AnyStr) -> int:  # pylint: disable=invalid-name
         s_to_queue = s.decode("utf-8") if isinstance(s, bytes) else s  # type: ignore
         if s_to_queue.strip():
-            queue.put(s_to_queue)
+            queue.put(LogEvent.from_write(s_to_queue, stream, current_node))
         real_write(s)
         return len(s)
 
@@ -53,6 +80,19 @@ class AbstractManager(abc.ABC):
         run_id: str = None,
         run_args: dict = None,
         extra_params: dict = None,
+        event_bus: EventBus = None,
+        run_store: RunStore = None,
+        result_channel: ResultChannel = None,
+        tracer: Tracer = None,
+        trace_parent: str = None,
+        memory_limit: int = 0,
+        trace_malloc: bool = False,
+        fetch_datasets: Iterable[str] = (),
+        timeout: float = 0,
+        cpus: int = 0,
+        cpu_allocator: CpuAllocator = None,
+        checkpoint_dir: str = None,
+        restore: Dict[str, str] = None,
     ):
         """
         Instantiates the run manager class
@@ -60,12 +100,53 @@ class AbstractManager(abc.ABC):
         :param run_id: Specific Run ID
         :param run_args: Run args
         :param extra_params: Extra params
+        :param event_bus: Event bus to publish events and state transitions to
+        :param run_store: Run store to persist the run state and events to
+        :param result_channel: Channel handing the run outputs to the server
+        :param tracer: Tracer exporting the spans recorded by the run
+        :param trace_parent: ``traceparent`` of the span dispatching the run,
+            the run is only traced if given
+        :param memory_limit: Maximum address space of the run in bytes, 0
+            for no limit
+        :param trace_malloc: Measure the peak memory allocated by each node
+            with ``tracemalloc``, which slows Python allocations down
+        :param fetch_datasets: Datasets handed over by the result channel as
+            soon as they are saved, so they can be fetched during the run
+        :param timeout: Seconds the run may last before it is terminated and
+            marked ``TimedOut``, 0 for no limit
+        :param cpus: Number of cores the run is bound to, 0 not to bind it
+        :param cpu_allocator: Allocator assigning the cores of the run, which
+            are given back when the run finishes
+        :param checkpoint_dir: Directory to checkpoint the in-memory datasets
+            of the run to, so that it can be resumed if it fails
+        :param restore: Checkpoint paths of in-memory datasets of a failed
+            run, which this run resumes
         """
         self._context = context
         self._run_id = run_id or str(uuid.uuid4())
         self._run_args = run_args
         self._extra_params = extra_params or {}
+        self._event_bus = event_bus
+        self._run_store = run_store
+        self._result_channel = result_channel
+        self._tracer = tracer
+        self._trace_parent = trace_parent
+        self._memory_limit = memory_limit
+        self._trace_malloc = trace_malloc
+        self._fetch_datasets = list(fetch_datasets)
+        self._timeout = timeout
+        self._timed_out = False
+        self._cpu_count = cpus
+        self._cpu_allocator = cpu_allocator
+        self._cpus = []  # type: List[int]
+        self._checkpoint_dir = checkpoint_dir
+        self._restore = restore or {}
         self._events = []  # type: List[str]
+        self._outputs = {}  # type: Dict[str, Dict[str, Any]]
+        self._node_usage = []  # type: List[Dict[str, Any]]
+        self._run_usage = None  # type: Optional[Dict[str, Any]]
+        self._saved_datasets = []  # type: List[Dict[str, Any]]
+        self._dataset_io = []  # type: List[Dict[str, Any]]
         self._run_finished = False
 
     @property
@@ -73,11 +154,184 @@ class AbstractManager(abc.ABC):
         """Run_ID getter"""
         return self._run_id
 
+    @property
+    def pipeline_name(self) -> str:
+        """Name of the pipeline being run"""
+        return (self._run_args or {}).get("pipeline_name") or "__default__"
+
+    @property
+    def cpus(self) -> List[int]:
+        """Cores the run is bound to, empty if it isn't"""
+        return self._cpus
+
+    @property
+    def run_finished(self) -> bool:
+        """Whether the outcome of the run was recorded"""
+        return self._run_finished
+
     @property
     def events(self):
         """Events getter"""
         return self._events
 
+    @property
+    def outputs(self) -> Dict[str, Dict[str, Any]]:
+        """Descriptors of the run outputs handed over by the result channel"""
+        return self._outputs
+
+    @property
+    def node_usage(self) -> List[Dict[str, Any]]:
+        """Resource usage of every finished node, in completion order"""
+        return self._node_usage
+
+    @property
+    def run_usage(self) -> Optional[Dict[str, Any]]:
+        """Resource usage of the whole run, None until it finished"""
+        return self._run_usage
+
+    @property
+    def saved_datasets(self) -> List[Dict[str, Any]]:
+        """Name, version and size of every saved dataset, in saving order"""
+        return self._saved_datasets
+
+    @property
+    def dataset_io(self) -> List[Dict[str, Any]]:
+        """Duration, size and rows of every dataset load and save, in
+        completion order"""
+        return self._dataset_io
+
+    def record_start(self):
+        """Persist the start of the run to the run store"""
+        if self._run_store is not None:
+            self._run_store.record_start(self._run_id, self.pipeline_name)
+
+    def record_end(self, run_status: str, exit_code=None):
+        """
+        Persist the outcome and events of the run to the run store
+        :param run_status: Final run status
+        :param exit_code: Exit code of the run
+        """
+        if self._run_store is not None:
+            self._run_store.record_end(
+                self._run_id,
+                run_status,
+                exit_code,
+                list(self._events),
+                usage=dict(run=self._run_usage, nodes=self._node_usage),
+                dataset_io=self._dataset_io,
+            )
+        self._run_finished = True
+
+    def record_dataset(self, dataset: Dict[str, Any]):
+        """
+        Persist a saved dataset a resumed run can load, i.e. a persisted or
+        a checkpointed dataset
+        :param dataset: Saved dataset event
+        """
+        if self._run_store is not None and (
+            dataset["persisted"] or dataset["checkpoint"]
+        ):
+            self._run_store.record_datasets(self._run_id, [dataset])
+
+    def _handle_item(self, item: Any) -> bool:
+        """
+        Keep a span, resource usage, saved dataset, dataset I/O or output
+        descriptor sent by the run
+        :param item: Item sent by the run
+        :return: Whether the item was kept, False for events
+        """
+        if not isinstance(item, dict):
+            return False
+        if "span" in item:
+            if self._tracer is not None:
+                self._tracer.export(item["span"])
+        elif "usage" in item:
+            if item["usage"]["node"]:
+                self._node_usage.append(item["usage"])
+            else:
+                self._run_usage = item["usage"]
+        elif "dataset" in item:
+            self._saved_datasets.append(item["dataset"])
+            self.record_dataset(item["dataset"])
+        elif "io" in item:
+            self._dataset_io.append(item["io"])
+        else:  # output descriptor
+            self._outputs[item["output"]] = item
+        return True
+
+    def _traced_run(
+        self, put: Callable[[Any], None], install: Callable[[RunTracingHooks], Any]
+    ):
+        """
+        Run the pipeline, in a span continuing the trace of the dispatching
+        RPC if the run is traced
+        :param put: Sends items to the server, which exports the spans
+        :param install: Installs the hooks recording the node spans
+        """
+        if not self._trace_parent:
+            self._run()
+            return
+        tracer = Tracer(lambda span: put({"span": span}))
+        attributes = {
+            "kedro.run_id": self._run_id,
+            "kedro.pipeline": self.pipeline_name,
+        }
+        with tracer.span(
+            "kedro.run", self._trace_parent, attributes=attributes
+        ) as run_span:
+            hooks = RunTracingHooks(tracer, run_span)
+            install(hooks)
+            try:
+                self._run()
+            finally:
+                hooks.end()
+
+    def _add_events(self, new_events: List[str]):
+        if new_events:
+            sequence = len(self._events)
+            self._events.extend(new_events)
+            self.publish("Pending", new_events)
+            self.record_events(sequence, new_events)
+
+    def _remove_checkpoints(self):
+        """Remove the checkpoints of the run, and the ones it restored, once
+        the run succeeded and doesn't need to be resumed"""
+        if self._checkpoint_dir:
+            shutil.rmtree(self._checkpoint_dir, ignore_errors=True)
+        for path in self._restore.values():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def record_events(self, sequence: int, events: List[str]):
+        """
+        Persist new events of the unfinished run, for other server processes
+        :param sequence: Number of events logged before these
+        :param events: New events
+        """
+        if self._run_store is not None:
+            self._run_store.append_events(self._run_id, sequence, events)
+
+    def publish(self, run_status: str, events: List[str] = None, exit_code=None):
+        """
+        Publish a state transition, or new events if given, to the event bus
+        :param run_status: Current run status
+        :param events: New events, empty for a state transition
+        :param exit_code: Exit code of the run, if finished
+        """
+        if self._event_bus is None:
+            return
+        self._event_bus.publish(
+            dict(
+                run_id=self._run_id,
+                pipeline_name=self.pipeline_name,
+                run_status=run_status,
+                events=events or [],
+                exit_code=str(exit_code),
+            )
+        )
+
     @abc.abstractmethod
     def start(self):
         """The abstract interface for starting run managers"""
@@ -102,6 +356,14 @@ class AbstractManager(abc.ABC):
             "it must implement the `status` method".format(self.__class__.__name__)
         )
 
+    @abc.abstractmethod
+    def _run(self):
+        """The abstract interface for running the pipeline of runs"""
+        raise NotImplementedError(
+            "`{}` is a subclass of AbstractManager and"
+            "it must implement the `_run` method".format(self.__class__.__name__)
+        )
+
 
 class ProcessManager(AbstractManager):
     """ProcessManager is an AbstractManager implementation.
@@ -115,6 +377,19 @@ class ProcessManager(AbstractManager):
         queue=None,
         run_args=None,
         extra_params=None,
+        event_bus=None,
+        run_store=None,
+        result_channel=None,
+        tracer=None,
+        trace_parent=None,
+        memory_limit=0,
+        trace_malloc=False,
+        fetch_datasets=(),
+        timeout=0,
+        cpus=0,
+        cpu_allocator=None,
+        checkpoint_dir=None,
+        restore=None,
     ):
         """
         Instantiates the run manager class
@@ -124,15 +399,35 @@ class ProcessManager(AbstractManager):
             run_id=run_id,
             run_args=run_args,
             extra_params=extra_params,
+            event_bus=event_bus,
+            run_store=run_store,
+            result_channel=result_channel,
+            tracer=tracer,
+            trace_parent=trace_parent,
+            memory_limit=memory_limit,
+            trace_malloc=trace_malloc,
+            fetch_datasets=fetch_datasets,
+            timeout=timeout,
+            cpus=cpus,
+            cpu_allocator=cpu_allocator,
+            checkpoint_dir=checkpoint_dir,
+            restore=restore,
         )
         self._proc = proc or None
         self._proc_queue = queue or Queue()  # type: Queue
+        self._events_lock = threading.Lock()
+        self._monitor = None  # type: threading.Thread
 
     @property
     def proc(self) -> Process:
         """Process getter"""
         return self._proc
 
+    @property
+    def timed_out(self) -> bool:
+        """Whether the run was terminated for lasting longer than its timeout"""
+        return self._timed_out
+
     @property
     def proc_queue(self):
         """Process queue getter"""
@@ -142,8 +437,20 @@ class ProcessManager(AbstractManager):
         """
         Start run process with queue
         """
+        if self._cpu_count and self._cpu_allocator is not None:
+            self._cpus = self._cpu_allocator.acquire(self._cpu_count)
         self._proc = Process(target=self._wrapped_run, daemon=True)
-        self._proc.start()
+        try:
+            self._proc.start()
+        except Exception:
+            self._release_cpus()
+            raise
+        self.record_start()
+        self.publish("Pending")
+        self._monitor = threading.Thread(
+            target=self._monitor_run, name=f"monitor-{self._run_id}", daemon=True
+        )
+        self._monitor.start()
 
     def stop(self) -> str:
         """
@@ -158,18 +465,132 @@ class ProcessManager(AbstractManager):
         :return:
         """
 
-        new_events = _get_new_events(self._proc_queue)
-        self.events.extend(new_events)
-        return dict(
-            run_status="Pending" if self.proc.is_alive() else "Completed",
-            events=self._events,
-        )
+        self._collect_events()
+        if self.proc.is_alive():
+            run_status = "Pending"
+        else:
+            run_status = "TimedOut" if self._timed_out else "Completed"
+        return dict(run_status=run_status, events=self._events)
+
+    def _collect_events(self) -> List[str]:
+        """Drain the run queue, publishing and persisting new events. Events
+        are handled here, whoever drains the queue, so none is missed."""
+        new_events = []  # type: List[str]
+        with self._events_lock:
+            if self._timed_out:
+                # the terminated process may have left a partial message
+                return new_events
+            for item in _get_new_events(self._proc_queue):
+                if not self._handle_item(item):
+                    new_events.append(item)
+            self._add_events(new_events)
+        return new_events
+
+    def _monitor_run(self):
+        """Publish events as they are logged, and the run completion.
+        Terminate the run once it lasted longer than its timeout."""
+        deadline = time.time() + self._timeout if self._timeout else None
+        while True:
+            alive = self._proc.is_alive()
+            self._collect_events()
+            if not alive:
+                break
+            if deadline is not None and time.time() > deadline:
+                self._terminate()
+                break
+            self._proc.join(0.1)
+        self._release_cpus()
+        if self._proc.exitcode == 0 and not self._timed_out:
+            self._remove_checkpoints()
+        run_status = "TimedOut" if self._timed_out else "Completed"
+        self.record_end(run_status, exit_code=self._proc.exitcode)
+        self.publish(run_status, exit_code=self._proc.exitcode)
+
+    def _release_cpus(self):
+        """Give the cores of the run back to the allocator"""
+        if self._cpus:
+            self._cpu_allocator.release(self._cpus)
+
+    def _terminate(self):
+        """Terminate the run process and its pool workers, killing them if they
+        don't exit in time. The queue is drained once beforehand, since it
+        isn't read anymore once the process may have left a partial message in
+        it, and the process is joined without holding the events lock, so
+        status calls don't wait."""
+        self._collect_events()
+        with self._events_lock:
+            self._timed_out = True
+        self._signal_group(signal.SIGTERM)
+        self._proc.join(TERMINATE_GRACE_PERIOD)
+        # pool workers which outlived the run process are killed with it
+        self._signal_group(signal.SIGKILL)
+        self._proc.join()
+        with self._events_lock:
+            self._add_events([f"Run timed out after {self._timeout:g} seconds"])
+
+    def _signal_group(self, sig: int):
+        """
+        Signal the process group of the run, i.e. the run process and the pool
+        workers of its runner, which would otherwise keep their cores busy
+        :param sig: Signal to send
+        """
+        try:
+            os.killpg(self._proc.pid, sig)
+        except ProcessLookupError:  # no group yet, or every process exited
+            if self._proc.is_alive():
+                os.kill(self._proc.pid, sig)
 
     def _wrapped_run(self):
         """Enhanced pipeline run to collect events"""
-        sys.stdout.write = _wrapped_write(self._proc_queue, sys.stdout.write)
-        sys.stderr.write = _wrapped_write(self._proc_queue, sys.stderr.write)
+        # the run process leads the group of the processes it forks, so that
+        # they are terminated with it
+        os.setpgrp()
+        current_node = {"name": ""}
+        sys.stdout.write = _wrapped_write(
+            self._proc_queue, sys.stdout.write, current_node
+        )
+        sys.stderr.write = _wrapped_write(
+            self._proc_queue, sys.stderr.write, current_node
+        )
+
+        start_time = time.time()
+        if self._cpus:
+            pin_process(self._cpus)
+            self._proc_queue.put(f"Running on CPUs {format_cpus(self._cpus)}")
+        if self._memory_limit:
+            set_memory_limit(self._memory_limit)
+        if self._trace_malloc:
+            tracemalloc.start()
+        ResourceUsageHooks(self._put_usage).install()
+        DatasetEventHooks(
+            self._proc_queue.put,
+            self._run_id,
+            self._result_channel,
+            self._fetch_datasets,
+            self._checkpoint_dir,
+        ).install()
+        if self._restore:
+            CheckpointHooks(self._restore).install()
+        try:
+            self._traced_run(self._proc_queue.put, RunTracingHooks.install)
+        finally:
+            self._put_usage(run_usage(start_time))
+
+    def _put_usage(self, usage: Dict[str, Any]):
+        self._proc_queue.put({"usage": usage})
+
+    def _run(self):
+        if self._extra_params:
+            # pylint: disable=protected-access
+            self._context._extra_params = merge_params(
+                self._context.params, self._extra_params
+            )
 
         self._proc_queue.put("Starting run")
-        self._context.run(**self._run_args)
+        outputs = self._context.run(**self._run_args)
+        if self._result_channel is not None:
+            for name, data in (outputs or {}).items():
+                self._proc_queue.put(
+                    self._result_channel.write(self._run_id, name, data)
+                )
         self._proc_queue.put("Completed run")
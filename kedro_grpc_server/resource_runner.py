@@ -0,0 +1,272 @@
+"""Kedro runner scheduling nodes by their resource hints: ResourceRunner"""
+import multiprocessing
+import os
+import re
+from collections import Counter
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import chain
+from typing import Any, Dict, Iterable, NamedTuple, Set
+
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+from kedro.runner import AbstractRunner
+from kedro.runner.runner import run_node
+
+from kedro_grpc_server.cpu_affinity import available_cpus
+
+try:
+    from kedro.framework.hooks import get_hook_manager
+except ImportError:  # pragma: no cover, kedro < 0.16 has no hooks
+    get_hook_manager = None
+
+_MEMORY_RE = re.compile(r"^mem:(\d+(?:\.\d+)?)([KMGT]?)B?$", re.IGNORECASE)
+_MEMORY_UNITS = {"": 1, "K": 2 ** 10, "M": 2 ** 20, "G": 2 ** 30, "T": 2 ** 40}
+
+
+class ResourceHints(NamedTuple):
+    """Resources a node needs, read from its tags"""
+
+    cpu: float
+    memory: int
+    io: bool
+
+
+def parse_resource_hints(tags: Iterable[str]) -> ResourceHints:
+    """
+    Read the resource hints of a node from its tags: ``cpu:<cores>``,
+    ``mem:<size>`` with an optional K, M, G or T suffix, and ``io`` for nodes
+    mostly waiting on I/O. Nodes use a single core by default, and I/O bound
+    nodes no core at all.
+    :param tags: Node tags
+    :return: The resource hints
+    :raises ValueError: If a hint is malformed
+    """
+    cpu, memory, io_bound = None, 0, False
+    for tag in tags:
+        if tag == "io":
+            io_bound = True
+        elif tag.startswith("cpu:"):
+            try:
+                cpu = float(tag[len("cpu:") :])
+            except ValueError:
+                raise ValueError(f"Invalid CPU hint: {tag}")
+        elif tag.startswith("mem:"):
+            match = _MEMORY_RE.match(tag)
+            if not match:
+                raise ValueError(f"Invalid memory hint: {tag}")
+            memory = int(float(match.group(1)) * _MEMORY_UNITS[match.group(2).upper()])
+    if cpu is None:
+        cpu = 0.0 if io_bound else 1.0
+    return ResourceHints(cpu=cpu, memory=memory, io=io_bound)
+
+
+def critical_path_lengths(pipeline: Pipeline) -> Dict[Node, int]:
+    """
+    Number of nodes on the longest path from each node to the end of the
+    pipeline. Running the nodes with the longest paths first keeps the
+    critical path busy, which bounds the pipeline makespan.
+    :param pipeline: Pipeline to run
+    :return: The critical path length of every node
+    """
+    children = {node: set() for node in pipeline.nodes}  # type: Dict[Node, Set[Node]]
+    for node, parents in pipeline.node_dependencies.items():
+        for parent in parents:
+            children[parent].add(node)
+    lengths = {}  # type: Dict[Node, int]
+    for node in reversed(pipeline.nodes):  # topologically sorted
+        lengths[node] = 1 + max((lengths[child] for child in children[node]), default=0)
+    return lengths
+
+
+def _total_memory() -> int:
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):  # pragma: no cover
+        return 0
+
+
+def _call_node(node: Node, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a node function, in a worker process"""
+    return node.run(inputs)
+
+
+class ResourceRunner(AbstractRunner):
+    """ResourceRunner is a Kedro runner scheduling nodes according to the
+    resource hints in their tags, ``cpu:4``, ``mem:8G`` or ``io``. Ready
+    nodes are started by decreasing critical path length, then by decreasing
+    CPU hint, as long as they fit in the CPU and memory budgets, and smaller
+    nodes fill the budget left by larger ones. CPU bound nodes run in a
+    process pool, I/O bound nodes in threads of the run process. A node
+    needing more than a budget runs once nothing else is running.
+
+    Nodes of the process pool must be picklable, as with ``ParallelRunner``.
+    Their inputs are loaded and their outputs saved in the run process, so
+    ``MemoryDataSet``s can be shared between both kinds of nodes.
+    """
+
+    def __init__(
+        self,
+        cpu_budget: float = None,
+        memory_budget: int = None,
+        io_workers: int = 16,
+        is_async: bool = False,
+    ):
+        """
+        Instantiates the runner
+        :param cpu_budget: Cores available to the nodes, by default all the
+            cores the run process may run on
+        :param memory_budget: Bytes of memory available to the nodes, the
+            physical memory by default, 0 for no limit
+        :param io_workers: Maximum number of I/O bound nodes run at once
+        :param is_async: Load and save node inputs and outputs asynchronously
+        """
+        super().__init__(is_async=is_async)
+        self._cpu_budget = cpu_budget
+        self._memory_budget = (
+            _total_memory() if memory_budget is None else memory_budget
+        )
+        self._io_workers = io_workers
+
+    def create_default_data_set(self, ds_name: str) -> MemoryDataSet:
+        """
+        Factory method for creating the default data set for the runner
+        :param ds_name: Name of the missing data set
+        :return: An instance of ``MemoryDataSet``
+        """
+        return MemoryDataSet()
+
+    def _fits(
+        self,
+        hints: ResourceHints,
+        cpu_used: float,
+        memory_used: int,
+        cpu_budget: float,
+    ) -> bool:
+        if cpu_used + hints.cpu > cpu_budget:
+            return False
+        if self._memory_budget and memory_used + hints.memory > self._memory_budget:
+            return False
+        return True
+
+    def _run(  # pylint: disable=too-many-locals
+        self, pipeline: Pipeline, catalog: DataCatalog, run_id: str = None
+    ) -> None:
+        """
+        Run the pipeline under the CPU and memory budgets
+        :param pipeline: The ``Pipeline`` to run
+        :param catalog: The ``DataCatalog`` from which to fetch data
+        :param run_id: The id of the run
+        :raises Exception: The first node failure
+        """
+        nodes = pipeline.nodes
+        hints = {node: parse_resource_hints(node.tags) for node in nodes}
+        priorities = critical_path_lengths(pipeline)
+        dependencies = pipeline.node_dependencies
+        load_counts = Counter(chain.from_iterable(node.inputs for node in nodes))
+
+        # Run processes are daemonic, which forbids starting the pool. The
+        # flag only matters to the process starting children: the server,
+        # which still terminates the run process when exiting, and the run
+        # process, which joins the pool before the end of the run anyway.
+        # Killed run processes don't get to terminate their children either.
+        multiprocessing.current_process().daemon = False
+        # resolved in the run process, which may be bound to some cores
+        cpu_budget = self._cpu_budget or len(available_cpus())
+        max_processes = max(int(cpu_budget), 1)
+        todo = set(nodes)
+        done = set()  # type: Set[Node]
+        running = {}  # type: Dict[Future, Node]
+        cpu_used, memory_used = 0.0, 0
+        pool = ProcessPoolExecutor(max_workers=max_processes)
+        # fork the workers before any node thread runs: forked by a node
+        # thread, they could inherit a lock held by another one, e.g. logging's
+        for _ in range(max_processes):
+            pool.submit(os.getpid)
+        threads = ThreadPoolExecutor(max_workers=max_processes + self._io_workers)
+        with pool, threads:
+            while True:
+                ready = sorted(
+                    (node for node in todo if dependencies[node] <= done),
+                    key=lambda node: (-priorities[node], -hints[node].cpu, node.name),
+                )
+                io_running = sum(hints[node].io for node in running.values())
+                for node in ready:
+                    hint = hints[node]
+                    if hint.io and io_running >= self._io_workers:
+                        continue
+                    if running and not self._fits(
+                        hint, cpu_used, memory_used, cpu_budget
+                    ):
+                        continue
+                    todo.remove(node)
+                    cpu_used += hint.cpu
+                    memory_used += hint.memory
+                    io_running += hint.io
+                    future = threads.submit(
+                        self._run_node, node, catalog, None if hint.io else pool, run_id
+                    )
+                    running[future] = node
+
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    node = running.pop(future)
+                    future.result()  # raises the node failure
+                    cpu_used -= hints[node].cpu
+                    memory_used -= hints[node].memory
+                    done.add(node)
+                    self._release_datasets(node, catalog, load_counts, pipeline)
+
+        if todo:  # pragma: no cover
+            raise RuntimeError(
+                f"Unable to schedule new tasks although some nodes have not "
+                f"been run:\n{sorted(node.name for node in todo)}"
+            )
+
+    def _run_node(
+        self, node: Node, catalog: DataCatalog, pool: Any, run_id: str = None
+    ) -> Node:
+        """Run a node in the current thread, or its function in the pool"""
+        if pool is None:
+            kwargs = {"run_id": run_id} if run_id is not None else {}
+            return run_node(node, catalog, self._is_async, **kwargs)
+
+        inputs = {name: catalog.load(name) for name in node.inputs}
+        hook_manager = get_hook_manager() if get_hook_manager is not None else None
+        hook_args = dict(
+            node=node, catalog=catalog, inputs=inputs, is_async=False, run_id=run_id
+        )
+        if hook_manager is not None:
+            hook_manager.hook.before_node_run(**hook_args)
+        try:
+            outputs = pool.submit(_call_node, node, inputs).result()
+        except Exception as exc:
+            if hook_manager is not None:
+                hook_manager.hook.on_node_error(error=exc, **hook_args)
+            raise
+        if hook_manager is not None:
+            hook_manager.hook.after_node_run(outputs=outputs, **hook_args)
+        for name, data in outputs.items():
+            catalog.save(name, data)
+        return node
+
+    @staticmethod
+    def _release_datasets(
+        node: Node, catalog: DataCatalog, load_counts: Counter, pipeline: Pipeline
+    ):
+        """Release the datasets no remaining node needs"""
+        for dataset in node.inputs:
+            load_counts[dataset] -= 1
+            if load_counts[dataset] < 1 and dataset not in pipeline.inputs():
+                catalog.release(dataset)
+        for dataset in node.outputs:
+            if load_counts[dataset] < 1 and dataset not in pipeline.outputs():
+                catalog.release(dataset)
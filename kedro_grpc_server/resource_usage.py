@@ -0,0 +1,134 @@
+"""Resource accounting of runs and nodes: ResourceUsageHooks"""
+import resource
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+try:
+    from kedro.framework.hooks import get_hook_manager, hook_impl
+except ImportError:  # pragma: no cover, kedro < 0.16 has no hooks
+    get_hook_manager = None
+
+    def hook_impl(func):  # pylint: disable=missing-function-docstring
+        return func
+
+
+# per-thread CPU time of a node, where supported
+_RUSAGE_NODE = getattr(resource, "RUSAGE_THREAD", resource.RUSAGE_SELF)
+# ru_maxrss is in kilobytes on Linux, in bytes on macOS
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def _cpu_time(usage: Any) -> float:
+    return usage.ru_utime + usage.ru_stime
+
+
+def _tracemalloc_peak() -> int:
+    return tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+
+
+def _reset_tracemalloc_peak():
+    if not tracemalloc.is_tracing():
+        return
+    if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+        tracemalloc.reset_peak()
+    else:  # only blocks allocated from now on are counted
+        tracemalloc.clear_traces()
+
+
+def set_memory_limit(max_bytes: int):
+    """
+    Limit the address space of the current process, so that allocations
+    over the limit raise ``MemoryError``. Called in the run process.
+    :param max_bytes: Maximum address space in bytes
+    """
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        max_bytes = min(max_bytes, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (max_bytes, hard))
+
+
+def run_usage(start_time: float) -> Dict[str, Any]:
+    """
+    Resources used by the current process and its terminated children, e.g.
+    the process pool of ``ResourceRunner``. Called in the run process.
+    :param start_time: Time the run started at
+    :return: Resource usage of the whole run, with an empty ``node``
+    """
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return dict(
+        node="",
+        wall_time=time.time() - start_time,
+        cpu_time=_cpu_time(usage) + _cpu_time(children),
+        max_rss=max(usage.ru_maxrss, children.ru_maxrss) * _MAXRSS_UNIT,
+        tracemalloc_peak=_tracemalloc_peak(),
+    )
+
+
+def thread_rusage() -> Any:
+    """Resource usage of the current thread, where supported, to be passed
+    to ``thread_usage``"""
+    return resource.getrusage(_RUSAGE_NODE)
+
+
+def thread_usage(node: str, start_time: float, start_usage: Any) -> Dict[str, Any]:
+    """
+    Resources used by the current thread since a node or a thread run started
+    :param node: Node name, empty for a whole run
+    :param start_time: Time the node or the run started at
+    :param start_usage: ``thread_rusage`` when the node or the run started
+    :return: Wall time and CPU time of the thread, and the peak resident
+        memory of the process
+    """
+    usage = thread_rusage()
+    return dict(
+        node=node,
+        wall_time=time.time() - start_time,
+        cpu_time=_cpu_time(usage) - _cpu_time(start_usage),
+        max_rss=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_UNIT,
+        tracemalloc_peak=_tracemalloc_peak(),
+    )
+
+
+class ResourceUsageHooks:
+    """ResourceUsageHooks are Kedro hooks measuring, in the run process, the
+    wall time, CPU time and peak resident memory of every node, and the peak
+    memory it allocated when ``tracemalloc`` is tracing. CPU time is the time
+    of the thread running the node, so the nodes of the process pool of
+    ``ResourceRunner`` are only accounted for in the run totals. The peak
+    resident memory is the peak of the run process when the node finished.
+    """
+
+    def __init__(self, export: Callable[[Dict[str, Any]], None]):
+        """
+        Instantiates the hooks
+        :param export: Called with the resource usage of every finished node
+        """
+        self._export = export
+        self._starts = {}  # type: Dict[str, Any]
+
+    def install(self):
+        """Register the hooks with Kedro, if it supports hooks"""
+        if get_hook_manager is not None:
+            get_hook_manager().register(self)
+
+    @hook_impl
+    def before_node_run(self, node):  # pylint: disable=missing-function-docstring
+        _reset_tracemalloc_peak()
+        self._starts[node.name] = (time.time(), thread_rusage())
+
+    @hook_impl
+    def after_node_run(self, node):  # pylint: disable=missing-function-docstring
+        self._end_node(node)
+
+    @hook_impl
+    def on_node_error(self, node):  # pylint: disable=missing-function-docstring
+        self._end_node(node)
+
+    def _end_node(self, node: Any):
+        start = self._starts.pop(node.name, None)
+        if start is None:
+            return
+        self._export(thread_usage(node.name, *start))
@@ -0,0 +1,134 @@
+"""Shared memory handoff of run outputs to the server: ResultChannel"""
+import atexit
+import mmap
+import os
+import pickle
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, Tuple
+
+_SHM_ROOT = "/dev/shm"
+
+
+def _is_plain_array(data: Any) -> bool:
+    """Whether ``data`` is a numpy array whose buffer can be written as is"""
+    dtype = getattr(data, "dtype", None)
+    return (
+        type(data).__module__ == "numpy"
+        and hasattr(data, "__array_interface__")
+        and dtype is not None
+        and not dtype.hasobject
+    )
+
+
+def _create_segment(run_dir: str) -> Tuple[str, int]:
+    """
+    Create a new segment file, exclusively, so that writers in several
+    threads or processes of a run never share a segment
+    :param run_dir: Directory of the segments of the run
+    :return: Path and file descriptor of the segment
+    """
+    index = len(os.listdir(run_dir))
+    while True:
+        path = os.path.join(run_dir, f"{index}.out")
+        try:
+            return path, os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            index += 1
+
+
+class ResultChannel:
+    """ResultChannel hands the outputs of a run back to the server through
+    shared memory. The run process writes each output into its own segment,
+    a file in ``/dev/shm`` when available, and only sends a small descriptor
+    over the run's queue. The server memory-maps the segment to serve it, so
+    the data is never pickled through the queue, and only the chunk being
+    sent is copied into the server heap, as protobuf messages hold bytes.
+
+    NumPy arrays are written as ``.npy`` straight from their buffer, any
+    other output is pickled directly into its segment. Segments live until
+    the run is released or older than ``retention`` seconds.
+    """
+
+    def __init__(self, root: str = None, retention: float = 3600):
+        """
+        Instantiates the result channel
+        :param root: Directory holding the segments, defaults to a new
+            directory in ``/dev/shm``, or in the temp directory if unavailable,
+            deleted when the server exits
+        :param retention: Seconds the outputs of a run are kept for
+        """
+        if root is None:
+            parent = _SHM_ROOT if os.path.isdir(_SHM_ROOT) else None
+            root = tempfile.mkdtemp(prefix="kedro_grpc_server-", dir=parent)
+            atexit.register(self.close)
+        os.makedirs(root, exist_ok=True)
+        self._root = root
+        self._retention = retention
+
+    @property
+    def root(self) -> str:
+        """Directory holding the segments"""
+        return self._root
+
+    def write(self, run_id: str, name: str, data: Any) -> Dict[str, Any]:
+        """
+        Write an output into a new segment. Called in the run process.
+        :param run_id: Run ID
+        :param name: Dataset name of the output
+        :param data: Output data
+        :return: Descriptor of the segment, to be sent to the server
+        """
+        run_dir = os.path.join(self._root, run_id)
+        os.makedirs(run_dir, exist_ok=True)
+        path, fd = _create_segment(run_dir)
+
+        with os.fdopen(fd, "wb") as file_:
+            if _is_plain_array(data):
+                import numpy as np  # pylint: disable=import-outside-toplevel
+
+                np.save(file_, data, allow_pickle=False)
+                data_format = "npy"
+            else:
+                pickle.dump(data, file_, protocol=pickle.HIGHEST_PROTOCOL)
+                data_format = "pickle"
+
+        return dict(
+            output=name, format=data_format, path=path, size=os.path.getsize(path)
+        )
+
+    @staticmethod
+    def open(descriptor: Dict[str, Any]) -> memoryview:
+        """
+        Map a segment in memory. Called in the server process.
+        :param descriptor: Descriptor returned by ``write``
+        :return: Read-only view of the segment
+        """
+        if not descriptor["size"]:
+            return memoryview(b"")
+        with open(descriptor["path"], "rb") as file_:
+            segment = mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(segment)  # type: ignore  # mmap is a buffer
+
+    def release(self, run_id: str):
+        """
+        Delete the segments of a run
+        :param run_id: Run ID
+        """
+        shutil.rmtree(os.path.join(self._root, run_id), ignore_errors=True)
+
+    def expire(self):
+        """Delete the segments of runs older than the retention"""
+        deadline = time.time() - self._retention
+        for run_id in os.listdir(self._root):
+            try:
+                expired = os.path.getmtime(os.path.join(self._root, run_id)) < deadline
+            except FileNotFoundError:  # pragma: no cover
+                continue
+            if expired:
+                self.release(run_id)
+
+    def close(self):
+        """Delete every segment"""
+        shutil.rmtree(self._root, ignore_errors=True)
@@ -0,0 +1,541 @@
+"""Persistent SQLite store of run history: RunStore"""
+import base64
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Collection, Dict, List, Optional, Tuple
+
+from kedro_grpc_server.event_filter import LogEvent
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    pipeline TEXT NOT NULL,
+    state TEXT NOT NULL,
+    start_time REAL NOT NULL,
+    end_time REAL,
+    exit_code INTEGER,
+    owner TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_start_time ON runs (start_time, run_id);
+CREATE INDEX IF NOT EXISTS runs_pipeline ON runs (pipeline, start_time, run_id);
+CREATE INDEX IF NOT EXISTS runs_state ON runs (state, start_time, run_id);
+CREATE TABLE IF NOT EXISTS run_events (
+    run_id TEXT PRIMARY KEY,
+    events BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_live_events (
+    run_id TEXT NOT NULL,
+    sequence INTEGER NOT NULL,
+    events BLOB NOT NULL,
+    PRIMARY KEY (run_id, sequence)
+);
+CREATE TABLE IF NOT EXISTS run_usage (
+    run_id TEXT PRIMARY KEY,
+    usage TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_keys (
+    key TEXT PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    claim_time REAL NOT NULL,
+    owner TEXT
+);
+CREATE TABLE IF NOT EXISTS run_requests (
+    run_id TEXT PRIMARY KEY,
+    request TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_datasets (
+    run_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    checkpoint TEXT NOT NULL,
+    PRIMARY KEY (run_id, name)
+);
+CREATE TABLE IF NOT EXISTS run_dataset_io (
+    run_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    duration REAL NOT NULL,
+    size INTEGER NOT NULL,
+    rows INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS run_dataset_io_run ON run_dataset_io (run_id);
+CREATE INDEX IF NOT EXISTS run_dataset_io_name ON run_dataset_io (name, operation);
+"""
+
+_COLUMNS = "run_id, pipeline, state, start_time, end_time, exit_code"
+
+
+def _encode_cursor(start_time: float, run_id: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([start_time, run_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[float, str]:
+    try:
+        start_time, run_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return float(start_time), str(run_id)
+
+
+def _encode_events(events: List[str]) -> bytes:
+    records = [
+        event.to_dict() if isinstance(event, LogEvent) else event for event in events
+    ]
+    return zlib.compress(json.dumps(records).encode("utf-8"))
+
+
+def _decode_events(blob: bytes) -> List[str]:
+    return [
+        LogEvent.from_dict(record) if isinstance(record, dict) else record
+        for record in json.loads(zlib.decompress(blob).decode("utf-8"))
+    ]
+
+
+def server_owner() -> str:
+    """Owner recorded on the runs and keys of the current server process"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _owner_alive(owner: str) -> bool:
+    """
+    Whether the server process owning runs and keys is running. Processes
+    of other hosts are assumed to be.
+    :param owner: ``server_owner`` of the process, empty if unknown
+    :return: False if the process is gone or unknown
+    """
+    host, _, pid = owner.rpartition(":")
+    if not host:
+        return False
+    if host != socket.gethostname():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except (ProcessLookupError, ValueError):
+        return False
+    except PermissionError:  # owned by another user
+        return True
+    return True
+
+
+def _to_dict(row: Tuple) -> Dict[str, Any]:
+    return dict(
+        zip(("run_id", "pipeline", "state", "start_time", "end_time", "exit_code"), row)
+    )
+
+
+class RunStore:
+    """RunStore keeps the state of every run in a local SQLite database in
+    WAL mode, so that run history survives server restarts. Runs are indexed
+    by pipeline, state and start time and listed with keyset pagination, which
+    keeps history queries fast regardless of the number of stored runs.
+    Event logs are zlib compressed and kept in a separate table, so that
+    listing runs never reads them.
+
+    When shared by several server processes, the events of unfinished runs
+    are also appended as they are logged, so that any process can stream
+    them. Runs are claimed by keys, e.g. an idempotency key, so that
+    identical requests are coalesced into the unfinished run, whichever
+    process received them. Runs and keys record the server process owning
+    them, so that a starting server only interrupts the runs of servers
+    which are gone.
+    """
+
+    def __init__(self, path: str = ":memory:", share_live_events: bool = False):
+        """
+        Opens, and creates if needed, the run store
+        :param path: Path of the SQLite database file
+        :param share_live_events: Store the events of unfinished runs
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._share_live_events = share_live_events
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+        self._add_owner_columns()
+
+    @property
+    def path(self) -> str:
+        """Path of the SQLite database file"""
+        return self._path
+
+    def _add_owner_columns(self):
+        """Add the owner columns to run stores created without them"""
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            for table in ("runs", "run_keys"):
+                columns = self._conn.execute(f"PRAGMA table_info({table})").fetchall()
+                if "owner" not in {column[1] for column in columns}:
+                    self._conn.execute(f"ALTER TABLE {table} ADD COLUMN owner TEXT")
+
+    def interrupt_unfinished(self, state: str = "Interrupted") -> int:
+        """
+        Mark runs left unfinished by server processes which are gone, and
+        release their keys. Runs of live servers sharing the run store are
+        left alone.
+        :param state: State to record for them
+        :return: Number of updated runs
+        """
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            rows = self._conn.execute(
+                "SELECT DISTINCT IFNULL(owner, '') FROM runs WHERE end_time IS NULL "
+                "UNION SELECT DISTINCT IFNULL(owner, '') FROM run_keys"
+            ).fetchall()
+            gone = [owner for (owner,) in rows if not _owner_alive(owner)]
+            if not gone:
+                return 0
+            owners = f"IFNULL(owner, '') IN ({', '.join('?' * len(gone))})"
+            cursor = self._conn.execute(
+                f"UPDATE runs SET state = ?, end_time = ? "
+                f"WHERE end_time IS NULL AND {owners}",
+                [state, time.time()] + gone,
+            )
+            self._conn.execute(f"DELETE FROM run_keys WHERE {owners}", gone)
+        return cursor.rowcount
+
+    def claim_run(self, run_id: str, keys: Dict[str, Optional[float]]) -> str:
+        """
+        Atomically look up an unfinished run claimed by one of the keys, or
+        claim them all for a new run
+        :param run_id: Run ID of the new run
+        :param keys: Seconds each key is claimed for, or None for as long as
+            the run is unfinished
+        :return: Run ID of the unfinished run, or ``run_id`` if none was found
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            # serializes the claims of all processes sharing the database
+            self._conn.execute("BEGIN IMMEDIATE")
+            for key, window in keys.items():
+                row = self._conn.execute(
+                    "SELECT run_keys.run_id FROM run_keys "
+                    "LEFT JOIN runs ON runs.run_id = run_keys.run_id "
+                    "WHERE key = ? AND claim_time >= ? AND end_time IS NULL",
+                    (key, now - window if window is not None else 0),
+                ).fetchone()
+                if row:
+                    return row[0]
+            owner = server_owner()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO run_keys (key, run_id, claim_time, owner) "
+                "VALUES (?, ?, ?, ?)",
+                [(key, run_id, now, owner) for key in keys],
+            )
+        return run_id
+
+    def release_keys(self, run_id: str):
+        """
+        Release the keys claimed by a run
+        :param run_id: Run ID
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM run_keys WHERE run_id = ?", (run_id,))
+
+    def record_start(self, run_id: str, pipeline: str, state: str = "Pending"):
+        """
+        Record a newly started run
+        :param run_id: Run ID
+        :param pipeline: Pipeline name
+        :param state: Initial state of the run
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO runs "
+                "(run_id, pipeline, state, start_time, owner) VALUES (?, ?, ?, ?, ?)",
+                (run_id, pipeline, state, time.time(), server_owner()),
+            )
+
+    def record_end(  # pylint: disable=too-many-arguments
+        self,
+        run_id: str,
+        state: str,
+        exit_code: Optional[int],
+        events: List[str],
+        usage: Dict[str, Any] = None,
+        dataset_io: List[Dict[str, Any]] = None,
+    ):
+        """
+        Record the outcome and the event log of a finished run
+        :param run_id: Run ID
+        :param state: Final state of the run
+        :param exit_code: Exit code of the run
+        :param events: Every event logged by the run
+        :param usage: Resource usage of the run and its nodes
+        :param dataset_io: Every dataset load and save of the run
+        """
+        blob = _encode_events(events)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE runs SET state = ?, end_time = ?, exit_code = ? "
+                "WHERE run_id = ?",
+                (state, time.time(), exit_code, run_id),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO run_events (run_id, events) VALUES (?, ?)",
+                (run_id, blob),
+            )
+            self._conn.execute(
+                "DELETE FROM run_live_events WHERE run_id = ?", (run_id,)
+            )
+            self._conn.execute("DELETE FROM run_keys WHERE run_id = ?", (run_id,))
+            if usage is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO run_usage (run_id, usage) VALUES (?, ?)",
+                    (run_id, json.dumps(usage)),
+                )
+            if dataset_io:
+                self._conn.execute(
+                    "DELETE FROM run_dataset_io WHERE run_id = ?", (run_id,)
+                )
+                self._conn.executemany(
+                    "INSERT INTO run_dataset_io "
+                    "(run_id, name, operation, duration, size, rows) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            run_id,
+                            io["name"],
+                            io["operation"],
+                            io["duration"],
+                            io["size"],
+                            io["rows"],
+                        )
+                        for io in dataset_io
+                    ],
+                )
+
+    def record_request(self, run_id: str, request: Dict[str, Any]):
+        """
+        Record the request of a run, so that it can be resumed
+        :param run_id: Run ID
+        :param request: JSON serializable run request
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO run_requests (run_id, request) VALUES (?, ?)",
+                (run_id, json.dumps(request)),
+            )
+
+    def record_datasets(self, run_id: str, datasets: List[Dict[str, str]]):
+        """
+        Record datasets saved by a run, which a resumed run can load
+        :param run_id: Run ID
+        :param datasets: ``name``, save ``version`` and ``checkpoint`` path,
+            empty for persisted datasets, of every dataset
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO run_datasets "
+                "(run_id, name, version, checkpoint) VALUES (?, ?, ?, ?)",
+                [
+                    (run_id, dataset["name"], dataset["version"], dataset["checkpoint"])
+                    for dataset in datasets
+                ],
+            )
+
+    def append_events(self, run_id: str, sequence: int, events: List[str]):
+        """
+        Record events of an unfinished run, if live events are shared
+        :param run_id: Run ID
+        :param sequence: Number of events of the run logged before these
+        :param events: New events
+        """
+        if not self._share_live_events or not events:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO run_live_events (run_id, sequence, events) "
+                "VALUES (?, ?, ?)",
+                (run_id, sequence, _encode_events(events)),
+            )
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a single run
+        :param run_id: Run ID
+        :return: The run columns, or None if the run is unknown
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return _to_dict(row) if row else None
+
+    def get_events(self, run_id: str) -> List[str]:
+        """
+        Read the event log of a run
+        :param run_id: Run ID
+        :return: The logged events, with their tags, empty if none were recorded.
+            For an unfinished run, the events appended so far.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT events FROM run_events WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            if row:
+                return _decode_events(row[0])
+            rows = self._conn.execute(
+                "SELECT events FROM run_live_events WHERE run_id = ? "
+                "ORDER BY sequence",
+                (run_id,),
+            ).fetchall()
+        return [event for (blob,) in rows for event in _decode_events(blob)]
+
+    def get_request(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the request of a run
+        :param run_id: Run ID
+        :return: The recorded request, or None if none was recorded
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT request FROM run_requests WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_datasets(self, run_id: str) -> Dict[str, Dict[str, str]]:
+        """
+        Read the datasets saved by a run
+        :param run_id: Run ID
+        :return: ``version`` and ``checkpoint`` of every dataset, by name
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, version, checkpoint FROM run_datasets WHERE run_id = ?",
+                (run_id,),
+            ).fetchall()
+        return {
+            name: dict(version=version, checkpoint=checkpoint)
+            for name, version, checkpoint in rows
+        }
+
+    def get_usage(self, run_id: str) -> Dict[str, Any]:
+        """
+        Read the resource usage of a finished run
+        :param run_id: Run ID
+        :return: Usage of the whole run as ``run``, None if it wasn't
+            measured, and of its nodes as ``nodes``
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT usage FROM run_usage WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else dict(run=None, nodes=[])
+
+    def get_dataset_io(self, run_id: str) -> List[Dict[str, Any]]:
+        """
+        Read the dataset loads and saves of a finished run
+        :param run_id: Run ID
+        :return: ``name``, ``operation``, ``duration``, ``size`` and ``rows``
+            of every load and save, in completion order
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, operation, duration, size, rows FROM run_dataset_io "
+                "WHERE run_id = ? ORDER BY rowid",
+                (run_id,),
+            ).fetchall()
+        return [
+            dict(zip(("name", "operation", "duration", "size", "rows"), row))
+            for row in rows
+        ]
+
+    def dataset_io_stats(
+        self, names: Collection[str] = (), pipeline: str = None, since: float = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate the loads and saves of every dataset across runs
+        :param names: Only these datasets, all if empty
+        :param pipeline: Only runs of this pipeline
+        :param since: Only runs started since this time
+        :return: Number of runs and of operations, total and maximum
+            duration, total size and rows of the loads and of the saves of
+            every dataset, longest total duration first
+        """
+        clauses, args = [], []  # type: List[str], List[Any]
+        if names:
+            clauses.append(f"name IN ({', '.join('?' * len(names))})")
+            args.extend(names)
+        if pipeline:
+            clauses.append("pipeline = ?")
+            args.append(pipeline)
+        if since:
+            clauses.append("start_time >= ?")
+            args.append(since)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = (
+            "SELECT name, operation, COUNT(DISTINCT io.run_id), COUNT(*), "
+            "SUM(duration), MAX(duration), SUM(size), SUM(rows) "
+            "FROM run_dataset_io AS io JOIN runs ON runs.run_id = io.run_id "
+            f"{where} GROUP BY name, operation "
+            "ORDER BY SUM(duration) DESC, name, operation"
+        )
+        with self._lock:
+            rows = self._conn.execute(query, args).fetchall()
+        columns = (
+            "name",
+            "operation",
+            "runs",
+            "count",
+            "total_duration",
+            "max_duration",
+            "total_size",
+            "total_rows",
+        )
+        return [dict(zip(columns, row)) for row in rows]
+
+    def list_runs(
+        self,
+        pipeline: str = None,
+        state: str = None,
+        limit: int = 50,
+        cursor: str = None,
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        List runs, most recently started first
+        :param pipeline: Only runs of this pipeline
+        :param state: Only runs in this state
+        :param limit: Maximum number of runs to return
+        :param cursor: ``next_cursor`` returned by the previous page
+        :return: The runs and the cursor of the next page, empty on the last page
+        :raises ValueError: If the cursor is malformed
+        """
+        clauses, args = [], []  # type: List[str], List[Any]
+        if pipeline:
+            clauses.append("pipeline = ?")
+            args.append(pipeline)
+        if state:
+            clauses.append("state = ?")
+            args.append(state)
+        if cursor:
+            clauses.append("(start_time, run_id) < (?, ?)")
+            args.extend(_decode_cursor(cursor))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = (
+            f"SELECT {_COLUMNS} FROM runs {where} "
+            "ORDER BY start_time DESC, run_id DESC LIMIT ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(query, args + [limit + 1]).fetchall()
+
+        runs = [_to_dict(row) for row in rows[:limit]]
+        next_cursor = ""
+        if len(rows) > limit:
+            next_cursor = _encode_cursor(runs[-1]["start_time"], runs[-1]["run_id"])
+        return runs, next_cursor
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
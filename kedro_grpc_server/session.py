@@ -0,0 +1,305 @@
+"""Warm worker process serving the runs of a Session: SessionWorker"""
+import logging
+import sys
+import time
+from multiprocessing import Process, Queue
+from queue import Empty
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set
+
+from kedro.io import MemoryDataSet
+
+from kedro_grpc_server.context_cache import merge_params
+from kedro_grpc_server.dataset_events import DatasetEventHooks
+from kedro_grpc_server.event_bus import EventBus
+from kedro_grpc_server.pipeline_index import PipelineIndex
+from kedro_grpc_server.process_manager import _wrapped_write
+from kedro_grpc_server.resource_usage import (
+    ResourceUsageHooks,
+    thread_rusage,
+    thread_usage,
+)
+from kedro_grpc_server.result_channel import ResultChannel
+from kedro_grpc_server.run_store import RunStore
+
+POLL_INTERVAL = 1.0
+
+
+def params_feed_dict(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Catalog entries of the parameters, as built by ``KedroContext``:
+    ``parameters`` and a ``params:`` entry per parameter, nested ones included
+    :param params: Run parameters
+    :return: Dataset name to parameter value
+    """
+    feed_dict = {"parameters": params}
+
+    def _add(name: str, value: Any):
+        feed_dict[f"params:{name}"] = value
+        if isinstance(value, dict):
+            for key, nested in value.items():
+                _add(f"{name}.{key}", nested)
+
+    for name, value in params.items():
+        _add(name, value)
+    return feed_dict
+
+
+class SessionDataSet(MemoryDataSet):
+    """SessionDataSet is a ``MemoryDataSet`` that runners can't release, so
+    that the intermediate datasets of a run outlive it"""
+
+    def _release(self) -> None:
+        pass
+
+
+class SessionWorker:
+    """SessionWorker is a process forked from the server for the lifetime of
+    a ``Session`` stream, running the runs of the session one after the
+    other. The project catalog is built once, when the session starts, and
+    the outputs of a run that no project dataset persists are kept in memory,
+    so later runs of the session can read them without running the nodes
+    that produced them again. A run only costs a message to the worker.
+
+    Runs go through ``KedroContext.run``, so the project hooks and journal
+    see them as any other run, on the catalog of the session. Events of the
+    run being served are sent back through the same queue as the events of
+    ``ProcessManager`` runs, its free outputs through the result channel, and
+    its resource usage and dataset I/O are persisted to the run store.
+    """
+
+    def __init__(
+        self,
+        context: Any,
+        result_channel: ResultChannel,
+        run_store: RunStore = None,
+        event_bus: EventBus = None,
+        pipeline_index: PipelineIndex = None,
+    ):
+        """
+        Instantiates the session worker
+        :param context: Project context of the session, owned by the worker
+        :param result_channel: Channel handing the run outputs to the server
+        :param run_store: Run store to persist the runs of the session to
+        :param event_bus: Event bus to publish the runs of the session to
+        :param pipeline_index: Index selecting the pipelines of the runs, one
+            indexing the pipelines of ``context`` by default
+        """
+        self._context = context
+        self._result_channel = result_channel
+        self._run_store = run_store
+        self._event_bus = event_bus
+        self._pipeline_index = pipeline_index or PipelineIndex(context)
+        self._requests = Queue()  # type: Queue
+        self._events = Queue()  # type: Queue
+        self._proc = None  # type: Optional[Process]
+
+    @property
+    def proc(self) -> Optional[Process]:
+        """Worker process, None until it is started"""
+        return self._proc
+
+    def start(self):
+        """Fork the worker process"""
+        self._proc = Process(target=self._serve, daemon=True)
+        self._proc.start()
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Stop the worker once its current run is finished
+        :param timeout: Seconds to wait for the worker before killing it
+        """
+        if self._proc is None:
+            return
+        self._requests.put(None)
+        self._proc.join(timeout)
+        if self._proc.is_alive():
+            self._proc.terminate()
+
+    def run(  # pylint: disable=too-many-arguments
+        self,
+        run_id: str,
+        pipeline_name: str = "",
+        tags: Sequence[str] = (),
+        namespaces: Sequence[str] = (),
+        extra_params: Dict[str, Any] = None,
+        runner: Any = None,
+    ) -> Iterator[Any]:
+        """
+        Run a pipeline in the worker
+        :param run_id: Run ID
+        :param pipeline_name: Pipeline to run, the default pipeline if empty
+        :param tags: Only run the nodes with any of these tags
+        :param namespaces: Only run the nodes in any of these namespaces
+        :param extra_params: Parameter overrides of the run
+        :param runner: Runner of the run, ``SequentialRunner`` by default
+        :return: Iterator of the events of the run, ending with the result
+            of the run: a dict with the ``error`` of the run, empty if it
+            succeeded, and the descriptors of its free ``outputs``
+        """
+        pipeline_name = pipeline_name or "__default__"
+        events = []  # type: List[str]
+        usage = dict(run=None, nodes=[])  # type: Dict[str, Any]
+        dataset_io = []  # type: List[Dict[str, Any]]
+        self._record_start(run_id, pipeline_name)
+        self._requests.put(
+            dict(
+                run_id=run_id,
+                pipeline_name=pipeline_name,
+                tags=list(tags),
+                namespaces=list(namespaces),
+                extra_params=extra_params or {},
+                runner=runner,
+            )
+        )
+        while True:
+            try:
+                item = self._events.get(timeout=POLL_INTERVAL)
+            except Empty:
+                if self._proc is not None and self._proc.is_alive():
+                    continue
+                item = dict(error="Session worker exited", outputs=[])
+            if isinstance(item, dict) and "outputs" in item:
+                self._record_end(
+                    run_id, pipeline_name, events, item["error"], usage, dataset_io
+                )
+                yield item
+                return
+            if isinstance(item, dict):
+                if "usage" in item and item["usage"]["node"]:
+                    usage["nodes"].append(item["usage"])
+                elif "usage" in item:
+                    usage["run"] = item["usage"]
+                elif "io" in item:
+                    dataset_io.append(item["io"])
+                elif "dataset" in item:
+                    self._record_dataset(run_id, item["dataset"])
+                continue
+            events.append(item)
+            self._publish(run_id, pipeline_name, "Pending", [item])
+            yield item
+
+    def _record_start(self, run_id: str, pipeline_name: str):
+        if self._run_store is not None:
+            self._run_store.record_start(run_id, pipeline_name)
+        self._publish(run_id, pipeline_name, "Pending")
+
+    def _record_dataset(self, run_id: str, dataset: Dict[str, Any]):
+        """Persist a dataset the run saved, if a resumed run can load it"""
+        if self._run_store is not None and dataset["persisted"]:
+            self._run_store.record_datasets(run_id, [dataset])
+
+    def _record_end(  # pylint: disable=too-many-arguments
+        self,
+        run_id: str,
+        pipeline_name: str,
+        events: List[str],
+        error: str,
+        usage: Dict[str, Any],
+        dataset_io: List[Dict[str, Any]],
+    ):
+        exit_code = 1 if error else 0
+        if self._run_store is not None:
+            self._run_store.record_end(
+                run_id,
+                "Completed",
+                exit_code,
+                events,
+                usage=usage,
+                dataset_io=dataset_io,
+            )
+        self._publish(run_id, pipeline_name, "Completed", exit_code=exit_code)
+
+    def _publish(
+        self,
+        run_id: str,
+        pipeline_name: str,
+        run_status: str,
+        events: List[str] = None,
+        exit_code: int = None,
+    ):
+        if self._event_bus is None:
+            return
+        self._event_bus.publish(
+            dict(
+                run_id=run_id,
+                pipeline_name=pipeline_name,
+                run_status=run_status,
+                events=events or [],
+                exit_code=str(exit_code),
+            )
+        )
+
+    def _serve(self):
+        """Serve the runs of the session, in the worker process"""
+        current_node = {"name": ""}
+        sys.stdout.write = _wrapped_write(self._events, sys.stdout.write, current_node)
+        sys.stderr.write = _wrapped_write(self._events, sys.stderr.write, current_node)
+        # installed before the catalog is built, so that they time its I/O
+        ResourceUsageHooks(self._put_usage).install()
+        # the outputs are written by the worker, the hooks fetch no dataset,
+        # and the saved datasets are recorded by `run`, under its run ID
+        DatasetEventHooks(self._events.put, "").install()
+        catalog = self._context.catalog
+        base_params = self._context.params
+        memory_datasets = set()  # type: Set[str]
+
+        def _get_catalog(save_version=None, journal=None, load_versions=None):
+            # pylint: disable=unused-argument,protected-access
+            catalog._journal = journal
+            return catalog
+
+        self._context._get_catalog = _get_catalog  # pylint: disable=protected-access
+
+        for request in iter(self._requests.get, None):
+            self._events.put("Starting run")
+            start_time, start_usage = time.time(), thread_rusage()
+            try:
+                outputs = self._run(request, catalog, base_params, memory_datasets)
+            except Exception as exc:  # pylint: disable=broad-except
+                logging.exception("Run %s failed", request["run_id"])
+                result = dict(error=str(exc), outputs=[])
+            else:
+                self._events.put("Completed run")
+                result = dict(error="", outputs=outputs)
+            self._put_usage(thread_usage("", start_time, start_usage))
+            self._events.put(result)
+
+    def _put_usage(self, usage: Dict[str, Any]):
+        self._events.put({"usage": usage})
+
+    def _run(
+        self,
+        request: Dict[str, Any],
+        catalog: Any,
+        base_params: Dict[str, Any],
+        memory_datasets: Set[str],
+    ) -> List[Dict[str, Any]]:
+        """Run a pipeline on the session catalog, in the worker process"""
+        pipeline = self._pipeline_index.select(
+            request["pipeline_name"], request["tags"], request["namespaces"]
+        )
+        params = merge_params(base_params, request["extra_params"])
+        feed_dict = params_feed_dict(params)
+        # parameters overridden by a previous run only, e.g. nested ones of a
+        # parameter it replaced, adding the feed rebuilds `catalog.datasets`
+        data_sets = catalog._data_sets  # pylint: disable=protected-access
+        for name in [name for name in data_sets if name.startswith("params:")]:
+            if name not in feed_dict:
+                del data_sets[name]
+        catalog.add_feed_dict(feed_dict, replace=True)
+
+        # kept by the session, instead of the default datasets of the runner
+        for name in pipeline.data_sets() - set(catalog.list()):
+            catalog.add(name, SessionDataSet())
+            memory_datasets.add(name)
+
+        # pylint: disable=protected-access
+        self._context._extra_params = params
+        self._pipeline_index.install(self._context, pipeline)
+        self._context.run(
+            pipeline_name=request["pipeline_name"], runner=request["runner"]
+        )
+        return [
+            self._result_channel.write(request["run_id"], name, catalog.load(name))
+            for name in sorted(pipeline.outputs() & memory_datasets)
+        ]
@@ -0,0 +1,379 @@
+"""OpenTelemetry compatible spans of RPCs and runs, without grpc: Tracer"""
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    from kedro.framework.hooks import get_hook_manager, hook_impl
+except ImportError:  # pragma: no cover, kedro < 0.16 has no hooks
+    get_hook_manager = None
+
+    def hook_impl(func):  # pylint: disable=missing-function-docstring
+        return func
+
+
+TRACEPARENT = "traceparent"
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+STATUS_CODE_OK = 1
+STATUS_CODE_ERROR = 2
+
+_local = threading.local()
+_time_ns = getattr(time, "time_ns", lambda: int(time.time() * 1e9))  # Python 3.6
+
+
+def parse_traceparent(header: str) -> Optional[Tuple[str, str, bool]]:
+    """
+    Parse a W3C ``traceparent`` header
+    :param header: Header value, e.g. ``00-<trace id>-<span id>-01``
+    :return: Trace ID, parent span ID and sampled flag, None if invalid
+    """
+    parts = (header or "").strip().lower().split("-")
+    if len(parts) < 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        int(parts[1], 16)
+        int(parts[2], 16)
+        flags = int(parts[3][:2], 16)
+    except ValueError:
+        return None
+    if not int(parts[1], 16) or not int(parts[2], 16):
+        return None
+    return parts[1], parts[2], bool(flags & 1)
+
+
+def current_span() -> Optional["Span"]:
+    """The span opened with ``Tracer.span`` by the current thread, if any"""
+    return getattr(_local, "span", None)
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class Span:
+    """Span is a timed operation of a trace. Spans which are not sampled
+    still carry IDs, so that the sampling decision is propagated, but are
+    never exported.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: str,
+        parent_span_id: str,
+        sampled: bool,
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Dict[str, Any] = None,
+    ):
+        self._tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.sampled = sampled
+        self.kind = kind
+        self.attributes = dict(attributes or {})
+        self.start_time = _time_ns()
+        self.end_time = None  # type: Optional[int]
+        self.error = None  # type: Optional[str]
+
+    @property
+    def traceparent(self) -> str:
+        """W3C ``traceparent`` header propagating this span"""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def set_error(self, message: str):
+        """
+        Mark the operation as failed
+        :param message: Error description
+        """
+        self.error = message
+
+    def end(self):
+        """End the span and export it if sampled, only the first call counts"""
+        if self.end_time is not None:
+            return
+        self.end_time = _time_ns()
+        if self.sampled:
+            self._tracer.export(self.to_otlp())
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """The span in the OTLP/JSON format"""
+        status = {"code": STATUS_CODE_OK}  # type: Dict[str, Any]
+        if self.error is not None:
+            status = {"code": STATUS_CODE_ERROR, "message": self.error}
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_time),
+            "endTimeUnixNano": str(self.end_time),
+            "attributes": [_attribute(k, v) for k, v in self.attributes.items()],
+            "status": status,
+        }
+
+
+class Tracer:
+    """Tracer creates spans and hands the sampled ones to an exporter.
+    Root spans are sampled with probability ``sample_ratio``, derived from
+    their trace ID like OpenTelemetry's ``TraceIdRatioBased`` sampler, and
+    child spans follow the decision of their parent. Without an exporter,
+    nothing is sampled and tracing costs a few attribute lookups per span.
+    """
+
+    def __init__(
+        self, export: Callable[[Dict[str, Any]], Any] = None, sample_ratio: float = 1.0,
+    ):
+        """
+        Instantiates the tracer
+        :param export: Callable receiving each finished span in OTLP/JSON
+        :param sample_ratio: Share of the traces to record, from 0 to 1
+        """
+        self._export = export
+        self._sample_ratio = sample_ratio if export is not None else 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any trace can be recorded"""
+        return self._sample_ratio > 0
+
+    def start_span(
+        self,
+        name: str,
+        parent: Union[Span, str, None] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Dict[str, Any] = None,
+    ) -> Span:
+        """
+        Start a span, to be ended with ``Span.end``
+        :param name: Operation name
+        :param parent: Parent span, or its ``traceparent`` header, a new
+            trace is started without a valid parent
+        :param kind: OTLP span kind
+        :param attributes: Span attributes
+        :return: The started span
+        """
+        context = None  # type: Optional[Tuple[str, str, bool]]
+        if isinstance(parent, Span):
+            context = (parent.trace_id, parent.span_id, parent.sampled)
+        elif parent:
+            context = parse_traceparent(parent)
+
+        if context is not None:
+            trace_id, parent_span_id, sampled = context
+            sampled = sampled and self.enabled
+        else:
+            trace_id, parent_span_id = os.urandom(16).hex(), ""
+            sampled = int(trace_id[16:], 16) < self._sample_ratio * 2 ** 64
+        return Span(self, name, trace_id, parent_span_id, sampled, kind, attributes)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        parent: Union[Span, str, None] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Dict[str, Any] = None,
+    ) -> Iterator[Span]:
+        """
+        Record a block as a span, the current span of the thread meanwhile.
+        Exceptions mark the span as failed.
+        :param name: Operation name
+        :param parent: Parent span, or its ``traceparent`` header
+        :param kind: OTLP span kind
+        :param attributes: Span attributes
+        """
+        span = self.start_span(name, parent, kind, attributes)
+        previous = current_span()
+        _local.span = span
+        try:
+            yield span
+        except Exception as exc:
+            span.set_error(str(exc))
+            raise
+        finally:
+            _local.span = previous
+            span.end()
+
+    def export(self, span: Dict[str, Any]):
+        """
+        Hand a finished span to the exporter
+        :param span: Span in OTLP/JSON format
+        """
+        if self._export is not None:
+            self._export(span)
+
+
+class BatchSpanExporter:
+    """BatchSpanExporter buffers finished spans and writes them in batches
+    from a background thread, either as OTLP/JSON lines appended to a file,
+    the format of the OpenTelemetry collector file exporter, or posted to
+    the ``/v1/traces`` endpoint of a local OTLP/HTTP collector. Spans are
+    dropped rather than slowing down RPCs when the buffer is full.
+    """
+
+    def __init__(
+        self,
+        output: str,
+        service_name: str = "kedro-grpc-server",
+        max_batch_size: int = 512,
+        interval: float = 2.0,
+        max_queue_size: int = 10000,
+    ):
+        """
+        Instantiates the exporter and starts its thread
+        :param output: Path of the OTLP/JSON lines file, or ``http(s)`` URL of
+            an OTLP/HTTP traces endpoint
+        :param service_name: ``service.name`` resource attribute
+        :param max_batch_size: Maximum number of spans per write
+        :param interval: Seconds between two writes
+        :param max_queue_size: Spans buffered before new ones are dropped
+        """
+        self._output = output
+        self._resource = {"attributes": [_attribute("service.name", service_name)]}
+        self._max_batch_size = max_batch_size
+        self._interval = interval
+        self._queue = Queue(maxsize=max_queue_size)  # type: Queue
+        self._dropped = 0
+        self._stopped = threading.Event()
+        self._write_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="kedro-span-exporter", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def __call__(self, span: Dict[str, Any]):
+        """
+        Buffer a finished span
+        :param span: Span in OTLP/JSON format
+        """
+        try:
+            self._queue.put_nowait(span)
+        except Full:
+            if not self._dropped:
+                logging.warning("Span export is too slow, dropping spans")
+            self._dropped += 1
+
+    def flush(self):
+        """Write every buffered span"""
+        with self._write_lock:
+            while True:
+                batch = []  # type: List[Dict[str, Any]]
+                try:
+                    while len(batch) < self._max_batch_size:
+                        batch.append(self._queue.get_nowait())
+                except Empty:
+                    pass
+                if batch:
+                    self._write(batch)
+                if len(batch) < self._max_batch_size:
+                    return
+
+    def close(self):
+        """Stop the exporter thread and write the remaining spans"""
+        self._stopped.set()
+        self.flush()
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            self.flush()
+
+    def _write(self, batch: List[Dict[str, Any]]):
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": self._resource,
+                    "scopeSpans": [
+                        {"scope": {"name": "kedro_grpc_server"}, "spans": batch}
+                    ],
+                }
+            ]
+        }
+        data = json.dumps(payload).encode("utf-8")
+        try:
+            if self._output.startswith(("http://", "https://")):
+                request = urllib.request.Request(
+                    self._output,
+                    data=data,
+                    headers={"Content-Type": "application/json"},
+                )
+                urllib.request.urlopen(request, timeout=5).close()
+            else:
+                # a single append, so that server processes never interleave
+                fd = os.open(self._output, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+                try:
+                    os.write(fd, data + b"\n")
+                finally:
+                    os.close(fd)
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.warning("Could not export %d spans: %s", len(batch), exc)
+
+
+class RunTracingHooks:
+    """RunTracingHooks are Kedro hooks recording, in the run process, the
+    loading of the run context and a span per node, as children of the span
+    of the run.
+    """
+
+    def __init__(self, tracer: Tracer, run_span: Span):
+        """
+        Instantiates the hooks, starting the context loading span
+        :param tracer: Tracer of the run process
+        :param run_span: Span of the whole run
+        """
+        self._tracer = tracer
+        self._run_span = run_span
+        self._load_span = tracer.start_span("kedro.load_context", run_span)
+        self._node_spans = {}  # type: Dict[str, Span]
+
+    def install(self):
+        """Register the hooks with Kedro, if it supports hooks"""
+        if get_hook_manager is not None:
+            get_hook_manager().register(self)
+
+    def end(self):
+        """End the spans left open, e.g. by a failed run"""
+        self._load_span.end()
+        for span in self._node_spans.values():
+            span.end()
+
+    @hook_impl
+    def before_pipeline_run(self):  # pylint: disable=missing-function-docstring
+        self._load_span.end()
+
+    @hook_impl
+    def before_node_run(self, node):  # pylint: disable=missing-function-docstring
+        self._node_spans[node.name] = self._tracer.start_span(
+            "kedro.node", self._run_span, attributes={"kedro.node": node.name}
+        )
+
+    @hook_impl
+    def after_node_run(self, node):  # pylint: disable=missing-function-docstring
+        span = self._node_spans.pop(node.name, None)
+        if span is not None:
+            span.end()
+
+    @hook_impl
+    def on_node_error(self, error, node):  # pylint: disable=missing-function-docstring
+        span = self._node_spans.pop(node.name, None)
+        if span is not None:
+            span.set_error(str(error))
+            span.end()
@@ -0,0 +1,59 @@
+"""Server startup phases, timings and readiness: StartupTimer"""
+import logging
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from typing import Dict
+
+
+class StartupTimer:
+    """StartupTimer measures the phases of the server startup, so that slow
+    project imports, configuration or dataset loading show up in the logs.
+    """
+
+    def __init__(self):
+        self._start = time.time()
+        self._phases = OrderedDict()  # type: Dict[str, float]
+
+    @property
+    def phases(self) -> Dict[str, float]:
+        """Duration in seconds of each finished phase, in startup order"""
+        return OrderedDict(self._phases)
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Time a startup phase
+        :param name: Phase name
+        """
+        start = time.time()
+        try:
+            yield
+        finally:
+            self._phases[name] = time.time() - start
+
+    def report(self):
+        """Log the duration of every phase and of the whole startup"""
+        logging.info(
+            "Kedro gRPC Server ready in %.2fs (%s)",
+            time.time() - self._start,
+            ", ".join(f"{name} {secs:.2f}s" for name, secs in self._phases.items()),
+        )
+
+
+def prime_workers(executor: Executor, max_workers: int):
+    """
+    Start every thread of a thread pool, which otherwise spawns them one
+    request at a time. Thread pools of the supported Python versions start a
+    thread per submitted task until the pool is full, so submitting a no-op
+    task per thread is enough, and never waits for threads busy with RPCs.
+    :param executor: Thread pool handling the RPCs
+    :param max_workers: Size of the thread pool
+    """
+    for _ in range(max_workers):
+        executor.submit(_noop)
+
+
+def _noop():
+    pass
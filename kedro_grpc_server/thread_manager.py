@@ -0,0 +1,290 @@
+"""Kedro run manager running pipelines in server threads: ThreadManager"""
+import inspect
+import logging
+import threading
+import time
+import traceback
+from concurrent import futures
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Union
+
+from kedro_grpc_server.checkpoint import CheckpointHooks
+from kedro_grpc_server.context_cache import merge_params
+from kedro_grpc_server.dataset_events import DatasetEventHooks
+from kedro_grpc_server.event_filter import LogEvent
+from kedro_grpc_server.process_manager import AbstractManager
+from kedro_grpc_server.resource_usage import (
+    ResourceUsageHooks,
+    thread_rusage,
+    thread_usage,
+)
+
+try:
+    from kedro.framework.hooks import get_hook_manager, hook_impl
+except ImportError:  # pragma: no cover, kedro < 0.16 has no hooks
+    get_hook_manager = None
+
+    def hook_impl(func):  # pylint: disable=missing-function-docstring
+        return func
+
+
+# same format as the `simple` formatter of the Kedro project template
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class _ThreadRun:  # pylint: disable=too-few-public-methods
+    """Events logged by a thread run, tagged with the node being run, and
+    the hooks of the run"""
+
+    def __init__(self, put: Callable[[Any], None]):
+        self._put = put
+        self._current_node = {"name": ""}
+        self.hooks = []  # type: list
+
+    def write(self, text: str, stream: str):
+        """
+        Hand text written to stdout or stderr by the run to the run, as an event
+        :param text: Text written
+        :param stream: Name of the stream written to
+        """
+        if text.strip():
+            self._put(LogEvent.from_write(text, stream, self._current_node))
+
+
+# run of the current thread, None outside thread runs
+_current_run = ContextVar(
+    "kedro_grpc_server_run", default=None
+)  # type: ContextVar[Optional[_ThreadRun]]
+_install_lock = threading.Lock()
+
+
+class RunLogHandler(logging.Handler):
+    """RunLogHandler hands the log records emitted by a thread run to that
+    run, whichever logger they are emitted by. The run is looked up in a
+    context variable, so concurrent runs only capture their own records,
+    and records emitted outside runs are ignored."""
+
+    def __init__(self):
+        super().__init__()
+        self.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    def emit(self, record: logging.LogRecord):
+        run = _current_run.get()
+        if run is None:
+            return
+        try:
+            run.write(self.format(record), "stderr")
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+
+def _dispatch(name: str, **kwargs: Any):
+    """Call a hook of the hooks of the current thread run, with the
+    arguments it takes"""
+    run = _current_run.get()
+    if run is None:
+        return
+    for hooks in run.hooks:
+        method = getattr(hooks, name, None)
+        if method is not None:
+            params = inspect.signature(method).parameters
+            method(**{key: value for key, value in kwargs.items() if key in params})
+
+
+class ThreadRunHooks:
+    """ThreadRunHooks are Kedro hooks, registered once, calling the node
+    hooks of the thread run of the current thread, since the hooks of Kedro
+    are shared by every thread of the server. Runs of other runners than
+    ``SequentialRunner`` run their nodes in other threads, so they are not
+    run on threads."""
+
+    @hook_impl
+    def before_pipeline_run(self):  # pylint: disable=missing-function-docstring
+        _dispatch("before_pipeline_run")
+
+    @hook_impl
+    def before_node_run(self, node):  # pylint: disable=missing-function-docstring
+        _dispatch("before_node_run", node=node)
+
+    @hook_impl
+    def after_node_run(self, node):  # pylint: disable=missing-function-docstring
+        _dispatch("after_node_run", node=node)
+
+    @hook_impl
+    def on_node_error(self, error, node):  # pylint: disable=missing-function-docstring
+        _dispatch("on_node_error", error=error, node=node)
+
+
+RUN_HOOKS = ThreadRunHooks()
+
+
+def install_capture():
+    """Install the log handler capturing the events of thread runs, and the
+    hooks calling the node hooks of thread runs, once"""
+    with _install_lock:
+        root = logging.getLogger()
+        if not any(isinstance(handler, RunLogHandler) for handler in root.handlers):
+            root.addHandler(RunLogHandler())
+        if get_hook_manager is not None:
+            hook_manager = get_hook_manager()
+            if not hook_manager.is_registered(RUN_HOOKS):
+                hook_manager.register(RUN_HOOKS)
+
+
+class _RunFuture:
+    """Handle of a thread run with the interface of the process of a run"""
+
+    def __init__(self, future: futures.Future):
+        self._future = future
+
+    def is_alive(self) -> bool:  # pylint: disable=missing-function-docstring
+        return not self._future.done()
+
+    def join(self, timeout: float = None):  # pylint: disable=missing-function-docstring
+        futures.wait([self._future], timeout)
+
+    @property
+    def exitcode(self) -> Optional[int]:
+        """0 if the run succeeded, 1 if it raised, None until it finished"""
+        if not self._future.done():
+            return None
+        return 1 if self._future.exception() else 0
+
+    @property
+    def pid(self) -> None:
+        """Thread runs have no process of their own"""
+        return None
+
+
+class ThreadManager(AbstractManager):
+    """ThreadManager is an AbstractManager implementation running pipelines
+    on a bounded thread pool of the server, which spares small, I/O bound
+    pipelines the cost of starting a process. Events are captured by a log
+    handler routing what a run logs to that run. What runs print isn't
+    captured, the standard streams of the server are left alone.
+
+    Runs share the memory and cores of the server, so runs with a memory
+    limit, a timeout or bound cores are run with ``ProcessManager``. Node
+    hooks are called through ``ThreadRunHooks``, so the resources used by
+    the nodes and the run, measured for the run thread, node spans and
+    saved datasets are reported as for process runs.
+    """
+
+    def __init__(self, context, executor: futures.Executor, run_id=None, **kwargs):
+        """
+        Instantiates the run manager class
+        :param context: Project context
+        :param executor: Thread pool the runs are run on
+        :param run_id: Specific Run ID
+        :param kwargs: Other arguments of ``AbstractManager``
+        """
+        super().__init__(context=context, run_id=run_id, **kwargs)
+        self._executor = executor
+        self._proc = None  # type: Union[_RunFuture, None]
+        self._events_lock = threading.Lock()
+
+    @property
+    def proc(self) -> Optional[_RunFuture]:
+        """Handle of the run, which has ``is_alive``, ``join`` and ``exitcode``
+        as the process of a run, None until the run is started"""
+        return self._proc
+
+    @property
+    def timed_out(self) -> bool:
+        """Thread runs have no timeout"""
+        return False
+
+    def start(self):
+        """
+        Queue the run on the thread pool
+        """
+        install_capture()
+        self.record_start()
+        self.publish("Pending")
+        self._proc = _RunFuture(self._executor.submit(self._wrapped_run))
+
+    def stop(self) -> str:
+        """
+        Stop the run
+        :return: Stop message
+        """
+        raise NotImplementedError("Run stop is not supported yet.")
+
+    def status(self) -> Dict[Any, Union[str, list]]:
+        """
+        Return status of the current run
+        :return:
+        """
+        # runs not started yet are pending too
+        alive = self._proc is None or self._proc.is_alive()
+        run_status = "Pending" if alive else "Completed"
+        return dict(run_status=run_status, events=self._events)
+
+    def _put(self, item: Any):
+        """Keep an event or an item sent by the run, as they are sent"""
+        with self._events_lock:
+            if not self._handle_item(item):
+                self._add_events([item])
+
+    def _wrapped_run(self):
+        """Run the pipeline, capturing its events, then record its outcome"""
+        run = _ThreadRun(self._put)
+        run.hooks.append(ResourceUsageHooks(self._put_usage))
+        token = _current_run.set(run)
+        start_time, start_usage = time.time(), thread_rusage()
+        exit_code = 0
+        try:
+            self._traced_run(self._put, run.hooks.append)
+        except BaseException:
+            run.write(traceback.format_exc(), "stderr")
+            exit_code = 1
+            raise
+        finally:
+            self._put_usage(thread_usage("", start_time, start_usage))
+            _current_run.reset(token)
+            if exit_code == 0:
+                self._remove_checkpoints()
+            self.record_end("Completed", exit_code=exit_code)
+            self.publish("Completed", exit_code=exit_code)
+
+    def _put_usage(self, usage: Dict[str, Any]):
+        self._put({"usage": usage})
+
+    def _install_hooks(self):
+        """Call the dataset hooks of the run on the catalog the run context
+        creates, as the hooks of Kedro are shared by every thread"""
+        dataset_hooks = DatasetEventHooks(
+            self._put,
+            self._run_id,
+            self._result_channel,
+            self._fetch_datasets,
+            self._checkpoint_dir,
+        )
+        checkpoint_hooks = CheckpointHooks(self._restore)
+        # pylint: disable=protected-access
+        get_catalog = self._context._get_catalog
+
+        @wraps(get_catalog)
+        def _get_catalog(*args: Any, **kwargs: Any):
+            catalog = get_catalog(*args, **kwargs)
+            checkpoint_hooks.after_catalog_created(catalog)
+            dataset_hooks.after_catalog_created(catalog, kwargs.get("save_version"))
+            return catalog
+
+        self._context._get_catalog = _get_catalog
+
+    def _run(self):
+        if self._extra_params:
+            # pylint: disable=protected-access
+            self._context._extra_params = merge_params(
+                self._context.params, self._extra_params
+            )
+        self._install_hooks()
+
+        self._put("Starting run")
+        outputs = self._context.run(**self._run_args)
+        if self._result_channel is not None:
+            for name, data in (outputs or {}).items():
+                self._put(self._result_channel.write(self._run_id, name, data))
+        self._put("Completed run")
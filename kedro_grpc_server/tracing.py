@@ -0,0 +1,54 @@
+"""OpenTelemetry compatible tracing of RPCs: TracingInterceptor"""
+import grpc
+
+from kedro_grpc_server.spans import SPAN_KIND_SERVER, TRACEPARENT, Tracer
+
+
+class TracingInterceptor(grpc.ServerInterceptor):
+    """TracingInterceptor records a server span per RPC, continuing the
+    trace of the ``traceparent`` request metadata if any. The span is the
+    current span of the handler thread, so handlers can propagate it.
+    """
+
+    def __init__(self, tracer: Tracer):
+        """
+        Instantiates the interceptor
+        :param tracer: Tracer recording the spans
+        """
+        self._tracer = tracer
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None or not self._tracer.enabled:
+            return handler
+        method = handler_call_details.method
+        metadata = dict(handler_call_details.invocation_metadata or ())
+        parent = metadata.get(TRACEPARENT)
+        attributes = {"rpc.system": "grpc", "rpc.method": method}
+        tracer = self._tracer
+
+        if handler.unary_unary:
+            behavior = handler.unary_unary
+
+            def _unary_unary(request, context):
+                with tracer.span(method, parent, SPAN_KIND_SERVER, attributes):
+                    return behavior(request, context)
+
+            return grpc.unary_unary_rpc_method_handler(
+                _unary_unary,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.unary_stream:
+            behavior = handler.unary_stream
+
+            def _unary_stream(request, context):
+                with tracer.span(method, parent, SPAN_KIND_SERVER, attributes):
+                    yield from behavior(request, context)
+
+            return grpc.unary_stream_rpc_method_handler(
+                _unary_stream,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        return handler
@@ -0,0 +1,109 @@
+import os
+
+import pytest
+from kedro.io import DataCatalog, DataSetError, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+
+from kedro_grpc_server.checkpoint import (
+    CheckpointDataSet,
+    CheckpointHooks,
+    resume_plan,
+    write_checkpoint,
+)
+
+
+def identity(x):
+    return x
+
+
+def report(x):
+    print(x)
+
+
+@pytest.fixture
+def pipeline():
+    return Pipeline(
+        [
+            node(identity, "a", "b", name="n1"),
+            node(identity, "b", "c", name="n2"),
+            node(identity, "c", "d", name="n3"),
+            node(report, "c", None, name="report"),
+        ]
+    )
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    return write_checkpoint(str(tmp_path), "b", [1, 2])
+
+
+def test_write_checkpoint(tmp_path):
+    path = write_checkpoint(str(tmp_path / "run1"), "params:x", {"y": 1})
+
+    assert os.path.basename(path) == "params%3Ax.pkl"
+    assert CheckpointDataSet(path).load() == {"y": 1}
+    assert os.listdir(str(tmp_path / "run1")) == ["params%3Ax.pkl"]
+
+
+def test_checkpoint_read_only(checkpoint):
+    data_set = CheckpointDataSet(checkpoint)
+
+    assert data_set.exists()
+    with pytest.raises(DataSetError, match="read only"):
+        data_set.save([3])
+    assert not CheckpointDataSet(checkpoint + ".missing").exists()
+
+
+def test_checkpoint_hooks(checkpoint):
+    catalog = DataCatalog({"a": MemoryDataSet(0), "b": MemoryDataSet()})
+
+    CheckpointHooks({"b": checkpoint}).after_catalog_created(catalog)
+
+    assert catalog.load("b") == [1, 2]
+    assert catalog.load("a") == 0
+
+
+def test_resume_last_node(pipeline, checkpoint):
+    datasets = {
+        "b": dict(version="", checkpoint=checkpoint),
+        "c": dict(version="2020-06-01T00.00.00.000Z", checkpoint=""),
+    }
+
+    plan = resume_plan(pipeline, datasets)
+
+    assert sorted(node.name for node in plan.pipeline.nodes) == ["n3", "report"]
+    assert plan.skipped_nodes == ["n1", "n2"]
+    assert plan.restore == {}
+    assert plan.load_versions == {"c": "2020-06-01T00.00.00.000Z"}
+    assert [dataset["name"] for dataset in plan.datasets] == ["b", "c"]
+
+
+def test_resume_from_checkpoint(pipeline, checkpoint):
+    plan = resume_plan(pipeline, {"b": dict(version="", checkpoint=checkpoint)})
+
+    assert sorted(node.name for node in plan.pipeline.nodes) == [
+        "n2",
+        "n3",
+        "report",
+    ]
+    assert plan.skipped_nodes == ["n1"]
+    assert plan.restore == {"b": checkpoint}
+    assert plan.load_versions == {}
+
+
+def test_resume_lost_checkpoint(pipeline, checkpoint):
+    os.remove(checkpoint)
+
+    plan = resume_plan(pipeline, {"b": dict(version="", checkpoint=checkpoint)})
+
+    assert len(plan.pipeline.nodes) == 4
+    assert plan.skipped_nodes == []
+    assert plan.restore == {}
+    assert plan.datasets == []
+
+
+def test_resume_nothing_left(pipeline):
+    saved = dict(version="", checkpoint="")
+
+    with pytest.raises(ValueError, match="No node left"):
+        resume_plan(pipeline.only_nodes("n1", "n2"), {"b": saved, "c": saved})
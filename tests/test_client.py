@@ -0,0 +1,171 @@
+import asyncio
+import time
+from concurrent import futures
+
+import grpc
+import pytest
+
+from kedro_grpc_server.client import KedroClient
+from kedro_grpc_server.kedro_pb2 import (  # type: ignore
+    PipelineSummary,
+    RunStatus,
+    RunSummary,
+)
+from kedro_grpc_server.kedro_pb2_grpc import (  # type: ignore
+    KedroServicer,
+    add_KedroServicer_to_server,
+)
+
+
+class FakeKedro(KedroServicer):
+    def __init__(self):
+        self.run_requests = []
+        self.status_requests = []
+        self.fail_next = False
+
+    def _maybe_fail(self, context):
+        if self.fail_next:
+            self.fail_next = False
+            context.abort(grpc.StatusCode.UNAVAILABLE, "Restarting")
+
+    def ListPipelines(self, request, context):
+        return PipelineSummary(pipeline=["__default__", "de"])
+
+    def Run(self, request, context):
+        self.run_requests.append(request)
+        self._maybe_fail(context)
+        return RunSummary(run_id=f"run-{request.pipeline_name}")
+
+    def Resume(self, request, context):
+        self._maybe_fail(context)
+        return RunSummary(run_id=f"resume-{request.run_id}")
+
+    def Status(self, request, context):
+        self.status_requests.append(request)
+        if request.run_id == "slow":
+            time.sleep(1)
+        if request.since_sequence == 0:
+            yield RunStatus(run_id=request.run_id, events=["a"], sequence=1)
+            self._maybe_fail(context)
+        yield RunStatus(
+            run_id=request.run_id,
+            events=["b", "c"],
+            sequence=3,
+            run_status="Completed",
+            exit_code="0",
+        )
+
+
+@pytest.fixture
+def servicer():
+    return FakeKedro()
+
+
+@pytest.fixture
+def target(servicer):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    add_KedroServicer_to_server(servicer, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    yield f"localhost:{port}"
+    server.stop(None)
+
+
+def run_async(coro):
+    # grpc.aio polls its completion queue from the first event loop using it,
+    # calls failing on another loop would never complete
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def test_list_pipelines(target):
+    async def _list():
+        async with KedroClient(target) as client:
+            return await client.list_pipelines()
+
+    assert run_async(_list()) == ["__default__", "de"]
+
+
+def test_run_retried_with_idempotency_key(target, servicer):
+    servicer.fail_next = True
+
+    async def _run():
+        async with KedroClient(target, backoff=0.01) as client:
+            return await client.run("de", params={"alpha": 2}, tags=["daily"])
+
+    assert run_async(_run()) == "run-de"
+    first, retry = servicer.run_requests
+    assert first.idempotency_key
+    assert retry == first
+    assert dict(first.params) == {"alpha": 2}
+
+
+def test_run_not_retried(target, servicer):
+    async def _run():
+        async with KedroClient(target, backoff=0.01, max_retries=0) as client:
+            return await client.run("de")
+
+    servicer.fail_next = True
+    with pytest.raises(grpc.RpcError) as exc:
+        run_async(_run())
+
+    assert exc.value.code() == grpc.StatusCode.UNAVAILABLE
+
+
+def test_resume(target, servicer):
+    servicer.fail_next = True
+
+    async def _resume():
+        async with KedroClient(target, backoff=0.01) as client:
+            return await client.resume("abc123")
+
+    assert run_async(_resume()) == "resume-abc123"
+
+
+def test_run_many(target, servicer):
+    async def _run_many():
+        async with KedroClient(target, max_concurrency=8) as client:
+            return await client.run_many(
+                [{"pipeline_name": f"p{i}"} for i in range(200)]
+            )
+
+    assert run_async(_run_many()) == [f"run-p{i}" for i in range(200)]
+    assert len({request.idempotency_key for request in servicer.run_requests}) == 200
+
+
+def test_status_resumed(target, servicer):
+    servicer.fail_next = True
+
+    async def _status():
+        async with KedroClient(target, backoff=0.01) as client:
+            return [
+                status async for status in client.status("abc123", min_level="INFO")
+            ]
+
+    statuses = run_async(_status())
+
+    assert [list(status.events) for status in statuses] == [["a"], ["b", "c"]]
+    assert [request.since_sequence for request in servicer.status_requests] == [0, 1]
+    assert servicer.status_requests[1].min_level == "INFO"
+
+
+def test_wait(target):
+    async def _wait():
+        async with KedroClient(target) as client:
+            return await client.wait("abc123")
+
+    status = run_async(_wait())
+
+    assert list(status.events) == ["a", "b", "c"]
+    assert status.run_status == "Completed"
+    assert status.sequence == 3
+
+
+def test_wait_timeout(target):
+    async def _wait():
+        async with KedroClient(target) as client:
+            return await client.wait("slow", timeout=0.2)
+
+    with pytest.raises(grpc.RpcError) as exc:
+        run_async(_wait())
+
+    assert exc.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
@@ -0,0 +1,154 @@
+import os
+import time
+
+import pytest
+
+from kedro_grpc_server.context_cache import ConfigCache, ConfigWatcher, merge_params
+
+
+class FakeLoader:
+    def __init__(self):
+        self.conf_paths = ["conf/base"]
+        self.calls = []
+
+    def get(self, *patterns):
+        self.calls.append(patterns)
+        return {"loaded": list(patterns)}
+
+
+@pytest.fixture
+def conf_file(tmp_path):
+    conf = tmp_path / "conf" / "base"
+    conf.mkdir(parents=True)
+    params = conf / "parameters.yml"
+    params.write_text("alpha: 1\n")
+    return params
+
+
+@pytest.fixture
+def fake_context(mocker, tmp_path):
+    loaders = []
+
+    def _create_loader():
+        loaders.append(FakeLoader())
+        return loaders[-1]
+
+    context = mocker.Mock()
+    context.project_path = tmp_path
+    context.CONF_ROOT = "conf"
+    context._get_config_loader = _create_loader
+    context.loaders = loaders
+    return context
+
+
+def test_merge_params_nested():
+    base = {"model": {"alpha": 1, "beta": 2}, "name": "x"}
+    merged = merge_params(base, {"model": {"alpha": 3.0}, "extra": True})
+
+    assert merged == {"model": {"alpha": 3, "beta": 2}, "name": "x", "extra": True}
+    assert isinstance(merged["model"]["alpha"], int)
+    assert base == {"model": {"alpha": 1, "beta": 2}, "name": "x"}
+
+
+def test_merge_params_keeps_floats():
+    merged = merge_params({"rate": 0.1, "n": 2}, {"rate": 1.0, "n": 2.5})
+
+    assert merged == {"rate": 1.0, "n": 2.5}
+    assert isinstance(merged["rate"], float)
+
+
+def test_config_cache_loads_once(fake_context, conf_file):
+    cache = ConfigCache(fake_context)
+
+    assert cache.get("parameters*") == {"loaded": ["parameters*"]}
+    cache.get("parameters*")["loaded"].append("mutated")
+
+    assert cache.get("parameters*") == {"loaded": ["parameters*"]}
+    assert len(fake_context.loaders) == 1
+    assert fake_context.loaders[0].calls == [("parameters*",)]
+    assert cache.conf_paths == ["conf/base"]
+
+
+def test_config_cache_invalidated_on_change(mocker, fake_context, conf_file):
+    catalogs = [object(), object()]
+    type(fake_context).catalog = mocker.PropertyMock(side_effect=catalogs)
+    cache = ConfigCache(fake_context)
+    cache.get("parameters*")
+
+    assert cache.catalog is catalogs[0]
+    assert cache.catalog is catalogs[0]
+
+    new_mtime = time.time() + 10
+    os.utime(str(conf_file), (new_mtime, new_mtime))
+    cache.get("parameters*")
+
+    assert len(fake_context.loaders) == 2
+    assert fake_context.loaders[1].calls == [("parameters*",)]
+    assert cache.catalog is catalogs[1]
+
+
+def test_config_cache_listener(mocker, fake_context, conf_file):
+    listener = mocker.Mock()
+    cache = ConfigCache(fake_context)
+    cache.add_listener(listener)
+    cache.refresh()
+
+    listener.assert_not_called()
+
+    new_mtime = time.time() + 10
+    os.utime(str(conf_file), (new_mtime, new_mtime))
+    cache.refresh()
+
+    listener.assert_called_once_with()
+
+
+def test_config_cache_install(fake_context, conf_file):
+    cache = ConfigCache(fake_context)
+    cache.install(fake_context)
+
+    assert fake_context._get_config_loader() is cache
+
+
+def test_config_cache_warm_failure(fake_context, caplog):
+    type(fake_context).params = property(lambda self: 1 / 0)
+    ConfigCache(fake_context).warm()
+
+    assert "Could not preload project configuration" in caplog.text
+
+
+def test_config_cache_warm(mocker, fake_context, conf_file):
+    fake_context.catalog.list.return_value = ["a", "b"]
+    cache = ConfigCache(fake_context)
+
+    assert cache.warm()
+    assert cache.catalog is fake_context.catalog
+
+
+def test_config_cache_lock_after_fork(mocker, fake_context):
+    cache = ConfigCache(fake_context)
+    lock = cache.lock
+    assert cache.lock is lock
+
+    mocker.patch("os.getpid", return_value=-1)
+    assert cache.lock is not lock
+
+
+def test_config_watcher_rebuilds(mocker, fake_context, conf_file):
+    catalog = mocker.PropertyMock()
+    type(fake_context).catalog = catalog
+    cache = ConfigCache(fake_context)
+    cache.warm()
+    watcher = ConfigWatcher(cache, interval=0.01)
+    watcher.start()
+
+    new_mtime = time.time() + 10
+    os.utime(str(conf_file), (new_mtime, new_mtime))
+    for _ in range(200):
+        if catalog.call_count > 1:
+            break
+        time.sleep(0.01)
+    watcher.stop()
+    watcher.join(1)
+
+    assert not watcher.is_alive()
+    assert catalog.call_count == 2
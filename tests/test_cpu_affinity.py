@@ -0,0 +1,69 @@
+import os
+
+from kedro_grpc_server import cpu_affinity
+from kedro_grpc_server.cpu_affinity import (
+    THREAD_ENV_VARS,
+    CpuAllocator,
+    available_cpus,
+    format_cpus,
+    pin_process,
+)
+
+
+def test_available_cpus():
+    cpus = available_cpus()
+
+    assert cpus == sorted(cpus)
+    assert 0 < len(cpus) <= os.cpu_count()
+
+
+def test_format_cpus():
+    assert format_cpus([0, 1, 2, 3, 8]) == "0-3,8"
+    assert format_cpus([5]) == "5"
+    assert format_cpus([]) == ""
+
+
+def test_disjoint_cpus():
+    allocator = CpuAllocator(range(8))
+
+    first = allocator.acquire(3)
+    second = allocator.acquire(4)
+
+    assert first == [0, 1, 2]
+    assert second == [3, 4, 5, 6]
+    assert allocator.free == [7]
+    allocator.release(first)
+    assert allocator.free == [0, 1, 2, 7]
+
+
+def test_adjacent_cpus():
+    allocator = CpuAllocator(range(8))
+    runs = [allocator.acquire(1) for _ in range(4)]
+    allocator.release(runs[0])
+    allocator.release(runs[2])
+
+    # 0 and 2 are free but apart, 4 to 7 are adjacent
+    assert allocator.acquire(2) == [4, 5]
+    assert allocator.acquire(3) == [0, 2, 6]
+
+
+def test_shared_cpus(caplog):
+    allocator = CpuAllocator([0, 1, 2])
+    allocator.acquire(2)
+
+    assert allocator.acquire(2) == [0, 2]
+    assert "sharing cores" in caplog.text
+    assert allocator.acquire(10) == [0, 1, 2]
+
+
+def test_pin_process(mocker, monkeypatch):
+    for name in THREAD_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    setaffinity = mocker.patch("os.sched_setaffinity", create=True)
+    limits = mocker.patch.object(cpu_affinity, "threadpool_limits")
+
+    pin_process([2, 3])
+
+    setaffinity.assert_called_once_with(0, [2, 3])
+    assert all(os.environ[name] == "2" for name in THREAD_ENV_VARS)
+    limits.assert_called_once_with(limits=2)
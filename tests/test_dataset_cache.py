@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+from kedro.io import DataCatalog, MemoryDataSet
+
+from kedro_grpc_server.dataset_cache import DatasetCache
+
+
+@pytest.fixture
+def catalog():
+    return DataCatalog(
+        {
+            "lookup": MemoryDataSet(pd.DataFrame({"a": np.arange(100)})),
+            "weights": MemoryDataSet(np.zeros(100)),
+        }
+    )
+
+
+def test_load_once(mocker, catalog):
+    load = mocker.spy(catalog, "load")
+    cache = DatasetCache(["lookup", "weights"])
+
+    cache.load(catalog)
+    cache.load(catalog)
+
+    assert load.call_count == 2
+    assert "lookup" in cache
+    assert "weights" in cache
+    assert cache.nbytes >= 1600
+
+
+def test_loaded(catalog):
+    cache = DatasetCache(["lookup"])
+    assert not cache.loaded
+
+    cache.load(catalog)
+    assert cache.loaded
+    cache.invalidate()
+    assert not cache.loaded
+
+
+def test_load_failure(catalog, caplog):
+    cache = DatasetCache(["missing"])
+    cache.load(catalog)
+
+    assert "missing" not in cache
+    assert "Could not cache dataset `missing`" in caplog.text
+
+
+def test_lru_eviction():
+    cache = DatasetCache(max_bytes=2000)
+    cache.put("first", np.zeros(100))
+    cache.put("second", np.zeros(100))
+    cache.put("third", np.zeros(100))
+
+    assert "first" not in cache
+    assert "second" in cache
+    assert "third" in cache
+    assert cache.nbytes == 1600
+
+
+def test_too_large(caplog):
+    cache = DatasetCache(max_bytes=10)
+    cache.put("weights", np.zeros(100))
+
+    assert "weights" not in cache
+    assert "exceeds the dataset cache size" in caplog.text
+
+
+def test_invalidate():
+    cache = DatasetCache()
+    cache.put("weights", np.zeros(100))
+    cache.invalidate()
+
+    assert "weights" not in cache
+    assert cache.nbytes == 0
+
+
+def test_get():
+    cache = DatasetCache()
+    weights = np.zeros(100)
+    cache.put("weights", weights)
+
+    assert cache.get("weights") is weights
+    assert cache.get("missing") is None
+
+
+def test_install(mocker):
+    weights = np.zeros(100)
+    cache = DatasetCache()
+    cache.put("weights", weights)
+    context = mocker.Mock()
+    context._get_catalog.return_value = DataCatalog()
+
+    cache.install(context)
+    cache.invalidate()  # the run keeps what was cached when it started
+    catalog = context._get_catalog(save_version="abc")
+
+    assert catalog.load("weights") is weights
+
+
+def test_install_empty(mocker):
+    context = mocker.Mock()
+    get_catalog = context._get_catalog
+
+    DatasetCache().install(context)
+
+    assert context._get_catalog is get_catalog
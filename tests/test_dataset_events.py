@@ -0,0 +1,142 @@
+import pickle
+
+import numpy as np
+import pytest
+from kedro.io import AbstractVersionedDataSet, DataCatalog, MemoryDataSet
+
+from kedro_grpc_server.checkpoint import CheckpointDataSet
+from kedro_grpc_server.dataset_events import DatasetEventHooks, data_rows, data_size
+from kedro_grpc_server.result_channel import ResultChannel
+
+
+@pytest.fixture
+def result_channel(tmp_path):
+    return ResultChannel(root=str(tmp_path))
+
+
+@pytest.fixture(autouse=True)
+def no_dataset_hooks(mocker):
+    mocker.patch(
+        "kedro_grpc_server.dataset_events._has_dataset_hooks", return_value=False
+    )
+
+
+def test_data_size():
+    assert data_size(np.zeros(10, dtype="int64")) == 80
+    assert data_size(b"abc") == 3
+    assert data_size({"a": 1}) > 0
+
+
+def test_data_rows():
+    assert data_rows(np.zeros((3, 2))) == 3
+    assert data_rows(np.float64(1.0)) == 0
+    assert data_rows([1, 2]) == 0
+
+
+def saved(exported):
+    return [event for event in exported if "dataset" in event]
+
+
+def test_dataset_saved(result_channel):
+    exported = []
+    hooks = DatasetEventHooks(exported.append, "run1", result_channel)
+    catalog = DataCatalog({"x": MemoryDataSet()})
+    hooks.after_catalog_created(catalog, "2020-06-01T00.00.00.000Z")
+
+    catalog.save("x", b"abc")
+
+    assert catalog.load("x") == b"abc"
+    assert saved(exported) == [
+        {
+            "dataset": dict(
+                name="x",
+                version="",
+                size=3,
+                fetchable=False,
+                persisted=False,
+                checkpoint="",
+            )
+        }
+    ]
+
+
+def test_dataset_fetched(result_channel):
+    exported = []
+    hooks = DatasetEventHooks(exported.append, "run1", result_channel, ["x"])
+    catalog = DataCatalog({"x": MemoryDataSet(), "y": MemoryDataSet()})
+    hooks.after_catalog_created(catalog, None)
+
+    catalog.save("x", [1, 2, 3])
+    catalog.save("y", [4])
+
+    descriptor = exported[1]
+    fetched, other = saved(exported)
+    assert descriptor["output"] == "x"
+    assert pickle.loads(bytes(ResultChannel.open(descriptor))) == [1, 2, 3]
+    assert fetched["dataset"]["fetchable"]
+    assert fetched["dataset"]["size"] == descriptor["size"]
+    assert other["dataset"]["name"] == "y"
+    assert not other["dataset"]["fetchable"]
+
+
+def test_dataset_version(mocker):
+    exported = []
+    versioned = mocker.Mock(spec=AbstractVersionedDataSet)
+    versioned._version = mocker.Mock()  # pylint: disable=protected-access
+    versioned.resolve_save_version.return_value = "2020-06-01T00.00.00.000Z"
+    catalog = mocker.Mock(_data_sets={"model": versioned})
+    hooks = DatasetEventHooks(exported.append, "run1")
+    hooks.after_catalog_created(catalog, "2020-06-01T00.00.00.000Z")
+
+    hooks.after_dataset_saved("model", "data")
+    hooks.after_dataset_saved("other", "data")
+
+    versions = [event["dataset"]["version"] for event in exported]
+    assert versions == ["2020-06-01T00.00.00.000Z", ""]
+
+
+def test_dataset_checkpoint(tmp_path, mocker):
+    exported = []
+    hooks = DatasetEventHooks(exported.append, "run1", checkpoint_dir=str(tmp_path))
+    persisted = mocker.Mock(spec=AbstractVersionedDataSet, _version=None)
+    catalog = DataCatalog({"x": MemoryDataSet(), "y": persisted})
+    hooks.after_catalog_created(catalog, None)
+
+    catalog.save("x", [1, 2])
+    catalog.save("y", [3])
+    hooks.after_dataset_saved("z", lambda: None)  # undeclared, not picklable
+
+    x, y, z = [event["dataset"] for event in saved(exported)]
+    assert not x["persisted"]
+    assert CheckpointDataSet(x["checkpoint"]).load() == [1, 2]
+    assert y["persisted"] and not y["checkpoint"]
+    assert not z["persisted"] and not z["checkpoint"]
+
+
+def test_dataset_saved_to_copy():
+    exported = []
+    hooks = DatasetEventHooks(exported.append, "run1")
+    catalog = DataCatalog({"x": MemoryDataSet()})
+    hooks.after_catalog_created(catalog, None)
+
+    catalog.shallow_copy().save("x", b"abc")
+
+    assert [event["dataset"]["name"] for event in saved(exported)] == ["x"]
+
+
+def test_dataset_io():
+    exported = []
+    hooks = DatasetEventHooks(exported.append, "run1")
+    catalog = DataCatalog({"x": MemoryDataSet(copy_mode="assign")})
+    hooks.after_catalog_created(catalog, None)
+
+    catalog.save("x", np.zeros((4, 2)))
+    catalog.shallow_copy().load("x")
+    hooks.after_dataset_loaded("x", [1])  # load not started, not timed
+
+    save, load = [event["io"] for event in exported if "io" in event]
+    assert (save["name"], save["operation"]) == ("x", "save")
+    assert (load["name"], load["operation"]) == ("x", "load")
+    for event in (save, load):
+        assert event["duration"] >= 0
+        assert (event["size"], event["rows"]) == (64, 4)
@@ -0,0 +1,169 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+from kedro.extras.datasets.pandas import CSVDataSet
+from kedro.io import Version
+
+from kedro_grpc_server.dataset_preview import (
+    DatasetPreviewer,
+    frame_records,
+    load_preview,
+    storage_metadata,
+    to_frame,
+)
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({"a": range(1000), "b": ["x"] * 1000, "c": [0.5] * 1000})
+
+
+@pytest.fixture
+def csv_dataset(tmp_path, frame):
+    dataset = CSVDataSet(str(tmp_path / "data.csv"))
+    dataset.save(frame)
+    return dataset
+
+
+class SQLQueryDataSet:  # pylint: disable=too-few-public-methods
+    """Stand-in for SQL query datasets, querying an in-memory SQLite database"""
+
+    def __init__(self, frame):
+        self._load_args = {
+            "sql": "SELECT * FROM frame;",
+            "con": sqlite3.connect(":memory:"),
+        }
+        frame.to_sql("frame", self._load_args["con"], index=False)
+
+    def load(self):
+        return pd.read_sql_query(**self._load_args)
+
+
+def test_load_preview_csv(csv_dataset, mocker):
+    read_csv = mocker.spy(pd, "read_csv")
+
+    data, pushdown = load_preview(csv_dataset, 5, ["c", "a"])
+
+    assert pushdown == ["limit", "columns"]
+    _, kwargs = read_csv.call_args
+    assert kwargs["nrows"] == 5
+    assert kwargs["usecols"] == ["c", "a"]
+    assert len(data) == 5
+    # the catalog dataset is left untouched
+    assert "nrows" not in csv_dataset._load_args  # pylint: disable=protected-access
+
+
+def test_load_preview_sql_query(frame, mocker):
+    read_sql_query = mocker.spy(pd, "read_sql_query")
+
+    data, pushdown = load_preview(SQLQueryDataSet(frame), 5, ["a"])
+
+    assert pushdown == ["limit"]
+    assert len(data) == 5
+    _, kwargs = read_sql_query.call_args
+    assert kwargs["sql"] == "SELECT * FROM (SELECT * FROM frame) AS preview LIMIT 5"
+
+
+def test_load_preview_sql_table(tmp_path, frame, mocker):
+    pytest.importorskip("sqlalchemy")
+    from kedro.extras.datasets.pandas import SQLTableDataSet
+
+    dataset = SQLTableDataSet(
+        "frame", credentials={"con": f"sqlite:///{tmp_path / 'data.db'}"}
+    )
+    dataset.save(frame)
+    read_sql_query = mocker.spy(pd, "read_sql_query")
+    read_sql_table = mocker.spy(pd, "read_sql_table")
+
+    data, pushdown = load_preview(dataset, 5, ["c", "a"])
+
+    assert pushdown == ["limit", "columns"]
+    assert list(data.columns) == ["c", "a"]
+    assert len(data) == 5
+    (query,), _ = read_sql_query.call_args
+    assert "LIMIT" in str(query)
+    assert not read_sql_table.called
+    data, pushdown = load_preview(dataset, 3)
+    assert pushdown == ["limit"]
+    assert data.shape == (3, 3)
+
+
+def test_load_preview_without_pushdown(mocker, frame):
+    dataset = mocker.Mock(_load_args={})
+    dataset.load.return_value = frame
+
+    data, pushdown = load_preview(dataset, 5)
+
+    assert pushdown == []
+    assert data is frame
+
+
+def test_to_frame(frame):
+    preview = to_frame(frame, 3, ["b", "a"])
+    assert list(preview.columns) == ["b", "a"]
+    assert len(preview) == 3
+
+    assert to_frame([{"a": 1}, {"a": 2}], 1).to_dict("records") == [{"a": 1}]
+    assert len(to_frame(frame["a"], 2)) == 2
+    with pytest.raises(TypeError):
+        to_frame({"a": 1}, 2)
+
+
+def test_frame_records():
+    frame = pd.DataFrame(
+        {
+            0: [1, 2],
+            "when": [pd.Timestamp("2020-06-01"), pd.NaT],
+            "utc": pd.to_datetime(["2020-06-01 02:00", None]).tz_localize("UTC"),
+        }
+    )
+
+    assert frame_records(frame) == [
+        {"0": 1, "when": "2020-06-01T00:00:00.000", "utc": "2020-06-01T02:00:00.000Z"},
+        {"0": 2, "when": None, "utc": None},
+    ]
+
+
+def test_storage_metadata(tmp_path, frame):
+    for version in ("2020-06-01T00.00.00.000Z", "2020-06-02T00.00.00.000Z"):
+        CSVDataSet(str(tmp_path / "data.csv"), version=Version(None, version)).save(
+            frame
+        )
+
+    metadata = storage_metadata(
+        CSVDataSet(str(tmp_path / "data.csv"), version=Version(None, None))
+    )
+
+    assert metadata["versions"] == [
+        "2020-06-02T00.00.00.000Z",
+        "2020-06-01T00.00.00.000Z",
+    ]
+    assert metadata["size"] > 0
+
+
+def test_metadata_cached(csv_dataset, mocker):
+    storage = mocker.patch(
+        "kedro_grpc_server.dataset_preview.storage_metadata",
+        return_value=dict(size=1, versions=[]),
+    )
+    previewer = DatasetPreviewer()
+
+    previewer.metadata("data", csv_dataset)
+    metadata = previewer.metadata("data", csv_dataset)
+
+    assert metadata == dict(type="CSVDataSet", size=1, versions=[])
+    assert storage.call_count == 1
+    previewer.invalidate()
+    previewer.metadata("data", csv_dataset)
+    assert storage.call_count == 2
+
+
+def test_preview_from_memory(mocker, frame):
+    dataset = mocker.Mock()
+
+    preview, pushdown = DatasetPreviewer().preview(dataset, 2, data=frame)
+
+    assert len(preview) == 2
+    assert pushdown == []
+    assert not dataset.load.called
@@ -0,0 +1,86 @@
+import threading
+
+import pytest
+
+from kedro_grpc_server.event_bus import EventBus
+
+
+def _event(run_status="Pending", pipeline_name="__default__", events=None):
+    return dict(
+        run_id="abc123",
+        pipeline_name=pipeline_name,
+        run_status=run_status,
+        events=events or [],
+        exit_code="None",
+    )
+
+
+@pytest.fixture
+def bus():
+    return EventBus()
+
+
+def test_publish_fan_out(bus):
+    first = bus.subscribe()
+    second = bus.subscribe()
+
+    bus.publish(_event())
+
+    assert first.get(timeout=1) == _event()
+    assert second.get(timeout=1) == _event()
+
+
+def test_subscription_filters(bus):
+    by_pipeline = bus.subscribe(pipeline_names=["my_pipeline"])
+    by_status = bus.subscribe(run_statuses=["Completed"])
+    with_events = bus.subscribe(include_events=True)
+
+    bus.publish(_event(events=["Starting run"]))
+    bus.publish(_event("Completed"))
+    bus.publish(_event(pipeline_name="my_pipeline"))
+
+    assert by_pipeline.get(timeout=1)["pipeline_name"] == "my_pipeline"
+    assert by_pipeline.get(timeout=0) is None
+    assert by_status.get(timeout=1)["run_status"] == "Completed"
+    assert by_status.get(timeout=0) is None
+    assert with_events.get(timeout=1)["events"] == ["Starting run"]
+
+
+def test_subscription_close(bus):
+    subscription = bus.subscribe()
+    received = []
+
+    def _consume():
+        for event in subscription:
+            received.append(event)
+
+    consumer = threading.Thread(target=_consume)
+    consumer.start()
+    bus.publish(_event())
+    subscription.close()
+    consumer.join(1)
+
+    assert not consumer.is_alive()
+    assert received == [_event()]
+    assert len(bus) == 0
+    assert subscription.get(timeout=0) is None
+
+
+def test_slow_subscriber_drops_events(bus, caplog):
+    with bus.subscribe(maxsize=1) as subscription:
+        bus.publish(_event())
+        bus.publish(_event("Completed"))
+        bus.publish(_event("Completed"))
+
+        assert subscription.dropped == 2
+        assert subscription.get(timeout=1) == _event()
+    assert "dropping events" in caplog.text
+    assert len(bus) == 0
+
+
+def test_subscription_run_ids(bus):
+    subscription = bus.subscribe(run_ids=["other"], include_events=True)
+
+    bus.publish(_event(events=["Starting run"]))
+
+    assert subscription.get(timeout=0) is None
@@ -0,0 +1,122 @@
+import logging
+import pickle
+
+import pytest
+
+from kedro_grpc_server.event_filter import EventFilter, LogEvent
+
+
+@pytest.fixture
+def events():
+    node = {"name": ""}
+    return [
+        "Starting run",
+        LogEvent.from_write(
+            "2020-08-01 - kedro.pipeline.node - INFO - Running node: split: "
+            "split_data([example_iris_data]) -> [x]",
+            "stderr",
+            node,
+        ),
+        LogEvent.from_write("split output", "stdout", node),
+        LogEvent.from_write("\r 10%|#", "stderr", node),
+        LogEvent.from_write("\r 50%|#####", "stderr", node),
+        LogEvent.from_write("\r100%|##########\r", "stderr", node),
+        LogEvent.from_write(
+            "2020-08-01 - kedro.runner - INFO - Completed 1 out of 2 tasks",
+            "stderr",
+            node,
+        ),
+        LogEvent.from_write("WARNING:root:Low accuracy", "stderr", node),
+        LogEvent.from_write("Traceback (most recent call last):", "stderr", node),
+        "Completed run",
+    ]
+
+
+def test_from_write(events):
+    assert events[1].structured
+    assert events[1].level == logging.INFO
+    assert events[1].node.startswith("split: ")
+    assert events[2].node == events[1].node
+    assert not events[2].structured
+    assert events[3] == " 10%|#"
+    assert events[3].progress
+    assert events[6].node == events[1].node
+    assert events[7].level == logging.WARNING
+    assert events[7].node == ""
+    assert events[8].level == logging.ERROR
+
+
+def test_from_write_crlf():
+    node = {"name": ""}
+    event = LogEvent.from_write(
+        "Traceback (most recent call last):\r\n", "stderr", node
+    )
+    assert not event.progress
+    assert event.level == logging.ERROR
+
+    event = LogEvent.from_write("\r 50%|#####\r100%|##########\r\n", "stderr", node)
+    assert event.progress
+    assert event == "100%|##########\r\n"
+
+
+def test_from_write_node_not_shared():
+    first, second = {"name": ""}, {"name": ""}
+    LogEvent.from_write("INFO - Running node: split", "stderr", first)
+    assert LogEvent.from_write("split output", "stdout", first).node == "split"
+    assert LogEvent.from_write("other output", "stdout", second).node == ""
+
+
+def test_pickle_and_dict(events):
+    for event in events[1:-1]:
+        for copied in (
+            pickle.loads(pickle.dumps(event)),
+            LogEvent.from_dict(event.to_dict()),
+        ):
+            assert copied == event
+            assert copied.to_dict() == event.to_dict()
+
+
+def test_no_filter_collapses_progress(events):
+    assert EventFilter().apply(events) == events[:3] + events[5:]
+
+
+def test_min_level(events):
+    selected = EventFilter(min_level="warning").apply(events)
+    assert selected == events[7:9]
+
+
+def test_streams(events):
+    assert EventFilter(streams=["stdout"]).apply(events) == [
+        "Starting run",
+        "split output",
+        "Completed run",
+    ]
+    assert EventFilter(streams=["structured"]).apply(events) == [
+        "Starting run",
+        events[1],
+        events[6],
+        events[7],
+        "Completed run",
+    ]
+
+
+def test_nodes(events):
+    selected = EventFilter(nodes=["split"]).apply(events)
+    assert selected == ["Starting run"] + events[1:3] + events[5:7] + ["Completed run"]
+    assert EventFilter(nodes=["split_data"]).apply(events[1:-1]) == []
+
+
+def test_pattern(events):
+    assert EventFilter(pattern=r"^Traceback|run$").apply(events) == [
+        "Starting run",
+        events[8],
+        "Completed run",
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"min_level": "loud"}, {"streams": ["stdin"]}, {"pattern": "("}],
+)
+def test_invalid_filter(kwargs):
+    with pytest.raises(ValueError):
+        EventFilter(**kwargs)
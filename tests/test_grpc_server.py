@@ -1,32 +1,49 @@
 import logging
 import os
+import pickle
 import signal
 import sys
 import time
+from concurrent import futures
 from multiprocessing import Lock, Value
+from pathlib import Path
 from typing import Dict
 
 import grpc
 import pytest
 from kedro import __version__
 from kedro.context import KedroContext
-from kedro.io import DataCatalog
+from kedro.io import DataCatalog, MemoryDataSet
 from kedro.pipeline import Pipeline, node
 from kedro.versioning import Journal
 
 from kedro_grpc_server import process_manager
+from kedro_grpc_server.checkpoint import write_checkpoint
+from kedro_grpc_server.cpu_affinity import CpuAllocator
+from kedro_grpc_server.dataset_cache import DatasetCache
 from kedro_grpc_server.grpc_server import (  # type: ignore
+    RUN_OUTPUTS,
     RUN_STATES,
     KedroGrpcServerException,
     KedroServer,
     grpc_serve,
+    serve_in_process,
+)
+from kedro_grpc_server.kedro_pb2 import (  # type: ignore
+    ResumeParams,
+    RunId,
+    RunParams,
 )
-from kedro_grpc_server.kedro_pb2 import RunId, RunParams  # type: ignore
 from kedro_grpc_server.kedro_pb2_grpc import add_KedroServicer_to_server  # type: ignore
 from kedro_grpc_server.process_manager import ProcessManager
+from kedro_grpc_server.resource_runner import ResourceRunner
+from kedro_grpc_server.run_store import RunStore
+from kedro_grpc_server.thread_manager import ThreadManager
 
 _lock = Lock()  # pylint: disable=invalid-name
 _num_active_runs = Value("i", 0)
+# read by pytest-grpc, streaming RPCs hold a server thread while other calls run
+grpc_max_workers = 4  # pylint: disable=invalid-name
 
 
 def dummy_node():  # pragma: no cover
@@ -73,6 +90,14 @@ def clear_stdout_stderr_monkeypatch():
     sys.stderr.write = stderr_write
 
 
+@pytest.fixture(autouse=True)
+def clear_run_states():
+    yield
+    # mocked managers of a test mustn't be evicted by the next ones
+    RUN_STATES.clear()
+    RUN_OUTPUTS.clear()
+
+
 class DummyContext(KedroContext):
     project_name = "test"
     project_version = __version__
@@ -83,7 +108,9 @@ class DummyContext(KedroContext):
     def _get_pipelines(self) -> Dict[str, Pipeline]:
         return {
             "__default__": Pipeline([node(dummy_node, None, "y")]),
-            "my_pipeline": Pipeline([node(dummy_node, None, "y")]),
+            "my_pipeline": Pipeline(
+                [node(dummy_node, None, "y", tags=["daily", "hourly"])]
+            ),
             "error_pipeline": Pipeline([node(bad_node, None, "empty")]),
             "printing_pipeline": Pipeline([node(printing_node, None, "y")]),
         }
@@ -94,7 +121,18 @@ class DummyContext(KedroContext):
         journal: Journal = None,
         load_versions: Dict[str, str] = None,
     ) -> DataCatalog:
-        return DataCatalog()  # pragma: no cover
+        catalog = DataCatalog()
+        # as the Kedro catalog factory does, so that run hooks see the catalog
+        self._hook_manager.hook.after_catalog_created(  # pylint: disable=no-member
+            catalog=catalog,
+            conf_catalog={},
+            conf_creds={},
+            feed_dict={},
+            save_version=save_version,
+            load_versions=load_versions,
+            run_id=self.run_id,
+        )
+        return catalog
 
     def run(self, *args, **kwargs):  # pylint: disable=arguments-differ
         with _num_active_runs.get_lock():
@@ -113,7 +151,10 @@ def grpc_add_to_server():
 
 @pytest.fixture(scope="module")
 def grpc_servicer(tmpdir_factory):
-    dummy_context = DummyContext(str(tmpdir_factory))
+    project_path = tmpdir_factory.mktemp("project")
+    for env in ("base", "local"):  # read by session workers
+        project_path.join("conf", env).ensure(dir=True)
+    dummy_context = DummyContext(str(project_path))
 
     return KedroServer(dummy_context)
 
@@ -144,7 +185,7 @@ def test_grpc_server_on_timeout():
 
 
 def test_grpc_serve(tmpdir_factory):
-    dummy_context = DummyContext(str(tmpdir_factory))
+    dummy_context = DummyContext(str(tmpdir_factory.mktemp("project")))
     grpc_serve(dummy_context, wait_term=False)
 
     ch = grpc.insecure_channel("localhost:50051")
@@ -152,6 +193,25 @@ def test_grpc_serve(tmpdir_factory):
     assert grpc_server_on(ch)
 
 
+def test_grpc_serve_health(tmpdir_factory):
+    from grpc_health.v1 import health_pb2, health_pb2_grpc
+
+    dummy_context = DummyContext(str(tmpdir_factory.mktemp("project")))
+    server = grpc_serve(dummy_context, port=50052, wait_term=False)
+    stub = health_pb2_grpc.HealthStub(grpc.insecure_channel("localhost:50052"))
+    request = health_pb2.HealthCheckRequest(service="kedro.Kedro")
+
+    for _ in range(50):
+        status = stub.Check(request).status
+        if status == health_pb2.HealthCheckResponse.SERVING:
+            break
+        assert status == health_pb2.HealthCheckResponse.NOT_SERVING
+        time.sleep(0.1)
+
+    assert status == health_pb2.HealthCheckResponse.SERVING
+    server.stop(None)
+
+
 def test_grpc_serve_no_context(tmpdir_factory):
     with pytest.raises(KedroGrpcServerException) as exc:
         grpc_serve(wait_term=False)
@@ -159,6 +219,39 @@ def test_grpc_serve_no_context(tmpdir_factory):
     assert "Failed to start" in str(exc.value)
 
 
+def test_grpc_serve_uds(tmpdir_factory, tmp_path):
+    dummy_context = DummyContext(str(tmpdir_factory.mktemp("project")))
+    socket_path = tmp_path / "kedro.sock"
+    server = grpc_serve(dummy_context, wait_term=False, tcp=False, uds=str(socket_path))
+
+    assert grpc_server_on(grpc.insecure_channel(f"unix:{socket_path}"))
+    server.stop(None)
+
+
+@pytest.mark.parametrize(
+    "serve_args", [dict(tcp=False), dict(uds="kedro.sock", processes=2)]
+)
+def test_grpc_serve_invalid_transport(tmpdir_factory, serve_args):
+    dummy_context = DummyContext(str(tmpdir_factory.mktemp("project")))
+
+    with pytest.raises(KedroGrpcServerException):
+        grpc_serve(dummy_context, wait_term=False, **serve_args)
+
+
+def test_serve_in_process(tmpdir_factory):
+    from kedro_grpc_server.kedro_pb2 import PipelineParams
+    from kedro_grpc_server.kedro_pb2_grpc import KedroStub
+
+    dummy_context = DummyContext(str(tmpdir_factory.mktemp("project")))
+    stub = KedroStub(serve_in_process(dummy_context, config_poll_interval=0))
+
+    response = stub.ListPipelines(PipelineParams())
+    assert "my_pipeline" in response.pipeline
+    run_id = stub.Run(RunParams(pipeline_name="my_pipeline")).run_id
+    statuses = list(stub.Status(RunId(run_id=run_id)))
+    assert statuses[-1].run_status == "Completed"
+
+
 def test_get_pipelines(grpc_stub):
     from kedro_grpc_server.kedro_pb2 import PipelineParams
 
@@ -246,6 +339,7 @@ def test_wrapped_run(mocker, capsys):
         print("Fake stderr", file=sys.stderr)
 
     mock_wrapped_write = mocker.spy(process_manager, "_wrapped_write")
+    setpgrp = mocker.patch("kedro_grpc_server.process_manager.os.setpgrp")
     queue = mocker.Mock()
     context = mocker.Mock()
     context.run.side_effect = _fake_run
@@ -254,10 +348,14 @@ def test_wrapped_run(mocker, capsys):
     proc_manager = ProcessManager(context=context, queue=queue, run_args=fake_run_args)
     proc_manager._wrapped_run()
 
+    setpgrp.assert_called_once_with()
     assert mock_wrapped_write.mock_calls == [
-        mocker.call(proc_manager.proc_queue, stdout_write),  # patch of sys.stdout.write
-        mocker.call(proc_manager.proc_queue, stderr_write),  # patch of sys.stderr.write
+        # patch of sys.stdout.write and sys.stderr.write, following the same node
+        mocker.call(proc_manager.proc_queue, stdout_write, {"name": ""}),
+        mocker.call(proc_manager.proc_queue, stderr_write, {"name": ""}),
     ]
+    current_node = mock_wrapped_write.mock_calls[0][1][2]
+    assert mock_wrapped_write.mock_calls[1][1][2] is current_node
 
     assert queue.put.mock_calls == [
         mocker.call("Starting run"),
@@ -265,9 +363,933 @@ def test_wrapped_run(mocker, capsys):
         mocker.call(f"Running: {fake_run_args}"),
         mocker.call("Fake stderr"),
         mocker.call("Completed run"),
+        mocker.call({"usage": mocker.ANY}),
     ]
     context.run.assert_called_once_with(**fake_run_args)
 
     captured = capsys.readouterr()  # capture what was sent to sys.stdout/stderr
     assert captured.out == f"Fake stdout\nRunning: {fake_run_args}\n"
     assert captured.err == "Fake stderr\n"
+
+
+def test_run_with_params(grpc_stub, mocker):
+    proc_manager = mocker.patch("kedro_grpc_server.grpc_server.ProcessManager")
+    proc_manager.return_value.run_id = "params123"
+    request = RunParams(pipeline_name="my_pipeline")
+    request.params.update({"model": {"alpha": 2}})  # pylint: disable=no-member
+
+    response = grpc_stub.Run(request)
+
+    assert response.run_id == "params123"
+    _, kwargs = proc_manager.call_args
+    assert kwargs["extra_params"] == {"model": {"alpha": 2.0}}
+    proc_manager.return_value.start.assert_called_once_with()
+
+
+def test_wrapped_run_extra_params(mocker):
+    mocker.patch("kedro_grpc_server.process_manager.os.setpgrp")
+    context = mocker.Mock()
+    context.params = {"model": {"alpha": 1, "beta": 2}}
+
+    proc_manager = ProcessManager(
+        context=context,
+        queue=mocker.Mock(),
+        run_args={},
+        extra_params={"model": {"alpha": 3.0}},
+    )
+    proc_manager._wrapped_run()
+
+    assert context._extra_params == {"model": {"alpha": 3, "beta": 2}}
+    context.run.assert_called_once_with()
+
+
+def test_watch_runs(grpc_stub, grpc_servicer):
+    from kedro_grpc_server.kedro_pb2 import WatchParams
+
+    watch = grpc_stub.WatchRuns(WatchParams(pipeline_names=["my_pipeline"]))
+    for _ in range(50):
+        if len(grpc_servicer.event_bus):
+            break
+        time.sleep(0.1)
+
+    run_id = grpc_stub.Run(RunParams(pipeline_name="my_pipeline")).run_id
+    statuses = []
+    for event in watch:
+        assert event.run_id == run_id
+        assert event.pipeline_name == "my_pipeline"
+        assert not event.events
+        statuses.append(event.run_status)
+        if event.run_status == "Completed":
+            break
+    watch.cancel()
+
+    assert statuses == ["Pending", "Completed"]
+    RUN_STATES[run_id].proc.join(3)
+
+
+def test_monitor_publishes_events(mocker):
+    bus = mocker.Mock()
+    proc_manager = ProcessManager(
+        context=None, run_args={"pipeline_name": "my_pipeline"}, event_bus=bus
+    )
+    proc_manager._proc = mocker.Mock(exitcode=0)
+    proc_manager._proc.is_alive.side_effect = [True, False, False]
+    proc_manager.proc_queue.put("Starting run")
+    time.sleep(0.1)  # let the queue feeder thread flush
+
+    proc_manager._monitor_run()
+
+    published = [c[0][0] for c in bus.publish.call_args_list]
+    assert [(e["run_status"], e["events"]) for e in published] == [
+        ("Pending", ["Starting run"]),
+        ("Completed", []),
+    ]
+    assert published[-1]["exit_code"] == "0"
+    assert proc_manager.status()["events"] == ["Starting run"]
+
+
+def test_list_runs(grpc_stub, grpc_servicer):
+    from kedro_grpc_server.kedro_pb2 import ListRunsParams
+
+    grpc_servicer.run_store.record_start("listed1", "listed_pipeline")
+    grpc_servicer.run_store.record_start("listed2", "listed_pipeline")
+    grpc_servicer.run_store.record_end("listed2", "Completed", 0, ["Completed run"])
+
+    response = grpc_stub.ListRuns(
+        ListRunsParams(pipeline_name="listed_pipeline", page_size=1)
+    )
+    assert [run.run_id for run in response.runs] == ["listed2"]
+    assert response.runs[0].run_status == "Completed"
+    assert response.runs[0].exit_code == "0"
+    assert response.next_cursor
+
+    response = grpc_stub.ListRuns(
+        ListRunsParams(pipeline_name="listed_pipeline", cursor=response.next_cursor)
+    )
+    assert [run.run_id for run in response.runs] == ["listed1"]
+    assert response.runs[0].exit_code == ""
+    assert not response.next_cursor
+
+
+def test_list_runs_invalid_cursor(grpc_stub):
+    from kedro_grpc_server.kedro_pb2 import ListRunsParams
+
+    with pytest.raises(grpc.RpcError) as exc:
+        grpc_stub.ListRuns(ListRunsParams(cursor="invalid"))
+
+    assert exc.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+
+
+def test_get_status_from_store(grpc_stub, grpc_servicer):
+    grpc_servicer.run_store.record_start("stored123", "my_pipeline")
+    grpc_servicer.run_store.record_end("stored123", "Completed", 0, ["Completed run"])
+
+    statuses = list(grpc_stub.Status(RunId(run_id="stored123")))
+
+    assert len(statuses) == 1
+    assert statuses[0].run_status == "Completed"
+    assert statuses[0].exit_code == "0"
+    assert list(statuses[0].events) == ["Completed run"]
+
+
+def test_get_status_since_sequence(grpc_stub):
+    run_id = grpc_stub.Run(RunParams()).run_id
+    first = next(iter(grpc_stub.Status(RunId(run_id=run_id))))
+    assert first.sequence == len(first.events)
+
+    events = list(first.events)
+    sequence = first.sequence
+    for status in grpc_stub.Status(RunId(run_id=run_id, since_sequence=sequence)):
+        assert status.sequence >= sequence
+        events.extend(status.events)
+        sequence = status.sequence
+
+    assert events[0] == "Starting run"
+    assert events[-1] == "Completed run"
+    assert len(events) == sequence
+
+    statuses = list(grpc_stub.Status(RunId(run_id=run_id, since_sequence=1)))
+    assert list(statuses[-1].events) == events[1:]
+    RUN_STATES[run_id].proc.join(3)
+
+
+def test_get_outputs(grpc_stub, grpc_servicer, mocker):
+    from kedro_grpc_server.kedro_pb2 import OutputParams
+
+    mocker.patch("kedro_grpc_server.grpc_server.OUTPUT_CHUNK_SIZE", 2)
+    proc_manager = ProcessManager(
+        context=None, result_channel=grpc_servicer.result_channel
+    )
+    proc_manager._proc = mocker.Mock()
+    proc_manager.proc.is_alive.return_value = False
+    proc_manager.proc_queue.put(
+        grpc_servicer.result_channel.write(proc_manager.run_id, "y", "X")
+    )
+    time.sleep(0.1)  # let the queue feeder thread flush
+    RUN_STATES[proc_manager.run_id] = proc_manager
+
+    chunks = list(grpc_stub.GetOutputs(OutputParams(run_id=proc_manager.run_id)))
+
+    assert {chunk.name for chunk in chunks} == {"y"}
+    assert {chunk.format for chunk in chunks} == {"pickle"}
+    assert [chunk.offset for chunk in chunks] == list(range(0, chunks[0].size, 2))
+    assert pickle.loads(b"".join(chunk.data for chunk in chunks)) == "X"
+
+    with pytest.raises(grpc.RpcError) as exc:
+        list(
+            grpc_stub.GetOutputs(
+                OutputParams(run_id=proc_manager.run_id, names=["missing"])
+            )
+        )
+    assert exc.value.code() == grpc.StatusCode.NOT_FOUND
+
+
+def test_get_outputs_wrong_run_id(grpc_stub):
+    from kedro_grpc_server.kedro_pb2 import OutputParams
+
+    with pytest.raises(grpc.RpcError) as exc:
+        list(grpc_stub.GetOutputs(OutputParams(run_id="unknown")))
+
+    assert exc.value.code() == grpc.StatusCode.NOT_FOUND
+
+
+def test_get_status_filtered(grpc_stub, grpc_servicer):
+    from kedro_grpc_server.event_filter import LogEvent
+
+    events = [
+        "Starting run",
+        LogEvent("Printed", stream="stdout"),
+        LogEvent("Oh no!!!", stream="stderr", level=logging.ERROR),
+        "Completed run",
+    ]
+    grpc_servicer.run_store.record_start("filtered123", "my_pipeline")
+    grpc_servicer.run_store.record_end("filtered123", "Completed", 1, events)
+
+    request = RunId(run_id="filtered123", min_level="ERROR")
+    statuses = list(grpc_stub.Status(request))
+    assert list(statuses[0].events) == ["Oh no!!!"]
+    assert statuses[0].sequence == 4
+
+    request = RunId(run_id="filtered123", streams=["stdout"], pattern="^P")
+    statuses = list(grpc_stub.Status(request))
+    assert list(statuses[0].events) == ["Printed"]
+
+
+def test_get_status_invalid_filter(grpc_stub):
+    with pytest.raises(grpc.RpcError) as exc:
+        list(grpc_stub.Status(RunId(run_id="filtered123", pattern="(")))
+
+    assert exc.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+
+
+def test_get_status_from_other_process(tmpdir_factory, mocker):
+    from kedro_grpc_server.run_store import RunStore
+
+    db_path = str(tmpdir_factory.mktemp("shared") / "runs.db")
+    other_process = RunStore(db_path, share_live_events=True)
+    other_process.record_start("shared123", "my_pipeline")
+    other_process.append_events("shared123", 0, ["Starting run"])
+    servicer = KedroServer(
+        DummyContext(str(tmpdir_factory.mktemp("project"))), run_store=RunStore(db_path)
+    )
+    mocker.patch("kedro_grpc_server.grpc_server.STORE_POLL_INTERVAL", 0.01)
+
+    def _finish_run(*_):
+        other_process.append_events("shared123", 1, ["Printed"])
+        other_process.record_end(
+            "shared123", "Completed", 0, ["Starting run", "Printed", "Completed run"]
+        )
+
+    mocker.patch("kedro_grpc_server.grpc_server.time.sleep", side_effect=_finish_run)
+    statuses = list(servicer.Status(RunId(run_id="shared123"), mocker.Mock()))
+
+    assert [(s.run_status, list(s.events), s.sequence) for s in statuses] == [
+        ("Pending", ["Starting run"], 1),
+        ("Completed", ["Printed", "Completed run"], 3),
+    ]
+    assert statuses[-1].exit_code == "0"
+
+
+@pytest.fixture
+def proc_manager(mocker):
+    def _proc_manager(**kwargs):
+        manager = mocker.Mock(run_finished=False)
+        manager.run_id = kwargs["run_id"]
+        return manager
+
+    return mocker.patch(
+        "kedro_grpc_server.grpc_server.ProcessManager", side_effect=_proc_manager
+    )
+
+
+@pytest.fixture
+def rpc_context(mocker):
+    return mocker.Mock(**{"time_remaining.return_value": None})
+
+
+def test_run_idempotency_key(grpc_stub, proc_manager):
+    request = RunParams(pipeline_name="my_pipeline", idempotency_key="refresh-1")
+
+    first = grpc_stub.Run(request)
+    retry = grpc_stub.Run(request)
+    other = grpc_stub.Run(RunParams(pipeline_name="my_pipeline"))
+
+    assert not first.coalesced
+    assert retry.coalesced
+    assert retry.run_id == first.run_id
+    assert retry.success == f"Run {first.run_id} already in progress"
+    assert other.run_id != first.run_id
+    assert proc_manager.call_count == 2
+
+
+def test_run_coalesced_in_window(grpc_servicer, proc_manager, rpc_context, mocker):
+    mocker.patch.object(grpc_servicer, "coalesce_window", 60)
+    request = RunParams(pipeline_name="my_pipeline", tags=["daily"])
+    request.params.update({"model": {"alpha": 2}})  # pylint: disable=no-member
+    other_params = RunParams(pipeline_name="my_pipeline", tags=["daily"])
+    other_params.params.update({"model": {"alpha": 3}})  # pylint: disable=no-member
+
+    first = grpc_servicer.Run(request, rpc_context)
+    duplicate = grpc_servicer.Run(request, rpc_context)
+    other = grpc_servicer.Run(other_params, rpc_context)
+
+    assert duplicate.coalesced
+    assert duplicate.run_id == first.run_id
+    assert not other.coalesced
+    assert proc_manager.call_count == 2
+
+    grpc_servicer.run_store.record_end(first.run_id, "Completed", 0, [])
+    assert not grpc_servicer.Run(request, rpc_context).coalesced
+
+
+def test_run_keys_released_on_failure(grpc_servicer, proc_manager, rpc_context):
+    request = RunParams(pipeline_name="my_pipeline", idempotency_key="failing")
+    proc_manager.side_effect = None
+    proc_manager.return_value.run_id = "failing123"
+    proc_manager.return_value.start.side_effect = OSError("Oh no!!!")
+
+    with pytest.raises(OSError):
+        grpc_servicer.Run(request, rpc_context)
+
+    assert grpc_servicer.run_store.claim_run("other", {"key:failing": None}) == (
+        "other"
+    )
+
+
+def test_run_keys_released_on_prepare_failure(
+    grpc_servicer, proc_manager, rpc_context, mocker
+):
+    request = RunParams(pipeline_name="my_pipeline", idempotency_key="unprepared")
+    mocker.patch.object(
+        grpc_servicer, "_prepare_context", side_effect=KeyError("lookup")
+    )
+
+    with pytest.raises(KeyError):
+        grpc_servicer.Run(request, rpc_context)
+
+    assert not proc_manager.called
+    assert grpc_servicer.run_store.claim_run("other", {"key:unprepared": None}) == (
+        "other"
+    )
+
+
+@pytest.mark.parametrize(
+    "runner_name, runner_class",
+    [
+        ("ResourceRunner", "ResourceRunner"),
+        ("ParallelRunner", "ParallelRunner"),
+        ("kedro.runner.SequentialRunner", "SequentialRunner"),
+    ],
+)
+def test_run_with_runner(grpc_stub, mocker, runner_name, runner_class):
+    proc_manager = mocker.patch("kedro_grpc_server.grpc_server.ProcessManager")
+    proc_manager.return_value.run_id = "runner123"
+
+    grpc_stub.Run(RunParams(pipeline_name="my_pipeline", runner=runner_name))
+
+    _, kwargs = proc_manager.call_args
+    assert type(kwargs["run_args"]["runner"]).__name__ == runner_class
+
+
+def test_run_with_invalid_runner(grpc_stub):
+    with pytest.raises(grpc.RpcError) as exc:
+        grpc_stub.Run(RunParams(pipeline_name="my_pipeline", runner="FastRunner"))
+
+    assert exc.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+
+
+def test_get_status_resource_usage(grpc_stub):
+    run_id = grpc_stub.Run(RunParams(pipeline_name="my_pipeline")).run_id
+
+    statuses = list(grpc_stub.Status(RunId(run_id=run_id)))
+
+    node_usage = [usage for status in statuses for usage in status.node_usage]
+    assert [usage.node for usage in node_usage] == ["dummy_node(None) -> [y]"]
+    # CPU time is accounted in ticks, so it can exceed the wall time of short nodes
+    assert node_usage[0].wall_time > 0
+    assert node_usage[0].cpu_time >= 0
+    run_usage = statuses[-1].run_usage
+    assert run_usage.wall_time >= node_usage[0].wall_time
+    assert run_usage.cpu_time > 0
+    assert run_usage.max_rss > 0
+
+    # also kept in the run store
+    stored = list(grpc_stub.Status(RunId(run_id=run_id)))
+    assert stored[0].run_usage == run_usage
+    assert list(stored[0].node_usage) == node_usage
+
+
+def test_run_with_memory_limit(grpc_stub, grpc_servicer, mocker):
+    proc_manager = mocker.patch("kedro_grpc_server.grpc_server.ProcessManager")
+    proc_manager.return_value.run_id = "limited123"
+    mocker.patch.object(grpc_servicer, "memory_limit", 2 * 2 ** 30)
+
+    grpc_stub.Run(RunParams(memory_limit=1024, trace_malloc=True))
+    _, kwargs = proc_manager.call_args
+    assert kwargs["memory_limit"] == 2 ** 30
+    assert kwargs["trace_malloc"]
+
+    grpc_stub.Run(RunParams())
+    _, kwargs = proc_manager.call_args
+    assert kwargs["memory_limit"] == 2 * 2 ** 30
+    assert not kwargs["trace_malloc"]
+
+
+def _session_request(request_id, **run):
+    from kedro_grpc_server.kedro_pb2 import SessionRequest
+
+    return SessionRequest(request_id=request_id, run=RunParams(**run))
+
+
+def test_session(grpc_stub, grpc_servicer):
+    requests = [
+        _session_request("first", pipeline_name="my_pipeline"),
+        _session_request("second", pipeline_name="my_pipeline"),
+        _session_request("failing", pipeline_name="error_pipeline"),
+        _session_request("invalid", runner="FastRunner"),
+    ]
+
+    responses = list(grpc_stub.Session(iter(requests)))
+
+    finished = [response for response in responses if response.exit_code]
+    assert [response.request_id for response in finished] == [
+        "first",
+        "second",
+        "failing",
+    ]
+    assert [response.exit_code for response in finished] == ["0", "0", "1"]
+    assert "Oh no!!!" in finished[-1].error
+    assert len({response.run_id for response in finished}) == 3
+
+    chunks = [c for r in responses if r.request_id == "second" for c in r.outputs]
+    assert {chunk.name for chunk in chunks} == {"y"}
+    assert pickle.loads(b"".join(chunk.data for chunk in chunks)) == "X"
+
+    invalid = [r for r in responses if r.request_id == "invalid"]
+    assert [r.run_status for r in invalid] == ["Error"]
+    assert "FastRunner" in invalid[0].error
+
+    # resource usage and dataset I/O are recorded as for other runs
+    run_store = grpc_servicer.run_store
+    usage = run_store.get_usage(finished[0].run_id)
+    assert usage["run"]["wall_time"] > 0
+    assert [node["node"] for node in usage["nodes"]] == ["dummy_node(None) -> [y]"]
+    dataset_io = run_store.get_dataset_io(finished[0].run_id)
+    assert ("y", "save") in [(io["name"], io["operation"]) for io in dataset_io]
+
+
+def test_session_params(mocker):
+    from kedro_grpc_server.session import SessionWorker
+
+    catalog = DataCatalog()
+    pipeline = Pipeline([node(lambda model: model, "params:model", "y")])
+    context = mocker.Mock()
+    context.run.side_effect = lambda **kwargs: catalog.save(
+        "y", catalog.load("params:model")
+    )
+    index = mocker.Mock(**{"select.return_value": pipeline})
+    worker = SessionWorker(context, mocker.Mock(), pipeline_index=index)
+    base_params = {"model": {"alpha": 1}}
+
+    def _run(extra_params):
+        request = dict(
+            run_id="abc123",
+            pipeline_name="",
+            tags=[],
+            namespaces=[],
+            extra_params=extra_params,
+            runner=None,
+        )
+        worker._run(request, catalog, base_params, set())
+        return catalog.load("y")
+
+    assert _run({}) == {"alpha": 1}
+    assert catalog.load("params:model.alpha") == 1
+    assert _run({"model": 3}) == 3
+    assert "params:model.alpha" not in catalog.list()
+    assert _run({"model": {"beta": 2}}) == {"alpha": 1, "beta": 2}
+    assert catalog.load("params:model.alpha") == 1
+    index.install.assert_called_with(context, pipeline)
+
+
+def test_session_saved_datasets(mocker, tmp_path):
+    from kedro_grpc_server.session import SessionWorker
+
+    run_store = RunStore(str(tmp_path / "runs.db"))
+    worker = SessionWorker(mocker.Mock(), mocker.Mock(), run_store=run_store)
+    worker._proc = mocker.Mock(**{"is_alive.return_value": True})
+    saved = dict(name="x", version="", size=1, fetchable=False, checkpoint="")
+    for item in [
+        {"dataset": dict(saved, persisted=True)},
+        {"dataset": dict(saved, name="y", persisted=False)},
+        dict(error="", outputs=[]),
+    ]:
+        worker._events.put(item)
+
+    list(worker.run("session123"))
+
+    # recorded under the run ID of the request, memory datasets can't be resumed
+    assert run_store.get_datasets("session123") == {
+        "x": dict(version="", checkpoint="")
+    }
+
+
+def test_params_feed_dict():
+    from kedro_grpc_server.session import params_feed_dict
+
+    assert params_feed_dict({"a": 1, "b": {"c": 2}}) == {
+        "parameters": {"a": 1, "b": {"c": 2}},
+        "params:a": 1,
+        "params:b": {"c": 2},
+        "params:b.c": 2,
+    }
+
+
+def test_get_status_saved_datasets(grpc_stub):
+    from kedro_grpc_server.kedro_pb2 import OutputParams
+
+    run_id = grpc_stub.Run(
+        RunParams(pipeline_name="my_pipeline", fetch_datasets=["y"])
+    ).run_id
+
+    statuses = list(grpc_stub.Status(RunId(run_id=run_id)))
+
+    saved = [dataset for status in statuses for dataset in status.saved_datasets]
+    assert [dataset.name for dataset in saved] == ["y"]
+    assert saved[0].fetchable
+    assert saved[0].size > 0
+    chunks = list(grpc_stub.GetOutputs(OutputParams(run_id=run_id, names=["y"])))
+    assert pickle.loads(b"".join(chunk.data for chunk in chunks)) == "X"
+
+
+def test_finished_runs_evicted(grpc_stub, grpc_servicer):
+    from kedro_grpc_server.kedro_pb2 import OutputParams
+
+    run_id = grpc_stub.Run(
+        RunParams(pipeline_name="my_pipeline", fetch_datasets=["y"])
+    ).run_id
+    list(grpc_stub.Status(RunId(run_id=run_id)))
+    for _ in range(50):
+        if RUN_STATES[run_id].run_finished:
+            break
+        time.sleep(0.1)
+
+    other_run_id = grpc_stub.Run(RunParams(pipeline_name="my_pipeline")).run_id
+
+    assert run_id not in RUN_STATES
+    assert other_run_id in RUN_STATES
+    (status,) = grpc_stub.Status(RunId(run_id=run_id))
+    assert status.run_status == "Completed"
+    chunks = list(grpc_stub.GetOutputs(OutputParams(run_id=run_id, names=["y"])))
+    assert pickle.loads(b"".join(chunk.data for chunk in chunks)) == "X"
+
+    grpc_servicer.result_channel.release(run_id)
+    list(grpc_stub.Status(RunId(run_id=other_run_id)))
+    grpc_stub.Run(RunParams(pipeline_name="my_pipeline"))
+    assert run_id not in RUN_OUTPUTS
+
+
+def test_get_status_dataset_io(grpc_stub):
+    run_id = grpc_stub.Run(RunParams(pipeline_name="my_pipeline")).run_id
+
+    statuses = list(grpc_stub.Status(RunId(run_id=run_id)))
+
+    dataset_io = [io for status in statuses for io in status.dataset_io]
+    # the runner loads the free output of the pipeline once it ran
+    assert [(io.name, io.operation) for io in dataset_io] == [
+        ("y", "save"),
+        ("y", "load"),
+    ]
+    assert dataset_io[0].duration >= 0
+    assert dataset_io[0].size > 0
+
+    # also kept in the run store
+    stored = list(grpc_stub.Status(RunId(run_id=run_id)))
+    assert list(stored[0].dataset_io) == dataset_io
+
+
+def test_dataset_stats(grpc_stub, grpc_servicer):
+    from kedro_grpc_server.kedro_pb2 import DatasetStatsParams
+
+    run_store = grpc_servicer.run_store
+    for run_id, duration in (("io1", 1.0), ("io2", 3.0)):
+        run_store.record_start(run_id, "io_pipeline")
+        dataset_io = [
+            dict(name="raw", operation="load", duration=duration, size=100, rows=5)
+        ]
+        run_store.record_end(run_id, "Completed", 0, [], dataset_io=dataset_io)
+
+    response = grpc_stub.DatasetStats(
+        DatasetStatsParams(names=["raw"], pipeline_name="io_pipeline")
+    )
+
+    (stats,) = response.stats
+    assert (stats.name, stats.operation) == ("raw", "load")
+    assert (stats.runs, stats.count, stats.total_rows) == (2, 2, 10)
+    assert (stats.mean_duration, stats.max_duration) == (2.0, 3.0)
+    assert stats.throughput == 50.0
+
+
+def test_run_with_tags(grpc_stub, grpc_servicer, proc_manager, mocker):
+    install = mocker.spy(grpc_servicer.pipeline_index, "install")
+
+    grpc_stub.Run(RunParams(pipeline_name="my_pipeline", tags=["daily,hourly"]))
+
+    _, kwargs = proc_manager.call_args
+    assert kwargs["run_args"] == {"pipeline_name": "my_pipeline"}
+    (_, pipeline), _ = install.call_args
+    assert [node.name for node in pipeline.nodes] == ["dummy_node(None) -> [y]"]
+
+
+@pytest.mark.parametrize(
+    "run_params",
+    [
+        RunParams(pipeline_name="missing_pipeline"),
+        RunParams(pipeline_name="my_pipeline", tags=["missing"]),
+        RunParams(pipeline_name="my_pipeline", namespaces=["missing"]),
+    ],
+)
+def test_run_with_invalid_selection(grpc_stub, proc_manager, run_params):
+    with pytest.raises(grpc.RpcError) as exc:
+        grpc_stub.Run(run_params)
+
+    assert exc.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+    assert not proc_manager.called
+
+
+class HangingContext:  # pylint: disable=too-few-public-methods
+    def run(self, **kwargs):  # pragma: no cover, runs in the run process
+        print("Hanging")
+        time.sleep(60)
+
+
+def test_run_timeout(tmp_path):
+    run_store = RunStore(str(tmp_path / "runs.db"))
+    proc_manager = ProcessManager(
+        HangingContext(), run_args={}, run_store=run_store, timeout=0.5
+    )
+    start = time.time()
+    proc_manager.start()
+    proc_manager._monitor.join(5)
+
+    assert time.time() - start < 5
+    assert proc_manager.timed_out
+    status = proc_manager.status()
+    assert status["run_status"] == "TimedOut"
+    assert status["events"][-1] == "Run timed out after 0.5 seconds"
+    assert run_store.get(proc_manager.run_id)["state"] == "TimedOut"
+
+
+def hanging_worker_node(pid_path):  # pragma: no cover, runs in a pool worker
+    Path(pid_path).write_text(str(os.getpid()))
+    time.sleep(60)
+
+
+class HangingPoolContext:  # pylint: disable=too-few-public-methods
+    def __init__(self, pid_path):
+        self.pid_path = pid_path
+
+    def run(self, **kwargs):  # pragma: no cover, runs in the run process
+        pipeline = Pipeline([node(hanging_worker_node, "params:pid_path", "x")])
+        catalog = DataCatalog(feed_dict={"params:pid_path": self.pid_path})
+        ResourceRunner(cpu_budget=1).run(pipeline, catalog)
+
+
+def _running(pid):
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            return stat.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+def test_run_timeout_kills_pool_workers(tmp_path):
+    pid_path = tmp_path / "worker.pid"
+    proc_manager = ProcessManager(
+        HangingPoolContext(str(pid_path)), run_args={}, timeout=2
+    )
+    proc_manager.start()
+    proc_manager._monitor.join(10)
+
+    assert proc_manager.timed_out
+    worker_pid = int(pid_path.read_text())
+    for _ in range(50):  # the group is signalled, the worker may take a moment
+        if not _running(worker_pid):
+            break
+        time.sleep(0.1)
+    assert not _running(worker_pid)
+
+
+def test_terminate_drains_events(mocker):
+    import queue  # pylint: disable=import-outside-toplevel
+
+    mocker.patch("kedro_grpc_server.process_manager.os.killpg")
+    proc = mocker.Mock(**{"is_alive.return_value": False})
+    events = queue.Queue()
+    events.put("Hanging")
+    proc_manager = ProcessManager(
+        HangingContext(), run_args={}, proc=proc, queue=events, timeout=0.5
+    )
+    locked_on_join = []
+    proc.join.side_effect = lambda *args: locked_on_join.append(
+        proc_manager._events_lock.locked()
+    )
+
+    proc_manager._terminate()
+
+    assert locked_on_join == [False, False]
+    assert proc_manager.status()["events"] == [
+        "Hanging",
+        "Run timed out after 0.5 seconds",
+    ]
+
+
+def test_run_with_timeout(grpc_stub, grpc_servicer, proc_manager, mocker):
+    mocker.patch.object(grpc_servicer, "run_timeout", 60)
+
+    grpc_stub.Run(RunParams(timeout=10))
+    _, kwargs = proc_manager.call_args
+    assert kwargs["timeout"] == 10
+
+    grpc_stub.Run(RunParams())
+    _, kwargs = proc_manager.call_args
+    assert kwargs["timeout"] == 60
+
+
+def test_run_deadline_passed(grpc_servicer, proc_manager, rpc_context):
+    rpc_context.time_remaining.return_value = 0
+    request = RunParams(pipeline_name="my_pipeline", idempotency_key="late")
+
+    grpc_servicer.Run(request, rpc_context)
+
+    rpc_context.set_code.assert_called_once_with(grpc.StatusCode.DEADLINE_EXCEEDED)
+    assert not proc_manager.called
+
+    # expired while the run was being prepared
+    rpc_context.time_remaining.side_effect = [1.0, 0]
+    grpc_servicer.Run(request, rpc_context)
+
+    assert not proc_manager.called
+    assert grpc_servicer.run_store.claim_run("other", {"key:late": None}) == "other"
+
+
+def test_prepare_context(tmp_path, mocker):
+    dataset_cache = DatasetCache(["lookup"])
+    load = mocker.spy(dataset_cache, "load")
+    servicer = KedroServer(
+        DummyContext(str(tmp_path)),
+        run_store=RunStore(str(tmp_path / "runs.db")),
+        dataset_cache=dataset_cache,
+    )
+    mocker.patch.object(
+        type(servicer.config_cache),
+        "catalog",
+        new_callable=mocker.PropertyMock,
+        return_value=DataCatalog({"lookup": MemoryDataSet([1, 2])}),
+    )
+
+    first = servicer._prepare_context()
+    second = servicer._prepare_context()
+
+    # loaded once, until the catalog changes
+    assert load.call_count == 1
+    assert first is not servicer.app_context
+    assert first._get_catalog().load("lookup") == [1, 2]
+    assert second._get_catalog().load("lookup") == [1, 2]
+    dataset_cache.invalidate()
+    servicer._prepare_context()
+    assert load.call_count == 2
+
+
+def test_preview_dataset(grpc_stub, grpc_servicer, mocker):
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    from kedro_grpc_server.kedro_pb2 import (  # pylint: disable=import-outside-toplevel
+        PreviewParams,
+    )
+
+    frame = pd.DataFrame({"a": range(20), "b": ["x"] * 20})
+    catalog = DataCatalog({"frame": MemoryDataSet(frame)})
+    mocker.patch.object(
+        type(grpc_servicer.config_cache),
+        "catalog",
+        new_callable=mocker.PropertyMock,
+        return_value=catalog,
+    )
+
+    preview = grpc_stub.PreviewDataset(
+        PreviewParams(name="frame", limit=3, columns=["b"])
+    )
+
+    assert preview.dataset_type == "MemoryDataSet"
+    assert [(column.name, column.dtype) for column in preview.schema] == [
+        ("b", "object")
+    ]
+    assert [dict(row) for row in preview.rows] == [{"b": "x"}] * 3
+    assert not preview.cached
+    with pytest.raises(grpc.RpcError) as exc:
+        grpc_stub.PreviewDataset(PreviewParams(name="missing"))
+    assert exc.value.code() == grpc.StatusCode.NOT_FOUND
+
+
+class AffinityContext:  # pylint: disable=too-few-public-methods
+    def run(self, **kwargs):  # pragma: no cover, runs in the run process
+        print(f"{sorted(os.sched_getaffinity(0))} {os.environ['OMP_NUM_THREADS']}")
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux only")
+def test_run_cpus():
+    cpus = sorted(os.sched_getaffinity(0))[:1]
+    cpu_allocator = CpuAllocator(cpus)
+    proc_manager = ProcessManager(
+        AffinityContext(), run_args={}, cpus=1, cpu_allocator=cpu_allocator
+    )
+    proc_manager.start()
+
+    assert proc_manager.cpus == cpus
+    assert cpu_allocator.free == []
+    proc_manager._monitor.join(10)
+    assert f"{cpus} 1" in proc_manager.status()["events"]
+    assert cpu_allocator.free == cpus
+
+
+def test_run_with_cpus(grpc_stub, grpc_servicer, proc_manager, mocker):
+    mocker.patch.object(grpc_servicer, "run_cpus", 1)
+    mocker.patch.object(grpc_servicer, "cpu_allocator", CpuAllocator(range(4)))
+
+    grpc_stub.Run(RunParams(cpus=2, runner="ParallelRunner"))
+    _, kwargs = proc_manager.call_args
+    assert kwargs["cpus"] == 2
+    assert kwargs["cpu_allocator"] is grpc_servicer.cpu_allocator
+    assert kwargs["run_args"]["runner"]._max_workers == 2
+
+    grpc_stub.Run(RunParams(cpus=16))
+    _, kwargs = proc_manager.call_args
+    assert kwargs["cpus"] == 4
+
+    grpc_stub.Run(RunParams())
+    _, kwargs = proc_manager.call_args
+    assert kwargs["cpus"] == 1
+
+
+def test_resume(grpc_servicer, proc_manager, rpc_context, mocker, tmp_path):
+    pipeline = Pipeline(
+        [
+            node(dummy_node, None, "x", name="first"),
+            node(lambda x: x, "x", "y", name="second"),
+        ]
+    )
+    mocker.patch.object(grpc_servicer.pipeline_index, "select", return_value=pipeline)
+    install = mocker.spy(grpc_servicer.pipeline_index, "install")
+    mocker.patch.object(grpc_servicer, "checkpoint_dir", str(tmp_path))
+    run_store = grpc_servicer.run_store
+    request = RunParams(pipeline_name="my_pipeline", checkpoint=True)
+    request.params.update({"alpha": 2})  # pylint: disable=no-member
+
+    failed = grpc_servicer.Run(request, rpc_context).run_id
+    _, kwargs = proc_manager.call_args
+    assert kwargs["checkpoint_dir"] == str(tmp_path / failed)
+    checkpoint = write_checkpoint(kwargs["checkpoint_dir"], "x", "X")
+    saved = dict(name="x", version="", checkpoint=checkpoint)
+    run_store.record_start(failed, "my_pipeline")
+    run_store.record_datasets(failed, [saved])
+    run_store.record_end(failed, "Completed", 1, [])
+
+    response = grpc_servicer.Resume(ResumeParams(run_id=failed), rpc_context)
+
+    assert list(response.skipped_nodes) == ["first"]
+    assert response.success.endswith(f"resuming run {failed}")
+    _, kwargs = proc_manager.call_args
+    assert kwargs["restore"] == {"x": checkpoint}
+    assert kwargs["extra_params"] == {"alpha": 2}
+    assert kwargs["checkpoint_dir"] == str(tmp_path / response.run_id)
+    (_, resumed), _ = install.call_args
+    assert [node.name for node in resumed.nodes] == ["second"]
+    assert run_store.get_datasets(response.run_id) == {
+        "x": dict(version="", checkpoint=checkpoint)
+    }
+
+    retry = grpc_servicer.Resume(ResumeParams(run_id=failed), rpc_context)
+    assert retry.coalesced
+    assert retry.run_id == response.run_id
+
+
+def test_resume_invalid(grpc_servicer, proc_manager, rpc_context):
+    run_store = grpc_servicer.run_store
+    for run_id, exit_code in [("running1", None), ("done1", 0), ("unknown1", 1)]:
+        run_store.record_start(run_id, "my_pipeline")
+        if exit_code is not None:
+            run_store.record_end(run_id, "Completed", exit_code, [])
+    run_store.record_start("saved1", "my_pipeline")
+    run_store.record_request("saved1", {"pipeline_name": "my_pipeline"})
+    run_store.record_datasets("saved1", [dict(name="y", version="", checkpoint="")])
+    run_store.record_end("saved1", "Completed", 1, [])
+
+    grpc_servicer.Resume(ResumeParams(run_id="missing"), rpc_context)
+    rpc_context.set_code.assert_called_with(grpc.StatusCode.NOT_FOUND)
+    for run_id in ["running1", "done1", "unknown1", "saved1"]:
+        rpc_context.set_code.reset_mock()
+        grpc_servicer.Resume(ResumeParams(run_id=run_id), rpc_context)
+        rpc_context.set_code.assert_called_once_with(
+            grpc.StatusCode.FAILED_PRECONDITION
+        )
+    assert not proc_manager.called
+
+
+def test_run_in_thread(grpc_stub, grpc_servicer, proc_manager, mocker):
+    thread_manager = mocker.patch(
+        "kedro_grpc_server.grpc_server.ThreadManager",
+        side_effect=proc_manager.side_effect,
+    )
+    mocker.patch.object(grpc_servicer, "thread_pipelines", frozenset(["my_pipeline"]))
+    mocker.patch.object(grpc_servicer, "run_executor", mocker.Mock())
+
+    grpc_stub.Run(RunParams(pipeline_name="my_pipeline"))
+    _, kwargs = thread_manager.call_args
+    assert kwargs["executor"] is grpc_servicer.run_executor
+
+    grpc_stub.Run(RunParams(pipeline_name="my_pipeline", timeout=10))
+    grpc_stub.Run(RunParams(pipeline_name="my_pipeline", runner="ParallelRunner"))
+    grpc_stub.Run(RunParams(pipeline_name="my_pipeline", runner="ThreadRunner"))
+    grpc_stub.Run(RunParams(pipeline_name="my_pipeline", runner="SequentialRunner"))
+    grpc_stub.Run(RunParams())
+    assert thread_manager.call_count == 2
+    assert proc_manager.call_count == 4
+
+
+def test_get_status_thread_run(grpc_stub, grpc_servicer, mocker):
+    mocker.patch.object(
+        grpc_servicer, "thread_pipelines", frozenset(["printing_pipeline"])
+    )
+    mocker.patch.object(grpc_servicer, "run_executor", futures.ThreadPoolExecutor(1))
+
+    run_id = grpc_stub.Run(RunParams(pipeline_name="printing_pipeline")).run_id
+    statuses = list(grpc_stub.Status(RunId(run_id=run_id)))
+
+    assert isinstance(RUN_STATES[run_id], ThreadManager)
+    events = [event for status in statuses for event in status.events]
+    assert any("Logged from printing_node" in event for event in events)
+    # printed to the standard streams of the server, which are left alone
+    assert "Printed from printing_node" not in events
+    assert statuses[-1].run_status == "Completed"
+    assert statuses[-1].exit_code == "0"
@@ -0,0 +1,122 @@
+import grpc
+import pytest
+
+from kedro_grpc_server.in_process import InProcessChannel
+from kedro_grpc_server.kedro_pb2 import (  # type: ignore
+    PipelineParams,
+    PipelineSummary,
+    RunId,
+    RunStatus,
+)
+from kedro_grpc_server.kedro_pb2_grpc import KedroStub  # type: ignore
+
+
+class Servicer:
+    def __init__(self):
+        self.closed = []
+        self.metadata = None
+
+    def ListPipelines(self, request, context):
+        self.metadata = context.invocation_metadata()
+        return PipelineSummary(pipeline=["__default__", "de"])
+
+    def Status(self, request, context):
+        context.add_callback(lambda: self.closed.append(request.run_id))
+        if request.run_id == "missing":
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details("Run missing doesn't exist")
+            return
+        for sequence in range(3):
+            yield RunStatus(run_id=request.run_id, sequence=sequence)
+
+    def ListRuns(self, request, context):
+        raise RuntimeError("boom")
+
+    def WatchRuns(self, request, context):
+        context.abort(grpc.StatusCode.PERMISSION_DENIED, "Not allowed")
+
+
+@pytest.fixture
+def servicer():
+    return Servicer()
+
+
+@pytest.fixture
+def stub(servicer):
+    return KedroStub(InProcessChannel(servicer))
+
+
+def test_unary(stub, servicer):
+    response = stub.ListPipelines(PipelineParams(), metadata=[("key", "value")])
+
+    assert list(response.pipeline) == ["__default__", "de"]
+    assert servicer.metadata == (("key", "value"),)
+
+
+def test_with_call(stub):
+    response, call = stub.ListPipelines.with_call(PipelineParams())
+
+    assert len(response.pipeline) == 2
+    assert call.code() == grpc.StatusCode.OK
+
+
+def test_stream(stub, servicer):
+    statuses = list(stub.Status(RunId(run_id="run1")))
+
+    assert [status.sequence for status in statuses] == [0, 1, 2]
+    assert servicer.closed == ["run1"]
+
+
+def test_stream_status(stub, servicer):
+    with pytest.raises(grpc.RpcError) as exc:
+        list(stub.Status(RunId(run_id="missing")))
+
+    assert exc.value.code() == grpc.StatusCode.NOT_FOUND
+    assert exc.value.details() == "Run missing doesn't exist"
+    assert servicer.closed == ["missing"]
+
+
+def test_stream_cancel(stub, servicer):
+    statuses = stub.Status(RunId(run_id="run1"))
+    next(statuses)
+    statuses.cancel()
+
+    assert statuses.code() == grpc.StatusCode.CANCELLED
+    assert servicer.closed == ["run1"]
+
+
+def test_stream_deadline(stub):
+    statuses = stub.Status(RunId(run_id="run1"), timeout=0)
+
+    with pytest.raises(grpc.RpcError) as exc:
+        next(statuses)
+
+    assert exc.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+
+
+def test_application_error(stub):
+    from kedro_grpc_server.kedro_pb2 import ListRunsParams  # type: ignore
+
+    with pytest.raises(grpc.RpcError) as exc:
+        stub.ListRuns(ListRunsParams())
+
+    assert exc.value.code() == grpc.StatusCode.UNKNOWN
+    assert "boom" in exc.value.details()
+
+
+def test_abort(stub):
+    from kedro_grpc_server.kedro_pb2 import WatchParams  # type: ignore
+
+    with pytest.raises(grpc.RpcError) as exc:
+        next(stub.WatchRuns(WatchParams()))
+
+    assert exc.value.code() == grpc.StatusCode.PERMISSION_DENIED
+
+
+def test_unimplemented(stub):
+    from kedro_grpc_server.kedro_pb2 import RunParams  # type: ignore
+
+    with pytest.raises(grpc.RpcError) as exc:
+        stub.Run(RunParams())
+
+    assert exc.value.code() == grpc.StatusCode.UNIMPLEMENTED
@@ -0,0 +1,99 @@
+import pytest
+from kedro.pipeline import Pipeline, node
+
+from kedro_grpc_server.pipeline_index import (
+    PipelineIndex,
+    node_namespaces,
+    split_tags,
+)
+
+
+def identity(x):  # pragma: no cover
+    return x
+
+
+class FakeContext:  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.builds = 0
+
+    @property
+    def pipelines(self):
+        self.builds += 1
+        return {
+            "__default__": Pipeline(
+                [
+                    node(identity, "a", "b", name="data.clean.b", tags=["daily"]),
+                    node(identity, "b", "c", name="data.c", tags=["hourly"]),
+                    node(identity, "c", "d", name="model.d", tags=["daily"]),
+                ]
+            )
+        }
+
+
+@pytest.fixture
+def context():
+    return FakeContext()
+
+
+def _names(pipeline):
+    return sorted(node.name for node in pipeline.nodes)
+
+
+def test_split_tags():
+    assert split_tags(["b,a", "a", " c ", ""]) == ["a", "b", "c"]
+
+
+def test_node_namespaces():
+    assert node_namespaces(node(identity, "a", "b", name="x.y.b")) == ["x", "x.y"]
+    assert node_namespaces(node(identity, "a", "b")) == []
+
+
+def test_select(context):
+    index = PipelineIndex(context)
+
+    assert _names(index.select()) == ["data.c", "data.clean.b", "model.d"]
+    assert _names(index.select(tags=["daily"])) == ["data.clean.b", "model.d"]
+    assert _names(index.select(namespaces=["data"])) == ["data.c", "data.clean.b"]
+    assert _names(index.select(namespaces=["data.clean", "model"])) == [
+        "data.clean.b",
+        "model.d",
+    ]
+    assert _names(index.select(tags=["daily"], namespaces=["data"])) == ["data.clean.b"]
+    assert index.pipeline_names == ["__default__"]
+    assert context.builds == 1
+
+
+def test_select_memoized(context):
+    index = PipelineIndex(context, max_selections=1)
+
+    selected = index.select(tags=["daily", "hourly"])
+    assert index.select(tags=["hourly", "daily"]) is selected
+    index.select(tags=["daily"])
+    assert index.select(tags=["daily", "hourly"]) is not selected
+
+    index.build()
+    assert context.builds == 2
+
+
+@pytest.mark.parametrize(
+    "selection, error",
+    [
+        (dict(pipeline_name="missing"), "Unknown pipeline: missing"),
+        (dict(tags=["weekly", "daily"]), "Unknown tags: weekly"),
+        (dict(namespaces=["dat"]), "Unknown namespaces: dat"),
+        (dict(tags=["hourly"], namespaces=["model"]), "No node of pipeline"),
+    ],
+)
+def test_select_invalid(context, selection, error):
+    with pytest.raises(ValueError, match=error):
+        PipelineIndex(context).select(**selection)
+
+
+def test_install(context, mocker):
+    run_context = mocker.Mock()
+    pipeline = PipelineIndex(context).select(tags=["hourly"])
+
+    PipelineIndex.install(run_context, pipeline)
+
+    # pylint: disable=protected-access
+    assert run_context._get_pipeline(name="__default__") is pipeline
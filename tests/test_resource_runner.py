@@ -0,0 +1,138 @@
+import os
+import threading
+import time
+
+import pytest
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, node
+
+from kedro_grpc_server import resource_runner
+from kedro_grpc_server.resource_runner import (
+    ResourceHints,
+    ResourceRunner,
+    critical_path_lengths,
+    parse_resource_hints,
+)
+
+
+def sleeping_node(*_):  # pragma: no cover
+    start = time.time()
+    time.sleep(0.2)
+    return os.getpid(), start, time.time()
+
+
+def chained_node(previous):  # pragma: no cover
+    return previous, sleeping_node()
+
+
+def thread_node(*_):
+    return threading.current_thread().name
+
+
+def bad_node(*_):  # pragma: no cover
+    raise ValueError("Oh no!!!")
+
+
+@pytest.fixture
+def catalog():
+    return DataCatalog()
+
+
+def test_parse_resource_hints():
+    assert parse_resource_hints(["cpu:4", "mem:8G", "other"]) == ResourceHints(
+        cpu=4.0, memory=8 * 2 ** 30, io=False
+    )
+    assert parse_resource_hints(["mem:512MB"]).memory == 512 * 2 ** 20
+    assert parse_resource_hints(["mem:1024"]).memory == 1024
+    assert parse_resource_hints([]) == ResourceHints(cpu=1.0, memory=0, io=False)
+    assert parse_resource_hints(["io"]) == ResourceHints(cpu=0.0, memory=0, io=True)
+    assert parse_resource_hints(["io", "cpu:0.5"]).cpu == 0.5
+
+
+@pytest.mark.parametrize("tag", ["cpu:many", "mem:8X", "mem:"])
+def test_parse_invalid_resource_hints(tag):
+    with pytest.raises(ValueError):
+        parse_resource_hints([tag])
+
+
+def test_critical_path_lengths():
+    pipeline = Pipeline(
+        [
+            node(sleeping_node, None, "a", name="a"),
+            node(sleeping_node, "a", "b", name="b"),
+            node(sleeping_node, "b", "c", name="c"),
+            node(sleeping_node, "a", "d", name="d"),
+            node(sleeping_node, None, "e", name="e"),
+        ]
+    )
+
+    lengths = {
+        node.name: length for node, length in critical_path_lengths(pipeline).items()
+    }
+
+    assert lengths == {"a": 3, "b": 2, "c": 1, "d": 1, "e": 1}
+
+
+def test_run(catalog):
+    pipeline = Pipeline(
+        [
+            node(sleeping_node, None, "a", name="a"),
+            node(chained_node, "a", "b", name="b"),
+            node(sleeping_node, None, "c", name="c", tags=["cpu:2", "mem:1G"]),
+            node(thread_node, None, "d", name="d", tags=["io"]),
+        ]
+    )
+
+    outputs = ResourceRunner(cpu_budget=2, memory_budget=2 * 2 ** 30).run(
+        pipeline, catalog
+    )
+
+    # a, on the longest path, starts first and c needs both cores, so c runs
+    # once a finished, and b, which fits in no core left, once c finished
+    (_, _, a_end), (b_pid, b_start, _) = outputs["b"]
+    c_pid, c_start, c_end = outputs["c"]
+    assert a_end <= c_start
+    assert c_end <= b_start
+    assert b_pid != os.getpid()
+    assert c_pid != os.getpid()
+    assert outputs["d"].startswith("ThreadPoolExecutor")
+
+
+def test_run_within_memory_budget(catalog):
+    pipeline = Pipeline(
+        [
+            node(sleeping_node, None, f"out{i}", name=f"node{i}", tags=["mem:1G"])
+            for i in range(4)
+        ]
+    )
+
+    outputs = ResourceRunner(cpu_budget=4, memory_budget=2 * 2 ** 30).run(
+        pipeline, catalog
+    )
+
+    # only two nodes fit in memory at once
+    intervals = [(start, end) for _, start, end in outputs.values()]
+    assert len(intervals) == 4
+    for start, _ in intervals:
+        assert sum(other[0] <= start < other[1] for other in intervals) <= 2
+
+
+def test_run_node_failure(catalog):
+    pipeline = Pipeline(
+        [node(sleeping_node, None, "a", name="a"), node(bad_node, "a", "b", name="b"),]
+    )
+
+    with pytest.raises(ValueError, match="Oh no!!!"):
+        ResourceRunner(cpu_budget=2).run(pipeline, catalog)
+
+
+def test_run_cpu_budget(catalog, mocker):
+    mocker.patch(
+        "kedro_grpc_server.resource_runner.available_cpus", return_value=[0, 1]
+    )
+    pool = mocker.patch.object(resource_runner, "ProcessPoolExecutor")
+
+    ResourceRunner().run(Pipeline([node(thread_node, None, "a", tags=["io"])]), catalog)
+
+    # the cores the run process is bound to, rather than all the cores
+    pool.assert_called_once_with(max_workers=2)
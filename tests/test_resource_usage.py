@@ -0,0 +1,89 @@
+import resource
+import tracemalloc
+from multiprocessing import Process
+
+from kedro_grpc_server.resource_usage import (
+    ResourceUsageHooks,
+    run_usage,
+    set_memory_limit,
+)
+
+
+class FakeNode:  # pylint: disable=too-few-public-methods
+    name = "split"
+
+
+def _busy(seconds=0.05):
+    start = resource.getrusage(resource.RUSAGE_SELF)
+    while resource.getrusage(resource.RUSAGE_SELF).ru_utime - start.ru_utime < seconds:
+        pass
+
+
+def test_run_usage():
+    start_time = resource.getrusage(resource.RUSAGE_SELF)
+    _busy()
+    usage = run_usage(0)
+
+    assert usage["node"] == ""
+    assert usage["cpu_time"] >= start_time.ru_utime + 0.05
+    assert usage["wall_time"] > 0
+    assert usage["max_rss"] > 2 ** 20
+    assert usage["tracemalloc_peak"] == 0
+
+
+def test_node_usage():
+    exported = []
+    hooks = ResourceUsageHooks(exported.append)
+
+    hooks.before_node_run(FakeNode())
+    _busy()
+    hooks.after_node_run(FakeNode())
+    hooks.after_node_run(FakeNode())  # already ended
+
+    assert len(exported) == 1
+    assert exported[0]["node"] == "split"
+    assert 0.05 <= exported[0]["cpu_time"] < 1
+    assert exported[0]["wall_time"] >= exported[0]["cpu_time"] * 0.5
+    assert exported[0]["max_rss"] > 2 ** 20
+
+
+def test_node_usage_on_error():
+    exported = []
+    hooks = ResourceUsageHooks(exported.append)
+
+    hooks.before_node_run(FakeNode())
+    hooks.on_node_error(FakeNode())
+
+    assert [usage["node"] for usage in exported] == ["split"]
+
+
+def test_node_tracemalloc_peak():
+    exported = []
+    hooks = ResourceUsageHooks(exported.append)
+    tracemalloc.start()
+    try:
+        hooks.before_node_run(FakeNode())
+        data = bytearray(8 * 2 ** 20)
+        del data
+        hooks.after_node_run(FakeNode())
+    finally:
+        tracemalloc.stop()
+
+    assert exported[0]["tracemalloc_peak"] >= 8 * 2 ** 20
+
+
+def _allocate_over_limit():
+    set_memory_limit(4 * 2 ** 30)
+    try:
+        bytearray(8 * 2 ** 30)
+    except MemoryError:
+        return
+    raise SystemExit(1)  # pragma: no cover
+
+
+def test_set_memory_limit():
+    process = Process(target=_allocate_over_limit)
+    process.start()
+    process.join()
+
+    assert process.exitcode == 0
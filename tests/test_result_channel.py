@@ -0,0 +1,79 @@
+import io
+import os
+import pickle
+import time
+
+import numpy as np
+import pytest
+
+from kedro_grpc_server.result_channel import ResultChannel
+
+
+@pytest.fixture
+def channel(tmp_path):
+    return ResultChannel(root=str(tmp_path / "outputs"))
+
+
+def test_write_array(channel):
+    data = np.arange(1000, dtype="float32")
+    descriptor = channel.write("run1", "weights", data)
+
+    assert descriptor["output"] == "weights"
+    assert descriptor["format"] == "npy"
+    segment = ResultChannel.open(descriptor)
+    assert len(segment) == descriptor["size"]
+    np.testing.assert_array_equal(np.load(io.BytesIO(segment)), data)
+
+
+def test_write_object(channel):
+    data = {"score": 0.9, "labels": ["a", "b"]}
+    descriptor = channel.write("run1", "metrics", data)
+
+    assert descriptor["format"] == "pickle"
+    assert pickle.loads(ResultChannel.open(descriptor)) == data
+
+
+def test_object_array_is_pickled(channel):
+    descriptor = channel.write("run1", "mixed", np.array([1, "a"], dtype=object))
+    assert descriptor["format"] == "pickle"
+
+
+def test_concurrent_writers(channel, mocker):
+    first = channel.write("run1", "metrics", 1)
+    # another writer of the run, which listed the segments before the first
+    mocker.patch("kedro_grpc_server.result_channel.os.listdir", return_value=[])
+    second = channel.write("run1", "scores", 2)
+
+    assert second["path"] != first["path"]
+    assert pickle.loads(ResultChannel.open(first)) == 1
+    assert pickle.loads(ResultChannel.open(second)) == 2
+
+
+def test_release(channel):
+    descriptor = channel.write("run1", "metrics", 1)
+    channel.write("run2", "metrics", 2)
+
+    channel.release("run1")
+
+    assert not os.path.exists(descriptor["path"])
+    assert os.listdir(channel.root) == ["run2"]
+
+
+def test_expire(channel):
+    old = channel.write("old_run", "metrics", 1)
+    channel.write("new_run", "metrics", 2)
+    expired = time.time() - 7200
+    os.utime(os.path.dirname(old["path"]), (expired, expired))
+
+    channel.expire()
+
+    assert os.listdir(channel.root) == ["new_run"]
+
+
+def test_default_root_is_removed_on_close():
+    channel = ResultChannel()
+    channel.write("run1", "metrics", 1)
+
+    channel.close()
+
+    assert not os.path.exists(channel.root)
@@ -0,0 +1,290 @@
+import sqlite3
+
+import pytest
+
+from kedro_grpc_server.run_store import RunStore, server_owner
+
+
+@pytest.fixture
+def run_store(tmp_path):
+    store = RunStore(str(tmp_path / "logs" / "runs.db"))
+    yield store
+    store.close()
+
+
+def test_wal_mode(run_store):
+    journal_mode = run_store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert journal_mode == "wal"
+
+
+def test_record_run(run_store):
+    run_store.record_start("abc123", "my_pipeline")
+    run = run_store.get("abc123")
+
+    assert run["pipeline"] == "my_pipeline"
+    assert run["state"] == "Pending"
+    assert run["end_time"] is None
+
+    run_store.record_end("abc123", "Completed", 0, ["Starting run", "Completed run"])
+    run = run_store.get("abc123")
+
+    assert run["state"] == "Completed"
+    assert run["exit_code"] == 0
+    assert run["end_time"] >= run["start_time"]
+    assert run_store.get_events("abc123") == ["Starting run", "Completed run"]
+
+
+def test_unknown_run(run_store):
+    assert run_store.get("invalid") is None
+    assert run_store.get_events("invalid") == []
+
+
+def test_persisted(tmp_path, mocker):
+    path = str(tmp_path / "runs.db")
+    store = RunStore(path)
+    mocker.patch("kedro_grpc_server.run_store.os.getpid", return_value=2 ** 22 + 1)
+    store.record_start("abc123", "my_pipeline")  # by a server which is gone
+    store.close()
+    mocker.stopall()
+
+    store = RunStore(path)
+    assert store.interrupt_unfinished() == 1
+    assert store.get("abc123")["state"] == "Interrupted"
+    assert store.interrupt_unfinished() == 0
+    store.close()
+
+
+def test_live_server_runs_not_interrupted(tmp_path):
+    path = str(tmp_path / "runs.db")
+    store = RunStore(path)
+    store.record_start("abc123", "my_pipeline")
+    store.claim_run("abc123", {"key:refresh": None})
+
+    # another server starting with the same run store
+    other = RunStore(path)
+    assert other.interrupt_unfinished() == 0
+    assert other.get("abc123")["state"] == "Pending"
+    assert other.claim_run("def456", {"key:refresh": None}) == "abc123"
+    other.close()
+    store.close()
+
+
+def test_owner_columns_added(tmp_path):
+    path = str(tmp_path / "runs.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE runs (run_id TEXT PRIMARY KEY, pipeline TEXT NOT NULL, "
+        "state TEXT NOT NULL, start_time REAL NOT NULL, end_time REAL, "
+        "exit_code INTEGER)"
+    )
+    conn.execute("INSERT INTO runs VALUES ('old123', 'de', 'Pending', 1.0, NULL, NULL)")
+    conn.commit()
+    conn.close()
+
+    store = RunStore(path)
+    store.record_start("abc123", "my_pipeline")
+
+    # runs recorded without owner are interrupted, not the live ones
+    assert store.interrupt_unfinished() == 1
+    assert store.get("old123")["state"] == "Interrupted"
+    owner = store._conn.execute("SELECT owner FROM runs WHERE run_id = 'abc123'")
+    assert owner.fetchone()[0] == server_owner()
+    store.close()
+
+
+def test_list_runs_pagination(run_store, mocker):
+    clock = mocker.patch("kedro_grpc_server.run_store.time.time")
+    for i in range(5):
+        clock.return_value = 100.0 + i // 2  # ties on start_time
+        run_store.record_start(f"run{i}", "even" if i % 2 == 0 else "odd")
+
+    seen = []
+    cursor = None
+    while True:
+        runs, cursor = run_store.list_runs(limit=2, cursor=cursor)
+        seen.extend(run["run_id"] for run in runs)
+        if not cursor:
+            break
+
+    assert seen == ["run4", "run3", "run2", "run1", "run0"]
+
+
+def test_list_runs_filters(run_store):
+    run_store.record_start("run0", "my_pipeline")
+    run_store.record_start("run1", "other_pipeline")
+    run_store.record_start("run2", "my_pipeline")
+    run_store.record_end("run2", "Completed", 1, [])
+
+    runs, cursor = run_store.list_runs(pipeline="my_pipeline")
+    assert [run["run_id"] for run in runs] == ["run2", "run0"]
+    assert cursor == ""
+
+    runs, _ = run_store.list_runs(pipeline="my_pipeline", state="Pending")
+    assert [run["run_id"] for run in runs] == ["run0"]
+
+
+def test_list_runs_invalid_cursor(run_store):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        run_store.list_runs(cursor="not-a-cursor")
+
+
+def test_list_runs_uses_index(run_store):
+    plan = run_store._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT run_id FROM runs WHERE pipeline = ? "
+        "AND (start_time, run_id) < (?, ?) ORDER BY start_time DESC, run_id DESC",
+        ("my_pipeline", 1.0, "abc"),
+    ).fetchall()
+    assert "runs_pipeline" in str(plan)
+    assert "TEMP B-TREE" not in str(plan)
+
+
+def test_events_keep_tags(run_store):
+    from kedro_grpc_server.event_filter import LogEvent
+
+    event = LogEvent("Oh no!!!", stream="stderr", level=40, node="bad_node")
+    run_store.record_start("abc123", "my_pipeline")
+    run_store.record_end("abc123", "Completed", 1, ["Starting run", event])
+
+    events = run_store.get_events("abc123")
+
+    assert events == ["Starting run", "Oh no!!!"]
+    assert events[1].to_dict() == event.to_dict()
+
+
+def test_live_events(tmp_path):
+    writer = RunStore(str(tmp_path / "runs.db"), share_live_events=True)
+    reader = RunStore(str(tmp_path / "runs.db"))
+    writer.record_start("abc123", "my_pipeline")
+
+    writer.append_events("abc123", 0, ["Starting run", "Running node"])
+    writer.append_events("abc123", 2, ["Printed"])
+    assert reader.get_events("abc123") == ["Starting run", "Running node", "Printed"]
+
+    writer.record_end("abc123", "Completed", 0, ["Starting run", "Completed run"])
+    assert reader.get_events("abc123") == ["Starting run", "Completed run"]
+    assert not writer._conn.execute("SELECT * FROM run_live_events").fetchall()
+    writer.close()
+    reader.close()
+
+
+def test_live_events_not_shared(run_store):
+    run_store.record_start("abc123", "my_pipeline")
+    run_store.append_events("abc123", 0, ["Starting run"])
+
+    assert run_store.get_events("abc123") == []
+
+
+def test_claim_run(run_store):
+    assert run_store.claim_run("abc123", {"key:refresh": None}) == "abc123"
+    run_store.record_start("abc123", "my_pipeline")
+    assert run_store.claim_run("def456", {"key:refresh": None}) == "abc123"
+
+    run_store.record_end("abc123", "Completed", 0, [])
+    assert run_store.claim_run("def456", {"key:refresh": None}) == "def456"
+    assert run_store.claim_run("ghi789", {"key:other": None}) == "ghi789"
+
+
+def test_claim_run_window(run_store, mocker):
+    clock = mocker.patch("kedro_grpc_server.run_store.time.time")
+    clock.return_value = 100.0
+    assert run_store.claim_run("abc123", {"run:digest": 10}) == "abc123"
+
+    clock.return_value = 105.0
+    assert run_store.claim_run("def456", {"run:digest": 10}) == "abc123"
+    clock.return_value = 111.0
+    assert run_store.claim_run("def456", {"run:digest": 10}) == "def456"
+
+
+def test_claim_run_any_key(run_store):
+    run_store.claim_run("abc123", {"key:refresh": None, "run:digest": 10})
+
+    assert run_store.claim_run("def456", {"key:other": None, "run:digest": 10}) == (
+        "abc123"
+    )
+    # nothing was claimed by the coalesced request
+    assert run_store.claim_run("ghi789", {"key:other": None}) == "ghi789"
+
+
+def test_claimed_keys_released(tmp_path, mocker):
+    run_store = RunStore(str(tmp_path / "runs.db"))
+    run_store.claim_run("abc123", {"key:refresh": None})
+    run_store.release_keys("abc123")
+    assert run_store.claim_run("def456", {"key:refresh": None}) == "def456"
+
+    # the server which claimed the key is gone
+    mocker.patch("kedro_grpc_server.run_store._owner_alive", return_value=False)
+    run_store.interrupt_unfinished()
+    mocker.stopall()
+    other = RunStore(str(tmp_path / "runs.db"))
+    assert other.claim_run("ghi789", {"key:refresh": None}) == "ghi789"
+    assert run_store.claim_run("jkl012", {"key:refresh": None}) == "ghi789"
+    other.close()
+    run_store.close()
+
+
+def test_usage(run_store):
+    assert run_store.get_usage("abc123") == {"run": None, "nodes": []}
+    usage = {
+        "run": {"node": "", "wall_time": 1.5, "cpu_time": 1.0, "max_rss": 2 ** 20},
+        "nodes": [{"node": "split", "wall_time": 1.0, "cpu_time": 0.9}],
+    }
+    run_store.record_start("abc123", "my_pipeline")
+    run_store.record_end("abc123", "Completed", 0, [], usage=usage)
+
+    assert run_store.get_usage("abc123") == usage
+
+
+def test_request(run_store):
+    run_store.record_request("abc123", {"pipeline_name": "de", "tags": ["daily"]})
+
+    assert run_store.get_request("abc123") == {"pipeline_name": "de", "tags": ["daily"]}
+    assert run_store.get_request("unknown") is None
+
+
+def test_datasets(run_store):
+    run_store.record_datasets(
+        "abc123",
+        [
+            dict(name="model", version="2020-06-01T00.00.00.000Z", checkpoint=""),
+            dict(name="features", version="", checkpoint="/tmp/features.pkl", size=3),
+        ],
+    )
+    run_store.record_datasets(
+        "abc123", [dict(name="features", version="", checkpoint="/tmp/f2.pkl")]
+    )
+
+    assert run_store.get_datasets("abc123") == {
+        "model": dict(version="2020-06-01T00.00.00.000Z", checkpoint=""),
+        "features": dict(version="", checkpoint="/tmp/f2.pkl"),
+    }
+    assert run_store.get_datasets("unknown") == {}
+
+
+def test_dataset_io(run_store, mocker):
+    clock = mocker.patch("kedro_grpc_server.run_store.time.time")
+    runs = [("run1", "de", 100.0), ("run2", "de", 200.0), ("run3", "ds", 300.0)]
+    for run_id, pipeline, start_time in runs:
+        clock.return_value = start_time
+        run_store.record_start(run_id, pipeline)
+        dataset_io = [
+            dict(name="raw", operation="load", duration=2.0, size=100, rows=10),
+            dict(name="model", operation="save", duration=0.5, size=50, rows=0),
+        ]
+        run_store.record_end(run_id, "Completed", 0, [], dataset_io=dataset_io)
+
+    assert run_store.get_dataset_io("run1") == dataset_io
+    assert run_store.get_dataset_io("unknown") == []
+    raw, model = run_store.dataset_io_stats()
+    assert raw == dict(
+        name="raw",
+        operation="load",
+        runs=3,
+        count=3,
+        total_duration=6.0,
+        max_duration=2.0,
+        total_size=300,
+        total_rows=30,
+    )
+    assert (model["name"], model["operation"]) == ("model", "save")
+    (stats,) = run_store.dataset_io_stats(names=["raw"], pipeline="de", since=150.0)
+    assert (stats["runs"], stats["total_size"]) == (1, 100)
@@ -0,0 +1,42 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from kedro_grpc_server.startup import StartupTimer, prime_workers
+
+
+def test_startup_timer(caplog):
+    timer = StartupTimer()
+    with timer.phase("context"):
+        time.sleep(0.01)
+    with timer.phase("bind"):
+        pass
+
+    with caplog.at_level(logging.INFO):
+        timer.report()
+
+    assert list(timer.phases) == ["context", "bind"]
+    assert timer.phases["context"] >= 0.01
+    assert "Kedro gRPC Server ready in" in caplog.text
+    assert "context 0.01s" in caplog.text
+
+
+def test_prime_workers():
+    executor = ThreadPoolExecutor(max_workers=4)
+
+    prime_workers(executor, 4)
+    assert len(executor._threads) == 4
+    executor.shutdown()
+
+
+def test_prime_workers_busy_pool():
+    executor = ThreadPoolExecutor(max_workers=2)
+    rpc_done = threading.Event()
+    executor.submit(rpc_done.wait)
+
+    # doesn't wait for the thread held by the RPC
+    prime_workers(executor, 2)
+    assert len(executor._threads) == 2
+    rpc_done.set()
+    executor.shutdown()
@@ -0,0 +1,156 @@
+import logging
+import threading
+from concurrent import futures
+
+import pytest
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import node
+
+from kedro_grpc_server.result_channel import ResultChannel
+from kedro_grpc_server.run_store import RunStore
+from kedro_grpc_server.thread_manager import RUN_HOOKS, RunLogHandler, ThreadManager
+
+
+def identity(x):
+    return x
+
+
+class ThreadContext:
+    params = {}  # type: dict
+
+    def __init__(self, name="run", barrier=None, fail=False):
+        self.name = name
+        self.barrier = barrier
+        self.fail = fail
+
+    def _get_catalog(self, save_version=None, journal=None, load_versions=None):
+        return DataCatalog({"x": MemoryDataSet()})
+
+    def run(self, **kwargs):
+        catalog = self._get_catalog(save_version="2020-06-01T00.00.00.000Z")
+        # called by the hook manager of Kedro
+        run_node = node(identity, "x", "y", name=self.name)
+        RUN_HOOKS.before_node_run(node=run_node)
+        logging.getLogger("kedro.pipeline.node").info("Running node: %s", self.name)
+        if self.barrier is not None:
+            self.barrier.wait(5)  # both runs are running
+        logging.getLogger("kedro.io").info("Logged by %s", self.name)
+        print(f"Printed by {self.name}")
+        if self.fail:
+            raise ValueError("Oh no!!!")
+        catalog.save("x", 1)
+        RUN_HOOKS.after_node_run(node=run_node)
+        return {"y": [2]}
+
+
+@pytest.fixture
+def executor():
+    executor = futures.ThreadPoolExecutor(2)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def info_logs(caplog):
+    caplog.set_level(logging.INFO)
+
+
+def test_status_before_start(executor, tmp_path):
+    manager = ThreadManager(
+        ThreadContext("n1"),
+        executor,
+        run_args={},
+        run_store=RunStore(str(tmp_path / "runs.db")),
+        result_channel=ResultChannel(root=str(tmp_path)),
+    )
+    assert manager.proc is None
+    assert manager.status() == dict(run_status="Pending", events=[])
+
+
+def test_thread_run(executor, tmp_path):
+    run_store = RunStore(str(tmp_path / "runs.db"))
+    manager = ThreadManager(
+        ThreadContext("n1"),
+        executor,
+        run_args={},
+        run_store=run_store,
+        result_channel=ResultChannel(root=str(tmp_path)),
+    )
+    manager.start()
+    manager.proc.join(5)
+
+    events = manager.status()["events"]
+    assert manager.status()["run_status"] == "Completed"
+    assert manager.proc.exitcode == 0
+    assert events[0] == "Starting run"
+    assert events[-1] == "Completed run"
+    node_log = events[1]
+    assert "kedro.pipeline.node - INFO - Running node: n1" in node_log
+    assert node_log.structured
+    logged = events[2]
+    assert logged.endswith("Logged by n1")
+    assert (logged.stream, logged.node) == ("stderr", "n1")
+    assert not any("Printed by" in event for event in events)
+    assert [usage["node"] for usage in manager.node_usage] == ["n1"]
+    assert manager.run_usage["wall_time"] >= manager.node_usage[0]["wall_time"]
+    assert [dataset["name"] for dataset in manager.saved_datasets] == ["x"]
+    assert [(io["name"], io["operation"]) for io in manager.dataset_io] == [
+        ("x", "save")
+    ]
+    assert list(manager.outputs) == ["y"]
+    assert run_store.get(manager.run_id)["exit_code"] == 0
+    assert run_store.get_events(manager.run_id) == events
+
+
+def test_concurrent_thread_runs(executor):
+    barrier = threading.Barrier(2)
+    managers = [
+        ThreadManager(ThreadContext(name, barrier), executor, run_args={})
+        for name in ("first", "second")
+    ]
+    for manager in managers:
+        manager.start()
+    for manager in managers:
+        manager.proc.join(5)
+
+    first, second = [manager.status()["events"] for manager in managers]
+    assert any(event.endswith("Logged by first") for event in first)
+    assert not any("second" in event for event in first)
+    assert any(event.endswith("Logged by second") for event in second)
+    assert not any("first" in event for event in second)
+    for manager, name in zip(managers, ("first", "second")):
+        assert [usage["node"] for usage in manager.node_usage] == [name]
+
+
+def test_failed_thread_run(executor):
+    manager = ThreadManager(ThreadContext(fail=True), executor, run_args={})
+    manager.start()
+    manager.proc.join(5)
+
+    error = manager.status()["events"][-1]
+    assert manager.proc.exitcode == 1
+    assert "ValueError: Oh no!!!" in error
+    assert (error.stream, error.level) == ("stderr", logging.ERROR)
+
+
+def test_records_outside_runs_ignored(mocker):
+    handler = RunLogHandler()
+    handler.format = mocker.Mock()
+
+    handler.handle(logging.makeLogRecord({"msg": "Not in a run"}))
+
+    assert not handler.format.called
+
+
+def test_hooks_outside_runs_ignored(executor, mocker):
+    before_node_run = mocker.patch(
+        "kedro_grpc_server.thread_manager.ResourceUsageHooks.before_node_run",
+        autospec=True,
+    )
+    manager = ThreadManager(ThreadContext("n1"), executor, run_args={})
+    manager.start()
+    manager.proc.join(5)
+
+    RUN_HOOKS.before_node_run(node=node(identity, "x", "y", name="other"))
+
+    assert before_node_run.call_count == 1
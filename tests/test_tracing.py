@@ -0,0 +1,188 @@
+import json
+import subprocess
+import sys
+from concurrent import futures
+
+import grpc
+import pytest
+
+from kedro_grpc_server.spans import (
+    BatchSpanExporter,
+    RunTracingHooks,
+    Tracer,
+    current_span,
+    parse_traceparent,
+)
+from kedro_grpc_server.tracing import TracingInterceptor
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+TRACEPARENT = f"00-{TRACE_ID}-00f067aa0ba902b7-01"
+
+
+@pytest.fixture
+def spans():
+    return []
+
+
+@pytest.fixture
+def tracer(spans):
+    return Tracer(spans.append)
+
+
+def test_parse_traceparent():
+    assert parse_traceparent(TRACEPARENT) == (TRACE_ID, "00f067aa0ba902b7", True)
+    assert parse_traceparent(TRACEPARENT[:-1] + "0")[2] is False
+    assert parse_traceparent("00-invalid-00f067aa0ba902b7-01") is None
+    assert parse_traceparent(f"00-{'0' * 32}-00f067aa0ba902b7-01") is None
+    assert parse_traceparent("") is None
+
+
+def test_span(tracer, spans):
+    with tracer.span("parent", attributes={"count": 1, "name": "a"}) as parent:
+        assert current_span() is parent
+        with tracer.span("child", parent) as child:
+            assert current_span() is child
+        assert current_span() is parent
+    assert current_span() is None
+
+    child_span, parent_span = spans
+    assert child_span["traceId"] == parent_span["traceId"] == parent.trace_id
+    assert child_span["parentSpanId"] == parent_span["spanId"]
+    assert parent_span["parentSpanId"] == ""
+    assert parent_span["attributes"] == [
+        {"key": "count", "value": {"intValue": "1"}},
+        {"key": "name", "value": {"stringValue": "a"}},
+    ]
+    assert int(child_span["endTimeUnixNano"]) >= int(child_span["startTimeUnixNano"])
+    assert parent_span["status"] == {"code": 1}
+
+
+def test_span_error(tracer, spans):
+    with pytest.raises(ValueError):
+        with tracer.span("failing"):
+            raise ValueError("Oh no!!!")
+
+    assert spans[0]["status"] == {"code": 2, "message": "Oh no!!!"}
+
+
+def test_remote_parent(tracer, spans):
+    with tracer.span("rpc", TRACEPARENT) as span:
+        assert span.traceparent.startswith(f"00-{TRACE_ID}-")
+        assert span.traceparent.endswith("-01")
+
+    with tracer.span("rpc", TRACEPARENT[:-1] + "0") as span:
+        assert span.traceparent.endswith("-00")
+
+    assert [span["parentSpanId"] for span in spans] == ["00f067aa0ba902b7"]
+
+
+def test_sampling(spans):
+    for _ in range(100):
+        with Tracer(spans.append, sample_ratio=0).span("never"):
+            pass
+    assert not spans
+
+    tracer = Tracer(spans.append, sample_ratio=0.5)
+    for _ in range(1000):
+        with tracer.span("sometimes"):
+            pass
+    assert 350 < len(spans) < 650
+
+
+def test_disabled_tracer():
+    tracer = Tracer()
+    with tracer.span("noop") as span:
+        pass
+
+    assert not tracer.enabled
+    assert not span.sampled
+
+
+def test_batch_exporter(tmp_path):
+    output = tmp_path / "spans.json"
+    exporter = BatchSpanExporter(str(output), max_batch_size=2, interval=60)
+    tracer = Tracer(exporter)
+    for name in ("a", "b", "c"):
+        with tracer.span(name):
+            pass
+
+    exporter.close()
+
+    batches = [json.loads(line) for line in output.read_text().splitlines()]
+    assert len(batches) == 2
+    resource_spans = batches[0]["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"][0]["key"] == "service.name"
+    names = [
+        span["name"]
+        for batch in batches
+        for span in batch["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    ]
+    assert names == ["a", "b", "c"]
+
+
+def test_run_tracing_hooks(tracer, spans, mocker):
+    node = mocker.Mock()
+    node.name = "split"
+    run_span = tracer.start_span("kedro.run")
+    hooks = RunTracingHooks(tracer, run_span)
+
+    hooks.before_pipeline_run()
+    hooks.before_node_run(node)
+    hooks.after_node_run(node)
+    hooks.before_node_run(node)
+    hooks.on_node_error(ValueError("Oh no!!!"), node)
+    hooks.end()
+
+    assert [span["name"] for span in spans] == [
+        "kedro.load_context",
+        "kedro.node",
+        "kedro.node",
+    ]
+    assert {span["parentSpanId"] for span in spans} == {run_span.span_id}
+    assert spans[2]["status"]["code"] == 2
+
+
+def test_run_tracing_without_grpc():
+    # run processes and the kedro CLI import the process manager
+    code = (
+        "import sys, kedro_grpc_server.process_manager; "
+        "assert 'grpc' not in sys.modules, 'grpc imported'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_interceptor(tracer, spans):
+    def _unary(request, context):
+        return current_span().traceparent.encode()
+
+    def _stream(request, context):
+        yield b"1"
+        yield b"2"
+
+    handler = grpc.method_handlers_generic_handler(
+        "test.Test",
+        {
+            "Unary": grpc.unary_unary_rpc_method_handler(_unary),
+            "Stream": grpc.unary_stream_rpc_method_handler(_stream),
+        },
+    )
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=2),
+        interceptors=[TracingInterceptor(tracer)],
+    )
+    server.add_generic_rpc_handlers((handler,))
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    channel = grpc.insecure_channel(f"localhost:{port}")
+
+    response = channel.unary_unary("/test.Test/Unary")(
+        b"", metadata=[("traceparent", TRACEPARENT)]
+    )
+    assert list(channel.unary_stream("/test.Test/Stream")(b"")) == [b"1", b"2"]
+    server.stop(None)
+
+    assert [span["name"] for span in spans] == ["/test.Test/Unary", "/test.Test/Stream"]
+    assert response.decode() == f"00-{TRACE_ID}-{spans[0]['spanId']}-01"
+    assert spans[0]["parentSpanId"] == "00f067aa0ba902b7"
+    assert spans[0]["kind"] == 2
+    assert spans[1]["traceId"] != TRACE_ID
@@ -0,0 +1,89 @@
+"""Latency of unary calls to the Kedro gRPC Server over TCP, a Unix domain
+socket and in-process calls. Run it from a Kedro project:
+
+    python tools/benchmark_transports.py --calls 5000 --dataset example_iris_data
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import grpc
+from grpc_health.v1 import health_pb2, health_pb2_grpc
+
+from kedro_grpc_server.grpc_server import grpc_serve, serve_in_process
+from kedro_grpc_server.kedro_pb2 import PipelineParams, PreviewParams
+from kedro_grpc_server.kedro_pb2_grpc import KedroStub
+
+
+def wait_serving(channel, timeout=30.0):
+    stub = health_pb2_grpc.HealthStub(channel)
+    request = health_pb2.HealthCheckRequest(service="kedro.Kedro")
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = stub.Check(request, wait_for_ready=True, timeout=timeout).status
+        if status == health_pb2.HealthCheckResponse.SERVING:
+            return
+        time.sleep(0.1)
+    raise TimeoutError("The server didn't start serving")
+
+
+def latencies(call, calls, warmup):
+    for _ in range(warmup):
+        call()
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(transport, name, timings):
+    timings = sorted(timings)
+    p50 = timings[len(timings) // 2]
+    p99 = timings[int(len(timings) * 0.99)]
+    print(
+        f"{transport:<11}{name:<16}"
+        f"{p50 * 1e6:>10.0f}{p99 * 1e6:>10.0f}{statistics.mean(timings) * 1e6:>10.0f}"
+    )
+
+
+def main(context=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--port", type=int, default=50071)
+    parser.add_argument("--dataset", help="Catalog entry previewed by PreviewDataset")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    socket_path = os.path.join(tempfile.mkdtemp(), "kedro.sock")
+    server = grpc_serve(
+        context, port=args.port, uds=socket_path, wait_term=False, processes=1
+    )
+    channels = {
+        "tcp": grpc.insecure_channel(f"localhost:{args.port}"),
+        "uds": grpc.insecure_channel(f"unix:{socket_path}"),
+    }
+    for channel in channels.values():
+        wait_serving(channel)
+    channels["in-process"] = serve_in_process(context, config_poll_interval=0)
+
+    calls = {"ListPipelines": lambda stub: stub.ListPipelines(PipelineParams())}
+    if args.dataset:
+        preview = PreviewParams(name=args.dataset, limit=args.limit)
+        calls["PreviewDataset"] = lambda stub: stub.PreviewDataset(preview)
+
+    print(f"{'transport':<11}{'call':<16}{'p50 us':>10}{'p99 us':>10}{'mean us':>10}")
+    for name, call in calls.items():
+        for transport, channel in channels.items():
+            stub = KedroStub(channel)
+            timings = latencies(lambda: call(stub), args.calls, args.warmup)
+            report(transport, name, timings)
+    server.stop(None)
+
+
+if __name__ == "__main__":
+    main()